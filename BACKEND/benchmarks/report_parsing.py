@@ -0,0 +1,167 @@
+"""
+애널리스트 리포트 파싱 비용 벤치마크 (저장된 FnGuide 페이지 기준).
+
+    cd BACKEND && python -m benchmarks.report_parsing
+    python -m benchmarks.report_parsing --pages 저장한페이지1.html 저장한페이지2.html --rtt 3
+
+- lxml:  현재 방식. 페이지 소스를 한 번 받아 services.analyst_report_parser 로 파싱
+- bs4:   이전 HTTP 경로 방식 (BeautifulSoup + CSS 셀렉터)
+- 셀 단위 WebDriver: 예전 Selenium 로직이 페이지당 호출하던 find_element/.text 왕복 횟수를
+         같은 페이지로 세고, --rtt(왕복 1회 지연, ms)를 곱해 예상 소요 시간을 낸다
+
+기본 페이지는 benchmarks/fixtures/ 의 FnGuide 컨센서스/기업 리포트 페이지다.
+파일명에 'spv'가 들어가면 기업 리포트 표, 아니면 컨센서스 표로 파싱한다.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from bs4 import BeautifulSoup  # noqa: E402
+
+from services.analyst_report_parser import parse_consensus_reports, parse_spv_reports, to_document  # noqa: E402
+
+FIXTURE_DIR = os.path.join(BACKEND_DIR, "benchmarks", "fixtures")
+DEFAULT_PAGES = [os.path.join(FIXTURE_DIR, n) for n in ("fnguide_consensus.html", "fnguide_spv.html")]
+
+
+class CountingElement:
+    """lxml 요소를 WebElement처럼 감싸 WebDriver 왕복(find_*, .text) 횟수를 센다"""
+
+    def __init__(self, element, counter):
+        self._element = element
+        self._counter = counter
+
+    def _find(self, by, value):
+        self._counter[0] += 1
+        if by == "xpath":
+            return self._element.xpath(value)
+        return list(self._element.iter(value))  # 태그명 CSS 셀렉터(tr, td)만 사용
+
+    def find_elements(self, by, value):
+        return [CountingElement(e, self._counter) for e in self._find(by, value)]
+
+    def find_element(self, by, value):
+        found = self._find(by, value)
+        if not found:
+            raise LookupError(value)
+        return CountingElement(found[0], self._counter)
+
+    @property
+    def text(self):
+        self._counter[0] += 1
+        return " ".join(self._element.text_content().split())
+
+
+def legacy_consensus_round_trips(doc) -> int:
+    """예전 NewsService.get_analyst_reports 의 셀 단위 호출 순서 그대로"""
+    counter = [0]
+    page = CountingElement(doc, counter)
+
+    def safe(row, xpath):
+        try:
+            return row.find_element("xpath", xpath).text.strip()
+        except LookupError:
+            return ""
+
+    data = []
+    for row in page.find_elements("xpath", '//*[@id="bodycontent4"]/tr'):
+        try:
+            date = row.find_element("xpath", "./td[1]").text.strip()
+            title = row.find_element("xpath", './td[2]//span[@class="txt2"]').text.strip()
+            parts = row.find_elements("xpath", "./td[2]//dd")
+            " / ".join([p.text.strip() for p in parts if p.text.strip()])
+            for xpath in ("./td[3]/span", "./td[4]/span", "./td[5]", "./td[6]"):
+                safe(row, xpath)
+            data.append((date, title))
+            if len(data) >= 5:
+                break
+        except LookupError:
+            continue
+    return counter[0]
+
+
+def legacy_spv_round_trips(doc) -> int:
+    """예전 routers/company.py 애널리스트 리포트 로직 (대기 1회 + 행/셀 단위 호출)"""
+    counter = [1]  # WebDriverWait presence 확인
+    table = CountingElement(doc.xpath('//table[contains(@class, "table_common")]')[0], counter)
+    for row in table.find_elements("css selector", "tr")[1:]:
+        cells = row.find_elements("css selector", "td")
+        if len(cells) >= 4:
+            [c.text.strip() for c in cells[:4]]
+    return counter[0]
+
+
+def bs4_consensus(content):
+    soup = BeautifulSoup(content, "lxml")
+    data = []
+    for row in soup.select("#bodycontent4 > tr"):
+        def cell(selector):
+            element = row.select_one(selector)
+            return element.get_text(" ", strip=True) if element else ""
+        date, title = cell("td:nth-of-type(1)"), cell("td:nth-of-type(2) span.txt2")
+        if not date or not title:
+            continue
+        data.append({
+            "date": date, "title": title,
+            "summary": " / ".join(dd.get_text(" ", strip=True) for dd in row.select("td:nth-of-type(2) dd")),
+            "opinion": cell("td:nth-of-type(3) > span"), "target_price": cell("td:nth-of-type(4) > span"),
+            "closing_price": cell("td:nth-of-type(5)"), "analyst": cell("td:nth-of-type(6)"),
+        })
+        if len(data) >= 5:
+            break
+    return data
+
+
+def bs4_spv(content):
+    soup = BeautifulSoup(content, "lxml")
+    table = soup.select_one("table.table_common")
+    reports = []
+    for row in table.select("tr")[1:]:
+        cells = row.select("td")
+        if len(cells) >= 4:
+            reports.append([c.get_text(" ", strip=True) for c in cells[:4]])
+    return reports
+
+
+def timed(func, content, repeat: int):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(content)
+        samples.append((time.perf_counter() - started) * 1000)
+    return statistics.median(samples), result
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="애널리스트 리포트 파싱 벤치마크")
+    parser.add_argument("--pages", nargs="+", default=DEFAULT_PAGES, help="저장한 FnGuide 페이지 (HTML)")
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--rtt", type=float, default=2.0, help="WebDriver 왕복 1회 지연 (ms)")
+    args = parser.parse_args(argv)
+
+    print(f"{'page':<26}{'bytes':>8}{'rows':>6}{'lxml ms':>10}{'bs4 ms':>9}"
+          f"{'legacy calls':>14}{'legacy est ms':>15}")
+    for path in args.pages:
+        with open(path, "rb") as f:
+            content = f.read()
+        spv = "spv" in os.path.basename(path).lower()
+        parse = (lambda c: parse_spv_reports(c)) if spv else (lambda c: parse_consensus_reports(c))
+        lxml_ms, rows = timed(parse, content, args.repeat)
+        bs4_ms, _ = timed(bs4_spv if spv else bs4_consensus, content, args.repeat)
+        doc = to_document(content)
+        calls = legacy_spv_round_trips(doc) if spv else legacy_consensus_round_trips(doc)
+        print(f"{os.path.basename(path):<26}{len(content):>8}{len(rows):>6}{lxml_ms:>10.2f}{bs4_ms:>9.2f}"
+              f"{calls:>14}{calls * args.rtt:>15.1f}")
+    print(f"(lxml/bs4: 중앙값, 페이지 파싱 포함 / legacy: 셀 단위 WebDriver 호출 수 × {args.rtt}ms, "
+          f"현재 Selenium 경로는 page_source 1회)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,355 @@
+"""
+스크래퍼 경로 벤치마크 (오프라인, 저장된 페이지를 로컬 HTTP 서버로 제공).
+
+    cd BACKEND && python -m benchmarks.scraper_paths
+    python -m benchmarks.scraper_paths --requests 200 --concurrency 8 --latency 30 --json scraper.json
+    python -m benchmarks.scraper_paths --paths http --max-p99 50        # CI: p99 초과 시 exit 1
+    python -m benchmarks.scraper_paths --serve --port 8765              # 고정 페이지 서버만 실행
+    python -m benchmarks.scraper_paths --record                         # 실제 사이트에서 고정 페이지 갱신
+
+benchmarks/fixtures/ 의 다음/네이버/FnGuide 페이지를 127.0.0.1 에서 제공하고, 검색/리포트 URL 환경변수
+(NEWS_DAUM_HOT_URL, NEWS_NAVER_URL, NEWS_DAUM_URL, FNGUIDE_CONSENSUS_URL, FNGUIDE_SPV_URL)를
+그 서버로 지정한 뒤 서비스 코드를 그대로 호출한다 (쿼리 문자열은 무시되므로 모든 검색어가 같은 페이지).
+
+- http:     NewsService / CompanyNewsService 공개 메서드 (HTTP 우선 경로, 캐시는 검색어를 바꿔 우회)
+- selenium: 같은 페이지를 SeleniumManager(드라이버 풀 + 사이트 프로필)로 렌더링해 추출.
+            Chrome이 없으면 건너뛴다. 기본(--profiles both)은 프로필 없이(SELENIUM_PROFILES=0, normal 로드 +
+            고정 sleep + 차단 없음) 한 번, 프로필로 한 번 돌려 사이트별 지연을 나란히 낸다
+
+항목별로 pages/s, 지연 p50/p99(ms), 추출 건수, 빈 결과 수를 내고, selenium 경로는 드라이버 1개당
+메모리(chromedriver + Chrome 프로세스 PSS 합 / 드라이버 수, MB)를 함께 낸다. --latency 는 서버 응답마다
+넣는 지연(ms)으로 실제 네트워크 왕복을 흉내 낸다. (메모리 측정은 Linux 전용)
+"""
+import argparse
+import asyncio
+import functools
+import json
+import logging
+import os
+import statistics
+import sys
+import threading
+import time
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+FIXTURE_DIR = os.path.join(BACKEND_DIR, "benchmarks", "fixtures")
+PATHS = ("http", "selenium")
+COMPANY = "삼성전자"
+STOCK_CODE = "005930"
+
+# URL 환경변수 → 고정 페이지 (서비스 모듈 import 전에 설정해야 적용됨)
+FIXTURE_URLS = {
+    "NEWS_DAUM_HOT_URL": "daum_hot.html?q={query}",
+    "NEWS_DAUM_URL": "daum_search.html?q={query}",
+    "NEWS_NAVER_URL": "naver_search.html?q={query}",
+    "FNGUIDE_CONSENSUS_URL": "fnguide_consensus.html?gicode={code}",
+    "FNGUIDE_SPV_URL": "fnguide_spv.html?gno={code}",
+}
+
+
+class FixtureHandler(SimpleHTTPRequestHandler):
+    latency = 0.0
+
+    def do_GET(self):
+        if self.latency:
+            time.sleep(self.latency)
+        super().do_GET()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(port: int = 0, latency_ms: float = 0) -> ThreadingHTTPServer:
+    handler = type("Handler", (FixtureHandler,), {"latency": latency_ms / 1000})
+    server = ThreadingHTTPServer(("127.0.0.1", port), functools.partial(handler, directory=FIXTURE_DIR))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def point_sources_at(base_url: str):
+    for key, path in FIXTURE_URLS.items():
+        os.environ[key] = f"{base_url}/{path}"
+
+
+# ---------------------------------------------------------------- 측정 대상
+
+def http_scenarios():
+    """이름 → (요청 번호 → 코루틴). 서비스 공개 메서드 그대로"""
+    from services.company_news_service import company_news_service
+    from services.news_service import KOSPI_QUERY, news_service
+
+    async def company_news(i):
+        return (await company_news_service.search(f"{COMPANY} {i}"))["news"]
+
+    async def company_reports(i):
+        return (await news_service.get_company_reports(STOCK_CODE))["reports"]
+
+    return {
+        "daum_hot": lambda i: news_service._scrape_daum_news(KOSPI_QUERY),  # 캐시/저장소 앞단 제외
+        "naver_news": lambda i: news_service.search_company_news(f"{COMPANY} {i}"),
+        "company_news": company_news,
+        "fnguide_consensus": lambda i: news_service.get_analyst_reports(f"A{STOCK_CODE}"),
+        "fnguide_spv": company_reports,
+    }
+
+
+def selenium_scenarios():
+    """HTTP 경로가 비었을 때 서비스가 쓰는 것과 같은 SeleniumManager 호출/프로필"""
+    from services.analyst_report_parser import parse_consensus_reports, parse_spv_reports
+    from services.news_service import (DAUM_NEWS_SELECTOR, DAUM_NEWS_URL, FNGUIDE_CONSENSUS_URL, FNGUIDE_SPV_URL,
+                                       KOSPI_QUERY, NAVER_NEWS_URL)
+    from utils.selenium_utils import selenium_manager
+
+    daum_url = DAUM_NEWS_URL.format(query=KOSPI_QUERY)
+    naver_url = NAVER_NEWS_URL.format(query=COMPANY)
+    consensus_url = FNGUIDE_CONSENSUS_URL.format(code=f"A{STOCK_CODE}")
+    spv_url = FNGUIDE_SPV_URL.format(code=STOCK_CODE)
+    return {
+        "daum_hot": lambda i: selenium_manager.scrape_news(daum_url, DAUM_NEWS_SELECTOR, max_items=5,
+                                                           profile="daum_news"),
+        "naver_news": lambda i: selenium_manager.scrape_news(naver_url, "a.news_tit", profile="naver_news"),
+        "fnguide_consensus": lambda i: selenium_manager.scrape_with_custom_logic(
+            consensus_url, lambda d: parse_consensus_reports(d.page_source), profile="fnguide_consensus"),
+        "fnguide_spv": lambda i: selenium_manager.scrape_with_custom_logic(
+            spv_url, lambda d: parse_spv_reports(d.page_source), profile="fnguide_spv"),
+    }
+
+
+# ---------------------------------------------------------------- 측정
+
+def percentile(ordered, q: float) -> float:
+    return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+async def measure(call, requests: int, concurrency: int, warmup: int) -> dict:
+    for i in range(warmup):
+        await call(-1 - i)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies, rows = [], []
+
+    async def one(i):
+        async with semaphore:
+            started = time.perf_counter()
+            result = await call(i)
+            latencies.append((time.perf_counter() - started) * 1000)
+            rows.append(len(result or []))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    elapsed = time.perf_counter() - started
+    ordered = sorted(latencies)
+    return {
+        "requests": requests,
+        "pages_per_s": round(requests / elapsed, 1),
+        "p50_ms": round(statistics.median(ordered), 2),
+        "p99_ms": round(percentile(ordered, 0.99), 2),
+        "rows": max(rows),
+        "empty": rows.count(0),
+    }
+
+
+def _parent_map() -> dict:
+    """pid → ppid (전체 프로세스)"""
+    parents = {}
+    for entry in os.listdir("/proc"):
+        if entry.isdigit():
+            try:
+                with open(f"/proc/{entry}/stat") as f:
+                    parents[int(entry)] = int(f.read().rsplit(")", 1)[1].split()[1])
+            except (OSError, IndexError, ValueError):
+                continue
+    return parents
+
+
+def _pss_kb(pid: int) -> int:
+    try:
+        with open(f"/proc/{pid}/smaps_rollup") as f:
+            for line in f:
+                if line.startswith("Pss:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+def driver_memory() -> dict:
+    """이 프로세스 하위(chromedriver + Chrome)의 PSS 합과 드라이버(chromedriver)당 평균"""
+    parents = _parent_map()
+    descendants, frontier = set(), {os.getpid()}
+    while frontier:
+        frontier = {pid for pid, ppid in parents.items() if ppid in frontier} - descendants
+        descendants |= frontier
+    drivers = 0
+    for pid in descendants:
+        try:
+            with open(f"/proc/{pid}/comm") as f:
+                drivers += f.read().strip() == "chromedriver"
+        except OSError:
+            continue
+    total_mb = sum(_pss_kb(pid) for pid in descendants) / 1024
+    return {"drivers": drivers, "processes": len(descendants), "total_mb": round(total_mb, 1),
+            "per_driver_mb": round(total_mb / drivers, 1) if drivers else None}
+
+
+async def run_selenium(args, profiles: bool) -> dict:
+    """SELENIUM_PROFILES 를 바꿔 드라이버를 새로 만든 뒤(페이지 로드 전략은 생성 시 적용) 시나리오 측정"""
+    from utils import selenium_utils
+    from utils.selenium_utils import driver_pool
+
+    await driver_pool.close()
+    selenium_utils.USE_PROFILES = profiles
+    requests = max(1, args.requests // args.selenium_divisor)
+    return {name: await measure(call, requests, driver_pool.size, 1) for name, call in selenium_scenarios().items()}
+
+
+async def run_benchmarks(args) -> dict:
+    from utils.scraper import scrape_engine
+    from utils.selenium_utils import driver_pool
+
+    report = {"config": {"requests": args.requests, "concurrency": args.concurrency, "latency_ms": args.latency},
+              "http": {}, "selenium": {}}
+    try:
+        if "http" in args.paths:
+            for name, call in http_scenarios().items():
+                report["http"][name] = await measure(call, args.requests, args.concurrency, args.warmup)
+            report["http_sources"] = scrape_engine.stats()
+
+        if "selenium" in args.paths:
+            try:
+                async with driver_pool.lease():
+                    pass
+            except Exception as e:
+                report["selenium_skipped"] = f"WebDriver 생성 실패: {e}"
+            else:
+                if args.profiles in ("off", "both"):
+                    report["selenium_no_profiles"] = await run_selenium(args, profiles=False)
+                if args.profiles in ("on", "both"):
+                    report["selenium"] = await run_selenium(args, profiles=True)
+                report["driver_memory"] = driver_memory()
+                report["driver_pool"] = driver_pool.stats()
+    finally:
+        await scrape_engine.close()
+        await driver_pool.close()
+    return report
+
+
+def print_report(report: dict):
+    print(f"{'path':<10}{'scenario':<20}{'req':>6}{'pages/s':>10}{'p50 ms':>10}{'p99 ms':>10}{'rows':>6}{'empty':>7}")
+    for path in ("http", "selenium_no_profiles", "selenium"):
+        label = "sel(off)" if path == "selenium_no_profiles" else path
+        for name, r in report.get(path, {}).items():
+            print(f"{label:<10}{name:<20}{r['requests']:>6}{r['pages_per_s']:>10.1f}{r['p50_ms']:>10.2f}"
+                  f"{r['p99_ms']:>10.2f}{r['rows']:>6}{r['empty']:>7}")
+    for site, counts in report.get("http_sources", {}).items():
+        print(f"  {site}: http {counts['http']} / selenium {counts['selenium']} / empty {counts['empty']}"
+              f" (http 적중률 {counts['http_hit_rate']})")
+    baseline = report.get("selenium_no_profiles", {})
+    for name, r in report["selenium"].items():
+        if name in baseline:
+            b = baseline[name]
+            print(f"  {name}: p50 {b['p50_ms']:.0f} → {r['p50_ms']:.0f}ms, p99 {b['p99_ms']:.0f} → {r['p99_ms']:.0f}ms"
+                  f" (프로필 없음 → 프로필)")
+    if "selenium_skipped" in report:
+        print(f"selenium: 건너뜀 ({report['selenium_skipped'].splitlines()[0]})")
+    if "driver_memory" in report:
+        m = report["driver_memory"]
+        print(f"driver memory: 드라이버 {m['drivers']}개, 프로세스 {m['processes']}개, PSS {m['total_mb']}MB "
+              f"(드라이버당 {m['per_driver_mb']}MB)")
+
+
+# ---------------------------------------------------------------- 고정 페이지
+
+def record():
+    """실제 사이트에서 현재 페이지를 받아 fixtures/ 갱신 (서비스 기본 URL 기준)"""
+    from services.news_service import (DAUM_NEWS_URL, FNGUIDE_CONSENSUS_URL, FNGUIDE_SPV_URL, KOSPI_QUERY,
+                                       NAVER_NEWS_URL)
+    from services.company_news_service import SOURCES
+    from utils.scraper import scrape_engine
+
+    daum_source = next(s for s in SOURCES if s.name == "daum")
+    targets = {
+        "daum_hot.html": DAUM_NEWS_URL.format(query=KOSPI_QUERY),
+        "daum_search.html": daum_source.search_url(COMPANY),
+        "naver_search.html": NAVER_NEWS_URL.format(query=COMPANY),
+        "fnguide_consensus.html": FNGUIDE_CONSENSUS_URL.format(code=f"A{STOCK_CODE}"),
+        "fnguide_spv.html": FNGUIDE_SPV_URL.format(code=STOCK_CODE),
+    }
+
+    async def fetch_all():
+        try:
+            for filename, url in targets.items():
+                try:
+                    content = await scrape_engine.fetch(url)
+                except Exception as e:
+                    print(f"  {filename:<24} 실패: {e}")
+                    continue
+                with open(os.path.join(FIXTURE_DIR, filename), "wb") as f:
+                    f.write(content)
+                print(f"  {filename:<24} {len(content):>8} bytes  ← {url}")
+        finally:
+            await scrape_engine.close()
+
+    asyncio.run(fetch_all())
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="스크래퍼 경로 벤치마크 (고정 페이지)")
+    parser.add_argument("--paths", nargs="+", choices=PATHS, default=list(PATHS))
+    parser.add_argument("--requests", type=int, default=100, help="시나리오당 요청 수 (http 경로)")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--profiles", choices=["on", "off", "both"], default="both",
+                        help="selenium 경로를 사이트 프로필 적용/미적용/둘 다로 측정")
+    parser.add_argument("--selenium-divisor", type=int, default=10, help="selenium 경로 요청 수 = requests / N")
+    parser.add_argument("--latency", type=float, default=0, help="서버 응답 지연 (ms)")
+    parser.add_argument("--json", help="결과를 JSON으로 저장 (CI 아티팩트)")
+    parser.add_argument("--max-p99", type=float, help="http 경로 p99(ms)가 넘으면 exit 1")
+    parser.add_argument("--serve", action="store_true", help="고정 페이지 서버만 실행")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--record", action="store_true", help="실제 사이트에서 고정 페이지 갱신")
+    parser.add_argument("--verbose", action="store_true")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.CRITICAL)  # 실패는 empty 로 집계
+
+    if args.record:
+        record()
+        return 0
+
+    server = start_server(args.port, args.latency)
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    if args.serve:
+        print(f"고정 페이지 서버: {base_url} (Ctrl+C 종료)")
+        for key, path in FIXTURE_URLS.items():
+            print(f"  {key}={base_url}/{path}")
+        try:
+            threading.Event().wait()
+        except KeyboardInterrupt:
+            return 0
+
+    point_sources_at(base_url)
+    try:
+        report = asyncio.run(run_benchmarks(args))
+    finally:
+        server.shutdown()
+    print_report(report)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    failed = [name for name, r in report["http"].items() if r["empty"]]
+    if args.max_p99 is not None:
+        failed += [name for name, r in report["http"].items() if r["p99_ms"] > args.max_p99]
+    if failed:
+        print(f"실패: {', '.join(sorted(set(failed)))} (빈 결과 또는 p99 > {args.max_p99}ms)")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
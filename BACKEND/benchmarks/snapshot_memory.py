@@ -0,0 +1,229 @@
+"""
+멀티 워커 메모리/콜드 로드 벤치마크: 워커별 파싱 vs 공유 스냅샷(mmap).
+
+    cd BACKEND && python -m benchmarks.snapshot_memory --workers 1 4 8
+
+- parse: 예전 방식. 워커마다 JSON 4개 + CSV를 파싱하고 기업별 record 인덱스와
+         응답 본문(identity/gzip)을 메모리에 만든다.
+- snapshot: 데이터셋 레지스트리 경유. 스냅샷을 읽기 전용으로 매핑하고 응답 본문은 파일로 둔다.
+- cold: snapshot 과 같지만 빈 SNAPSHOT_DIR(아티팩트 없음)에서 N개 워커가 동시에 시작한다.
+        한 워커만 빌드하고 나머지는 그 결과를 매핑해야 하며, 실패한 워커나
+        공유 디렉토리 대신 임시 사본(mmap 아님)을 쓴 워커가 있으면 표에 표시한다.
+
+N개 워커를 동시에 띄워 각 워커의 적재 시간과 /proc/self/smaps_rollup(RSS/PSS/Private)을
+적재 전후로 측정한다 (모듈 import 분은 제외). 공유 페이지는 PSS에서 워커 수로 나뉘므로
+워커 전체의 데이터 PSS 합계가 데이터가 실제로 점유한 물리 메모리에 가깝다.
+snapshot 모드의 스냅샷은 측정 전에 한 번 만들어 두며, 페이지 캐시가 데워진 상태에서의 수치다. (Linux 전용)
+"""
+import argparse
+import gc
+import gzip
+import json
+import multiprocessing as mp
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+JSON_FILES = ["기업별_재무지표.json", "industry_metrics.json", "지분현황.json", "매출비중_chartjs_데이터.json"]
+CSV_FILE = "NICE_내수수출_코스피.csv"
+MODES = ("parse", "snapshot", "cold")
+
+
+def read_memory() -> dict:
+    """현재 프로세스의 RSS/PSS/Private (KB)"""
+    values = {}
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) >= 2 and parts[0].endswith(":") and parts[1].isdigit():
+                values[parts[0][:-1]] = int(parts[1])
+    return {
+        "rss": values.get("Rss", 0),
+        "pss": values.get("Pss", 0),
+        "private": values.get("Private_Clean", 0) + values.get("Private_Dirty", 0),
+    }
+
+
+def load_parse():
+    """예전 방식: 워커마다 원본 파싱 + 인덱스/응답 본문 생성"""
+    import pandas as pd
+
+    state = {}
+    for name in JSON_FILES:
+        with open(os.path.join(BACKEND_DIR, name), "r", encoding="utf-8") as f:
+            data = json.load(f)
+        body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        state[name] = (data, body, gzip.compress(body, compresslevel=9, mtime=0))
+
+    df = pd.read_csv(os.path.join(BACKEND_DIR, CSV_FILE), encoding="utf-8")
+    records = df.astype(object).where(df.notna(), None).to_dict(orient="records")
+    by_name = {}
+    for record in records:
+        by_name.setdefault(record["종목명"], []).append(record)
+    state[CSV_FILE] = (df, by_name)
+    return state
+
+
+def load_snapshot():
+    """현재 방식: 레지스트리가 스냅샷을 매핑. 서비스가 실제로 읽는 배열을 한 번씩 훑는다"""
+    import numpy as np
+
+    from services.financial_metrics_service import DATASET as METRICS
+    from services.metrics_cube import INDUSTRY_DATASET
+    from services.sales_composition_service import DATASET as SALES
+    from services.shareholder_service import DATASET as SHAREHOLDERS
+    from services.ticker_resolver import UNIVERSE_DATASET
+    from utils.dataset_registry import dataset_registry
+    from utils.snapshot import Snapshot, StringColumn
+    from utils.static_response import dataset_payload
+
+    state = {}
+    for name in (METRICS, SHAREHOLDERS, SALES, INDUSTRY_DATASET, UNIVERSE_DATASET):
+        data = dataset_registry.get(name)
+        state[name] = (data, dataset_registry.index(name))
+        if isinstance(data, Snapshot):
+            for key in data.info["arrays"]:
+                float(np.asarray(data.array(key), dtype=np.float64).sum())
+            for key in data.info["strings"]:
+                col = data.strings(key)
+                assert isinstance(col, StringColumn)
+                int(np.asarray(col.codes).sum())
+    for name in (METRICS, SHAREHOLDERS, INDUSTRY_DATASET, UNIVERSE_DATASET):
+        state[f"{name}.payload"] = dataset_payload(name)
+    return state
+
+
+def private_copies(state: dict) -> int:
+    """SNAPSHOT_DIR 밖(임시 사본)에서 열린 스냅샷 수 - 워커 간에 공유되지 않는 것"""
+    from utils.snapshot import SNAPSHOT_DIR, Snapshot
+
+    root = os.path.realpath(SNAPSHOT_DIR) + os.sep
+    paths = [value[0].path for value in state.values() if isinstance(value, tuple) and isinstance(value[0], Snapshot)]
+    paths += [value.body_path for value in state.values() if hasattr(value, "body_path")]
+    return sum(1 for path in paths if not os.path.realpath(path).startswith(root))
+
+
+def import_modules(mode: str):
+    """모듈 import 비용은 측정에서 제외 (데이터 적재만 비교)"""
+    import numpy  # noqa: F401
+    import pandas  # noqa: F401
+
+    if mode != "parse":
+        import services.financial_metrics_service  # noqa: F401
+        import services.metrics_cube  # noqa: F401
+        import services.sales_composition_service  # noqa: F401
+        import services.shareholder_service  # noqa: F401
+        import services.ticker_resolver  # noqa: F401
+        import utils.static_response  # noqa: F401
+
+
+def worker(mode: str, start_event, queue):
+    import_modules(mode)
+    gc.collect()
+    before = read_memory()
+    start_event.wait()
+    started = time.perf_counter()
+    try:
+        state = load_parse() if mode == "parse" else load_snapshot()
+    except Exception as e:
+        queue.put({"error": f"{type(e).__name__}: {e}"})
+        return
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    gc.collect()
+    after = read_memory()
+    queue.put({
+        "load_ms": elapsed_ms,
+        "private_copies": private_copies(state) if mode != "parse" else 0,
+        **{f"{k}_kb": after[k] for k in after},
+        **{f"{k}_delta_kb": after[k] - before[k] for k in after},
+    })
+    del state
+
+
+def run(mode: str, workers: int) -> dict:
+    if mode == "cold":
+        # spawn 워커는 환경 변수를 물려받으므로 빈 디렉토리를 가리키게 한 뒤 시작
+        cold_dir = tempfile.mkdtemp(prefix="snapshot-cold-")
+        saved = {key: os.environ.get(key) for key in ("SNAPSHOT_DIR", "ARTIFACT_DIR")}
+        os.environ["SNAPSHOT_DIR"] = os.path.join(cold_dir, "snapshots")
+        os.environ["ARTIFACT_DIR"] = os.path.join(cold_dir, "artifacts")
+        try:
+            return _run(mode, workers)
+        finally:
+            for key, value in saved.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+            shutil.rmtree(cold_dir, ignore_errors=True)
+    return _run(mode, workers)
+
+
+def _run(mode: str, workers: int) -> dict:
+    ctx = mp.get_context("spawn")
+    queue = ctx.Queue()
+    start_event = ctx.Event()
+    procs = [ctx.Process(target=worker, args=(mode, start_event, queue)) for _ in range(workers)]
+    for p in procs:
+        p.start()
+    time.sleep(1.0 + 0.2 * workers)  # 모든 워커가 import를 마치고 대기하도록
+    start_event.set()
+    results = [queue.get(timeout=300) for _ in procs]
+    for p in procs:
+        p.join()
+
+    errors = [r["error"] for r in results if "error" in r]
+    results = [r for r in results if "error" not in r]
+    if not results:
+        raise RuntimeError(f"모든 워커 실패: {errors[0]}")
+    mb = 1024.0
+    workers = len(results)
+    return {
+        "mode": mode,
+        "workers": workers,
+        "errors": errors,
+        "private_copies": sum(r["private_copies"] for r in results),
+        "load_ms_avg": sum(r["load_ms"] for r in results) / workers,
+        "load_ms_max": max(r["load_ms"] for r in results),
+        "rss_mb_avg": sum(r["rss_kb"] for r in results) / workers / mb,
+        "data_rss_mb_avg": sum(r["rss_delta_kb"] for r in results) / workers / mb,
+        "data_private_mb_avg": sum(r["private_delta_kb"] for r in results) / workers / mb,
+        "data_pss_mb_total": sum(r["pss_delta_kb"] for r in results) / mb,
+    }
+
+
+def prepare():
+    """snapshot 모드용 스냅샷/응답 본문 파일을 미리 생성 (측정에서 제외, cold 모드는 빈 디렉토리 사용)"""
+    load_snapshot()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--modes", nargs="+", choices=MODES, default=list(MODES))
+    args = parser.parse_args()
+
+    prepare()
+    header = (f"{'mode':<9} {'workers':>7} {'load avg':>9} {'load max':>9} "
+              f"{'RSS/worker':>11} {'data RSS':>9} {'private':>8} {'data PSS total':>15}")
+    print(header)
+    print("-" * len(header))
+    for workers in args.workers:
+        for mode in args.modes:
+            r = run(mode, workers)
+            print(f"{r['mode']:<9} {r['workers']:>7} {r['load_ms_avg']:>7.0f}ms {r['load_ms_max']:>7.0f}ms "
+                  f"{r['rss_mb_avg']:>9.1f}MB {r['data_rss_mb_avg']:>7.1f}MB "
+                  f"{r['data_private_mb_avg']:>6.1f}MB {r['data_pss_mb_total']:>13.1f}MB")
+            if r["errors"] or r["private_copies"]:
+                print(f"  ⚠️ 실패 워커 {len(r['errors'])}개, 임시 사본 스냅샷 {r['private_copies']}개"
+                      + (f": {r['errors'][0]}" if r["errors"] else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""크롤링 작업 프레임워크: 시드 → fetcher → parser → sink, 작업 큐/재시도/도메인 제한 (python -m crawl.run)"""
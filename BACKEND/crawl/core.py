@@ -0,0 +1,160 @@
+"""
+크롤링 작업 정의와 실행기.
+
+CrawlJob = seeds(작업 단위 목록) + fetcher(페이지 가져오기) + parser(표 추출/해시/파싱) + sink(저장, 실행 시 선택).
+CrawlRunner 는 작업 단위를 TaskQueue 에 넣고 워커 N개로 처리한다.
+
+작업 단위 하나:
+    도메인 슬롯 대기 → HTTP(ETag/Last-Modified 조건부) → 표가 없으면 브라우저 렌더링
+    → 304 이거나 표 해시가 이전과 같으면 건너뜀 → 파싱 → sink.write → 큐에 done 기록
+실패하면 backoff * 2^(시도-1) 초 뒤 재시도, max_attempts 를 넘으면 failed (다음 회차에 다시 시도).
+"""
+import asyncio
+import logging
+import time
+from collections import Counter
+from typing import Callable, Dict, List, Optional
+
+from crawl.fetchers import DomainLimit, DomainLimiter, PageFetcher
+from crawl.parsers import TableParser
+from crawl.task_queue import Task, TaskQueue
+
+logger = logging.getLogger("crawl.core")
+
+
+class CrawlJob:
+    """
+    seeds: (시드 파일 경로|None) → Task 목록
+    output: 결과 이름 (파일 sink는 <output>.csv/.parquet, Mongo sink는 컬렉션 이름)
+    limits: 도메인별 동시 요청 수/초당 요청 수
+    interval: 스케줄 기본 주기 (초)
+    datasets: 결과 CSV로 다시 빌드할 서빙 데이터셋 (pipeline.build --only)
+    """
+
+    def __init__(self, name: str, description: str, seeds: Callable[[Optional[str]], List[Task]],
+                 fetcher: PageFetcher, parser: TableParser, output: str,
+                 limits: Optional[Dict[str, DomainLimit]] = None, interval: float = 7 * 86400,
+                 datasets: Optional[List[str]] = None):
+        self.name = name
+        self.description = description
+        self.seeds = seeds
+        self.fetcher = fetcher
+        self.parser = parser
+        self.output = output
+        self.limits = limits or {}
+        self.interval = interval
+        self.datasets = datasets or []
+
+
+class CrawlRunner:
+    def __init__(self, job: CrawlJob, queue: TaskQueue, sink, workers: int = 4, max_attempts: int = 3,
+                 backoff: float = 5.0, force: bool = False):
+        self.job = job
+        self.queue = queue
+        self.sink = sink
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.force = force
+        self.limiter = DomainLimiter(job.limits)
+        self.counts: Counter = Counter()
+
+    async def _process(self, task: Task) -> str:
+        """→ changed | unchanged | empty"""
+        job = self.job
+        validators = {} if self.force else {"etag": task.etag, "last_modified": task.last_modified}
+        result, table = None, None
+        async with self.limiter.slot(task.url):
+            try:
+                result = await job.fetcher.http(task.url, **validators)
+                if result.not_modified and not await self.sink.has(task.key):
+                    result = await job.fetcher.http(task.url)  # 이전 결과가 없으면 다시 받음
+            except Exception as e:
+                logger.warning("⚠️ HTTP 실패 (%s): %s", task.key, e)
+        if result is not None and result.not_modified:
+            self.queue.finish(task, "done", **result.validators)
+            return "unchanged"
+        if result is not None:
+            table = job.parser.extract(result.doc)
+        if table is None and job.fetcher.render:
+            async with self.limiter.slot(task.url):
+                result = await job.fetcher.rendered(task.url, job.parser.ready_xpath)
+            table = job.parser.extract(result.doc) if result is not None else None
+            if result is not None:
+                result.validators = {"etag": None, "last_modified": None}  # 렌더링 결과는 조건부 요청 안 함
+        if table is None:
+            if result is None:
+                raise RuntimeError("페이지를 가져오지 못함")
+            await self.sink.remove(task.key)
+            self.queue.finish(task, "empty", hash=None, rows=0, **result.validators)
+            return "empty"
+
+        digest = job.parser.fingerprint(table)
+        if not self.force and digest == task.hash and await self.sink.has(task.key):
+            self.queue.finish(task, "done", **result.validators)
+            return "unchanged"
+        df = job.parser.parse(table, task)
+        await self.sink.write(task.key, df)
+        self.queue.finish(task, "done", hash=digest, rows=len(df), **result.validators)
+        return "changed"
+
+    async def _worker(self):
+        while True:
+            task = self.queue.claim()
+            if task is None:
+                retry_at = self.queue.next_retry_at()
+                if retry_at is None:
+                    return
+                await asyncio.sleep(min(max(retry_at - time.time(), 0.05), 1.0))
+                continue
+            try:
+                outcome = await self._process(task)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                if self.queue.retry(task, f"{type(e).__name__}: {e}", self.max_attempts, self.backoff):
+                    logger.warning("🔁 %s 재시도 예정 (%d회 실패): %s", task.key, task.attempts + 1, e)
+                    continue
+                outcome = "failed"
+                logger.error("❌ %s 실패 (재시도 한도): %s", task.key, e)
+            self.counts[outcome] += 1
+            logger.info("%s %s %s", {"changed": "✅", "unchanged": "➖", "empty": "⚠️"}.get(outcome, "❌"),
+                        task.key, outcome)
+
+    async def run(self, seed_path: Optional[str] = None, limit: Optional[int] = None) -> Dict:
+        """한 회차 실행 (끝나지 않은 회차가 있으면 이어서). 집계와 출력 경로 반환"""
+        seeds = self.job.seeds(seed_path)
+        if limit:
+            seeds = seeds[:limit]
+        removed = self.queue.sync(seeds)
+        recovered = self.queue.recover()
+        resumed = self.queue.last_run() is not None and self.queue.has_unfinished()
+        if not resumed:
+            self.queue.new_round()
+        if self.force:
+            self.queue.forget_content()
+        logger.info("🕷️ %s: 작업 %d개 (%s, 시드에서 빠진 작업 %d개 삭제)", self.job.name, len(seeds),
+                    f"이어서, 중단된 작업 {recovered}개" if resumed else "새 회차", removed)
+
+        run_id = self.queue.start_run()
+        started = time.perf_counter()
+        workers = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            raise
+
+        outputs = await self.sink.finalize(self.queue.ordered_keys())
+        summary = {
+            "job": self.job.name,
+            "resumed": resumed,
+            "processed": dict(self.counts),
+            "queue": self.queue.counts(),
+            "seconds": round(time.perf_counter() - started, 1),
+            "outputs": outputs,
+        }
+        self.queue.finish_run(run_id, dict(self.counts))
+        return summary
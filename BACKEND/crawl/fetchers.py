@@ -0,0 +1,140 @@
+"""
+페이지 가져오기: HTTP(공유 aiohttp 세션) 우선, 필요하면 Selenium 풀에서 렌더링.
+도메인별 동시 요청 수/요청 간격 제한.
+"""
+import asyncio
+import logging
+import os
+import re
+import time
+from typing import Dict, Optional
+from urllib.parse import urlparse
+
+import lxml.html
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+from utils.scraper import parse_document, scrape_engine
+from utils.selenium_utils import selenium_manager
+
+logger = logging.getLogger("crawl.fetchers")
+
+DEFAULT_CONCURRENCY = int(os.getenv("CRAWL_DOMAIN_CONCURRENCY", "2"))
+DEFAULT_RATE = float(os.getenv("CRAWL_DOMAIN_RATE", "2"))  # 도메인당 초당 요청 수
+RENDER_TIMEOUT = float(os.getenv("CRAWL_RENDER_TIMEOUT", "10"))  # 렌더링 후 표가 나타날 때까지 대기
+CHARSET_RE = re.compile(r"charset=[\"']?([\w-]+)", re.I)
+
+
+class DomainLimit:
+    def __init__(self, concurrency: int = DEFAULT_CONCURRENCY, rate: float = DEFAULT_RATE):
+        self.concurrency = concurrency
+        self.rate = rate
+
+
+class DomainLimiter:
+    """도메인마다 동시 요청 수(세마포어) + 요청 시작 간격(1/rate초) 제한"""
+
+    def __init__(self, limits: Optional[Dict[str, DomainLimit]] = None, default: Optional[DomainLimit] = None):
+        self.limits = limits or {}
+        self.default = default or DomainLimit()
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._next_slot: Dict[str, float] = {}
+
+    def _limit(self, host: str) -> DomainLimit:
+        return self.limits.get(host, self.default)
+
+    async def _pace(self, host: str):
+        limit = self._limit(host)
+        if limit.rate <= 0:
+            return
+        now = time.monotonic()
+        slot = max(now, self._next_slot.get(host, now))
+        self._next_slot[host] = slot + 1.0 / limit.rate
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+    def slot(self, url: str) -> "_DomainSlot":
+        host = urlparse(url).netloc
+        if host not in self._semaphores:
+            self._semaphores[host] = asyncio.Semaphore(self._limit(host).concurrency)
+        return _DomainSlot(self, host)
+
+
+class _DomainSlot:
+    def __init__(self, limiter: DomainLimiter, host: str):
+        self.limiter = limiter
+        self.host = host
+
+    async def __aenter__(self):
+        await self.limiter._semaphores[self.host].acquire()
+        try:
+            await self.limiter._pace(self.host)
+        except BaseException:
+            self.limiter._semaphores[self.host].release()
+            raise
+
+    async def __aexit__(self, *exc):
+        self.limiter._semaphores[self.host].release()
+
+
+class FetchResult:
+    """doc=None 이면 304 (이전과 같음). validators: 다음 조건부 요청에 쓸 ETag/Last-Modified"""
+
+    def __init__(self, doc: Optional[lxml.html.HtmlElement], path: str, validators: Optional[Dict] = None):
+        self.doc = doc
+        self.path = path
+        self.validators = validators or {}
+
+    @property
+    def not_modified(self) -> bool:
+        return self.doc is None
+
+
+class PageFetcher:
+    """
+    profile: Selenium 렌더링 시 쓸 사이트 프로필 (리소스 차단 패턴)
+    render: HTTP 응답에 대상 요소가 없을 때 브라우저로 다시 가져올지 여부
+    """
+
+    def __init__(self, profile: str = "default", render: bool = True, render_timeout: float = RENDER_TIMEOUT):
+        self.profile = profile
+        self.render = render
+        self.render_timeout = render_timeout
+
+    async def http(self, url: str, etag: Optional[str] = None, last_modified: Optional[str] = None) -> FetchResult:
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        status, response_headers, body = await scrape_engine.fetch_response(url, headers=headers or None)
+        validators = {"etag": response_headers.get("ETag"), "last_modified": response_headers.get("Last-Modified")}
+        if status == 304:
+            return FetchResult(None, "http", validators)
+        charset = CHARSET_RE.search(response_headers.get("Content-Type", ""))
+        content = body.decode(charset.group(1), errors="replace") if charset else body  # 없으면 meta charset
+        return FetchResult(parse_document(content), "http", validators)
+
+    async def rendered(self, url: str, ready_xpath: str) -> Optional[FetchResult]:
+        """
+        브라우저로 열고 ready_xpath 요소가 나타날 때까지(최대 render_timeout) 기다린 뒤 페이지 소스 파싱.
+        시간 초과면 그때의 페이지를 그대로 반환 (표 없음), 드라이버 실패면 None
+        """
+        timeout = self.render_timeout
+
+        def wait_and_read(driver) -> str:
+            try:
+                WebDriverWait(driver, timeout, poll_frequency=0.2).until(
+                    EC.presence_of_element_located((By.XPATH, ready_xpath))
+                )
+            except TimeoutException:
+                pass
+            return driver.page_source
+
+        source = await selenium_manager.scrape_with_custom_logic(url, wait_and_read, wait_time=0,
+                                                                profile=self.profile)
+        if not source:
+            return None
+        return FetchResult(lxml.html.document_fromstring(source), "selenium")
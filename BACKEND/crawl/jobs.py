@@ -0,0 +1,91 @@
+"""
+크롤링 작업 목록 (코드/매출비중.py, 코드/수출.py 를 옮긴 것).
+
+시드(기업 목록) 우선순위: --seeds 로 준 엑셀/CSV(종목코드, 종목명 컬럼) → CRAWL_SEED_FILE
+→ 로컬 종목 유니버스(매출비중_chartjs_데이터.json).
+URL은 환경변수로 바꿀 수 있다 (스텁 사이트로 테스트할 때).
+"""
+import os
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from crawl.core import CrawlJob
+from crawl.fetchers import DomainLimit, PageFetcher
+from crawl.parsers import TableParser, contains_any, has_classes
+from crawl.task_queue import Task
+from services.sales_composition_service import DATASET as SALES_DATASET
+from services.ticker_resolver import UNIVERSE_DATASET
+from utils.dataset_registry import dataset_registry
+from utils.ticker_utils import normalize_company_name, normalize_ticker, to_gicode
+
+SEED_FILE = os.getenv("CRAWL_SEED_FILE")
+FNGUIDE_CORP_URL = os.getenv("CRAWL_FNGUIDE_CORP_URL",
+                             "https://comp.fnguide.com/SVO2/ASP/SVD_Corp.asp?pGB=1&gicode=A{code}")
+NICE_EXPORT_URL = os.getenv("CRAWL_NICE_EXPORT_URL",
+                            "https://comp.nicebizline.com/co/CO0100M010GE.nice?stockcd={code}&nav=2")
+
+
+def load_companies(path: Optional[str] = None) -> List[Tuple[str, str]]:
+    """[(6자리 종목코드, 종목명)] (중복 종목코드는 처음 것)"""
+    path = path or SEED_FILE
+    if path:
+        if path.lower().endswith((".xlsx", ".xls")):
+            df = pd.read_excel(path)
+        else:
+            df = pd.read_csv(path, encoding="utf-8-sig")
+        pairs = zip(df["종목코드"], df["종목명"])
+    else:
+        pairs = ((code, name) for name, code in dataset_registry.index(UNIVERSE_DATASET).items())
+
+    companies: Dict[str, str] = {}
+    for code, name in pairs:
+        code, name = normalize_ticker(code), normalize_company_name(name)
+        if code and name:
+            companies.setdefault(code, name)
+    return list(companies.items())
+
+
+def company_seeds(url: str, code_format: Callable[[str], str]) -> Callable[[Optional[str]], List[Task]]:
+    def seeds(path: Optional[str] = None) -> List[Task]:
+        return [Task(code, url.format(code=code), {"종목코드": code_format(code), "종목명": name})
+                for code, name in load_companies(path)]
+    return seeds
+
+
+SALES_COMPOSITION = CrawlJob(
+    "sales_composition",
+    "FnGuide 기업개요 매출비중 표",
+    seeds=company_seeds(FNGUIDE_CORP_URL, to_gicode),
+    fetcher=PageFetcher(profile="fnguide_corp"),
+    parser=TableParser(
+        [f"//table[{has_classes('us_table_ty1', 'table-hb2', 'h_fix', 'zigbg_no')}]"],
+        meta_columns=("종목코드", "종목명"),
+    ),
+    output="코스피_매출비중추이_전체",
+    limits={"comp.fnguide.com": DomainLimit(concurrency=4, rate=3)},
+    interval=7 * 86400,
+    datasets=[UNIVERSE_DATASET],
+)
+
+DOMESTIC_EXPORT = CrawlJob(
+    "domestic_export",
+    "NICE BizLine 내수/수출 표",
+    seeds=company_seeds(NICE_EXPORT_URL, lambda code: code),
+    fetcher=PageFetcher(profile="nice_export"),
+    parser=TableParser(
+        [
+            # 캡션/헤더 셀에 내수·수출이 있는 표, 없으면 셀에 있는 가장 안쪽 표
+            f"//table[caption[{contains_any('내수', '수출')}] or .//th[{contains_any('내수', '수출')}]]"
+            f"[not(.//table)]",
+            f"//table[.//td[{contains_any('내수', '수출')}]][not(.//table)]",
+        ],
+        meta_columns=("종목코드", "종목명"),
+    ),
+    output="NICE_내수수출_코스피전체",
+    limits={"comp.nicebizline.com": DomainLimit(concurrency=2, rate=2)},
+    interval=30 * 86400,
+    datasets=[SALES_DATASET],
+)
+
+JOBS = {job.name: job for job in (SALES_COMPOSITION, DOMESTIC_EXPORT)}
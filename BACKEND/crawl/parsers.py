@@ -0,0 +1,57 @@
+"""
+표 파서: 페이지에서 앵커 XPath로 표 하나만 찾아 DataFrame으로.
+내용 해시(fingerprint)는 셀 텍스트만으로 계산해 속성/링크 파라미터 변화는 무시한다.
+"""
+import hashlib
+from io import StringIO
+from typing import Optional, Sequence
+
+import lxml.html
+import pandas as pd
+
+from crawl.task_queue import Task
+
+
+def has_classes(*classes: str) -> str:
+    """class 속성에 주어진 클래스가 모두 있는지 (XPath 조건)"""
+    return " and ".join(f'contains(concat(" ", normalize-space(@class), " "), " {c} ")' for c in classes)
+
+
+def contains_any(*words: str) -> str:
+    return " or ".join(f"contains(normalize-space(.), '{w}')" for w in words)
+
+
+class TableParser:
+    """
+    anchors: 우선순위 순 표 XPath (처음 찾은 표 하나만 사용)
+    meta_columns: 앞에 붙일 작업 메타 컬럼 (예: 종목코드, 종목명)
+    """
+
+    def __init__(self, anchors: Sequence[str], meta_columns: Sequence[str] = ()):
+        self.anchors = list(anchors)
+        self.meta_columns = list(meta_columns)
+
+    @property
+    def ready_xpath(self) -> str:
+        """브라우저 렌더링 시 대기 조건"""
+        return " | ".join(self.anchors)
+
+    def extract(self, doc: lxml.html.HtmlElement) -> Optional[lxml.html.HtmlElement]:
+        for xpath in self.anchors:
+            found = doc.xpath(xpath)
+            if found:
+                return found[0]
+        return None
+
+    @staticmethod
+    def fingerprint(table: lxml.html.HtmlElement) -> str:
+        cells = (" ".join(cell.text_content().split()) for cell in table.iter("th", "td"))
+        return hashlib.sha1("\t".join(cells).encode("utf-8")).hexdigest()
+
+    def parse(self, table: lxml.html.HtmlElement, task: Task) -> pd.DataFrame:
+        df = pd.read_html(StringIO(lxml.html.tostring(table, encoding="unicode")))[0]
+        if isinstance(df.columns, pd.MultiIndex):  # 2단 헤더 → 한 줄
+            df.columns = [" ".join(dict.fromkeys(str(level) for level in col)) for col in df.columns]
+        for i, column in enumerate(self.meta_columns):
+            df.insert(i, column, task.meta.get(column))
+        return df
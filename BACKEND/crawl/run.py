@@ -0,0 +1,196 @@
+"""
+크롤링 작업 CLI.
+
+    cd BACKEND
+    python -m crawl.run list
+    python -m crawl.run run sales_composition                    # crawl_output/ 에 parquet + csv
+    python -m crawl.run run domestic_export --seeds 상장법인목록.xlsx --workers 8
+    python -m crawl.run run sales_composition --sink mongo       # crawl_sales_composition 컬렉션 (MONGODB_URI)
+    python -m crawl.run run sales_composition --build            # 끝나면 pipeline.build --only sales_chart
+    python -m crawl.run status
+    python -m crawl.run schedule                                 # CRAWL_SCHEDULE 주기로 계속 실행
+
+중단 후 다시 실행하면 남은 작업만 처리한다 (--fresh: 큐/결과 삭제 후 처음부터).
+작업 상태는 CRAWL_STATE_DIR/<작업>.sqlite, 결과는 CRAWL_OUTPUT_DIR (기본 BACKEND/crawl_output).
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+from typing import Dict, List, Optional, Sequence
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+import config  # noqa: E402,F401 (.env 로드 - CLI 실행 시)
+from crawl.core import CrawlRunner  # noqa: E402
+from crawl.jobs import JOBS  # noqa: E402
+from crawl.sinks import CRAWL_OUTPUT_DIR, DEFAULT_FORMATS, FileSink, MongoSink  # noqa: E402
+from crawl.task_queue import TaskQueue  # noqa: E402
+
+try:
+    import fcntl  # 같은 작업 동시 실행 방지 (Windows는 생략)
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+logger = logging.getLogger("crawl.run")
+
+CRAWL_STATE_DIR = os.getenv("CRAWL_STATE_DIR")  # 기본: <출력 디렉토리>/.state
+CRAWL_SINK = os.getenv("CRAWL_SINK", "file")
+# 기본: parquet + csv (pyarrow 가 없으면 csv만)
+CRAWL_FORMATS = [f.strip() for f in os.getenv("CRAWL_FORMATS", ",".join(DEFAULT_FORMATS)).split(",") if f.strip()]
+CRAWL_WORKERS = int(os.getenv("CRAWL_WORKERS", "4"))
+
+
+def state_path(job_name: str, out_dir: str = CRAWL_OUTPUT_DIR) -> str:
+    return os.path.join(CRAWL_STATE_DIR or os.path.join(out_dir, ".state"), f"{job_name}.sqlite")
+
+
+def make_sink(job, sink: str, out_dir: str, formats: Sequence[str]):
+    if sink == "mongo":
+        return MongoSink(f"crawl_{job.name}")
+    return FileSink(out_dir, job.output, formats)
+
+
+class JobLock:
+    """작업별 파일 잠금 (서버 스케줄러와 CLI가 같은 큐를 동시에 돌리지 않도록)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.path, "w")
+        if fcntl is not None:
+            try:
+                fcntl.flock(self._file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                self._file.close()
+                raise RuntimeError(f"이미 실행 중인 작업: {self.path}")
+        return self
+
+    def __exit__(self, *exc):
+        self._file.close()
+
+
+async def run_job(name: str, out_dir: str = CRAWL_OUTPUT_DIR, sink: str = CRAWL_SINK,
+                  formats: Sequence[str] = CRAWL_FORMATS, workers: int = CRAWL_WORKERS,
+                  seeds: Optional[str] = None, force: bool = False, fresh: bool = False,
+                  finalize_only: bool = False, limit: Optional[int] = None) -> Dict:
+    """작업 하나 실행 (CLI/스케줄러 공용). 파일 sink 는 out_dir 에 출력"""
+    job = JOBS[name]
+    path = state_path(name, out_dir)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with JobLock(path + ".lock"):
+        target = make_sink(job, sink, out_dir, formats)
+        if fresh:
+            for suffix in ("", "-wal", "-shm"):
+                if os.path.exists(path + suffix):
+                    os.remove(path + suffix)
+            await asyncio.to_thread(target.reset)
+        queue = TaskQueue(path)
+        try:
+            if finalize_only:
+                return {"job": name, "outputs": await target.finalize(queue.ordered_keys())}
+            runner = CrawlRunner(job, queue, target, workers=workers, force=force)
+            return await runner.run(seeds, limit)
+        finally:
+            queue.close()
+
+
+def job_status(name: str, out_dir: str = CRAWL_OUTPUT_DIR) -> Dict:
+    path = state_path(name, out_dir)
+    if not os.path.exists(path):
+        return {"job": name, "state": None}
+    queue = TaskQueue(path)
+    try:
+        return {"job": name, "state": path, "queue": queue.counts(), "last_run": queue.last_run(),
+                "failures": queue.failures()}
+    finally:
+        queue.close()
+
+
+def rebuild(job_names: List[str], out_dir: str) -> int:
+    """크롤링 결과 CSV로 해당 서빙 데이터셋만 다시 빌드"""
+    from pipeline import build
+
+    datasets = [d for name in job_names for d in JOBS[name].datasets]
+    return build.main(["--raw-dir", out_dir, "--only", *datasets]) if datasets else 0
+
+
+async def _main(args) -> int:
+    from utils.database import db_manager
+    from utils.scraper import scrape_engine
+    from utils.selenium_utils import driver_pool
+
+    if args.sink == "mongo":
+        await db_manager.connect()
+    try:
+        if args.command == "schedule":
+            from crawl.schedule import crawl_scheduler
+
+            await crawl_scheduler.run_forever(out_dir=args.out, sink=args.sink)
+            return 0
+        summary = await run_job(args.job, out_dir=args.out, sink=args.sink, formats=args.format,
+                                workers=args.workers, seeds=args.seeds, force=args.force, fresh=args.fresh,
+                                finalize_only=args.finalize_only, limit=args.limit)
+    finally:
+        await scrape_engine.close()
+        await driver_pool.close()
+        db_manager.close()
+    print(json.dumps(summary, ensure_ascii=False, indent=2))
+    if args.build and args.sink == "file" and "csv" in args.format:
+        return rebuild([args.job], args.out)
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="크롤링 작업")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="작업 목록")
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--out", default=CRAWL_OUTPUT_DIR, help="결과(파일 sink)/상태 디렉토리")
+    common.add_argument("--sink", choices=["file", "mongo"], default=CRAWL_SINK)
+
+    run = commands.add_parser("run", parents=[common], help="작업 실행 (중단된 회차는 이어서)")
+    run.add_argument("job", choices=sorted(JOBS))
+    run.add_argument("--format", nargs="+", choices=["parquet", "csv"], default=CRAWL_FORMATS)
+    run.add_argument("--workers", type=int, default=CRAWL_WORKERS, help="동시 작업 수 (도메인 제한은 별도)")
+    run.add_argument("--seeds", help="기업 목록 엑셀/CSV (종목코드, 종목명). 기본: CRAWL_SEED_FILE 또는 종목 유니버스")
+    run.add_argument("--limit", type=int, help="앞에서 N개 기업만 (테스트용)")
+    run.add_argument("--force", action="store_true", help="변경 여부와 관계없이 모두 다시 파싱")
+    run.add_argument("--fresh", action="store_true", help="큐/결과 삭제 후 처음부터")
+    run.add_argument("--finalize-only", action="store_true", help="크롤링 없이 저장된 결과만 다시 합치기")
+    run.add_argument("--build", action="store_true", help="끝나면 해당 서빙 데이터셋 다시 빌드")
+
+    status = commands.add_parser("status", parents=[common], help="작업 큐 상태")
+    status.add_argument("job", nargs="*", choices=sorted(JOBS))
+    commands.add_parser("schedule", parents=[common], help="CRAWL_SCHEDULE 주기로 계속 실행")
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    if args.command == "list":
+        for job in JOBS.values():
+            print(f"  {job.name:<20} {job.description} → {job.output} (기본 주기 {job.interval / 86400:g}일)")
+        return 0
+    if args.command == "status":
+        for name in args.job or JOBS:
+            print(json.dumps(job_status(name, args.out), ensure_ascii=False, indent=2))
+        return 0
+    try:
+        return asyncio.run(_main(args))
+    except RuntimeError as e:
+        logger.error("❌ %s", e)
+        return 1
+    except KeyboardInterrupt:
+        logger.warning("⏹️ 중단됨 - 다시 실행하면 남은 작업부터 이어서 처리")
+        return 130
+
+
+if __name__ == "__main__":
+    sys.exit(main())
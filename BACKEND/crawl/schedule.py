@@ -0,0 +1,107 @@
+"""
+크롤링 스케줄러: CRAWL_SCHEDULE 에 적은 작업을 주기마다 실행.
+
+    CRAWL_SCHEDULE=sales_composition:7d,domestic_export:30d    # 주기 단위 s/m/h/d, 생략 시 작업 기본 주기
+
+다음 실행 시각 = 작업 큐의 마지막 완료 시각 + 주기 (서버 재시작과 관계없이 유지).
+파일 sink(CSV 포함)로 끝나면 작업의 서빙 데이터셋을 다시 빌드한다 (pipeline.build --only, 서버는 새 매니페스트를 자동 감지).
+서버 startup 에서 시작하거나(CRAWL_SCHEDULE 이 있을 때만) `python -m crawl.run schedule` 로 따로 돌린다.
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, Optional
+
+from crawl.jobs import JOBS
+from crawl.run import CRAWL_FORMATS, CRAWL_SINK, rebuild, run_job, state_path
+from crawl.sinks import CRAWL_OUTPUT_DIR
+from crawl.task_queue import TaskQueue
+
+logger = logging.getLogger("crawl.schedule")
+
+SCHEDULE = os.getenv("CRAWL_SCHEDULE", "")
+UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+MAX_SLEEP = 3600.0
+
+
+def parse_schedule(text: str) -> Dict[str, float]:
+    """'작업[:주기],...' → {작업: 주기(초)}"""
+    schedule = {}
+    for entry in filter(None, (e.strip() for e in text.split(","))):
+        name, _, every = entry.partition(":")
+        if name not in JOBS:
+            raise ValueError(f"알 수 없는 크롤링 작업: {name} (가능: {', '.join(JOBS)})")
+        if every:
+            unit = every[-1] if every[-1] in UNITS else "s"
+            schedule[name] = float(every.rstrip("".join(UNITS))) * UNITS[unit]
+        else:
+            schedule[name] = JOBS[name].interval
+    return schedule
+
+
+class CrawlScheduler:
+    def __init__(self, schedule: Dict[str, float]):
+        self.schedule = schedule
+        self._task: Optional[asyncio.Task] = None
+        self.last_results: Dict[str, Dict] = {}
+
+    def next_due(self, name: str, out_dir: str) -> float:
+        path = state_path(name, out_dir)
+        if not os.path.exists(path):
+            return 0.0
+        queue = TaskQueue(path)
+        try:
+            finished = queue.last_finished_at()
+        finally:
+            queue.close()
+        return (finished or 0.0) + self.schedule[name]
+
+    async def _rebuild(self, name: str, out_dir: str, options: Dict) -> Optional[int]:
+        """파일 sink 결과 CSV 로 서빙 데이터셋 다시 빌드 (빌드는 동기 작업이라 스레드에서). 대상이 없으면 None"""
+        if options.get("sink", CRAWL_SINK) != "file" or "csv" not in options.get("formats", CRAWL_FORMATS):
+            return None
+        if not JOBS[name].datasets:
+            return None
+        code = await asyncio.to_thread(rebuild, [name], out_dir)
+        if code == 0:
+            logger.info("📦 서빙 데이터셋 다시 빌드 (%s): %s", name, JOBS[name].datasets)
+        else:
+            logger.error("❌ 서빙 데이터셋 빌드 실패 (%s): 종료 코드 %d", name, code)
+        return code
+
+    async def run_forever(self, out_dir: str = CRAWL_OUTPUT_DIR, **options):
+        if not self.schedule:
+            raise RuntimeError("CRAWL_SCHEDULE 미설정 (예: sales_composition:7d,domestic_export:30d)")
+        logger.info("🗓️ 크롤링 스케줄: %s", {name: f"{every / 86400:g}d" for name, every in self.schedule.items()})
+        while True:
+            for name in self.schedule:
+                if self.next_due(name, out_dir) > time.time():
+                    continue
+                try:
+                    self.last_results[name] = await run_job(name, out_dir=out_dir, **options)
+                    logger.info("🕷️ 예약 크롤링 완료 (%s): %s", name, self.last_results[name]["processed"])
+                    self.last_results[name]["build"] = await self._rebuild(name, out_dir, options)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    logger.error("❌ 예약 크롤링 실패 (%s): %s", name, e)
+                    self.last_results[name] = {"job": name, "error": str(e)}
+            wait = min(self.next_due(name, out_dir) for name in self.schedule) - time.time()
+            await asyncio.sleep(min(max(wait, 60.0), MAX_SLEEP))
+
+    def start(self):
+        if not self.schedule:
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run_forever())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+# 인스턴스 (앱/CLI에서 import)
+crawl_scheduler = CrawlScheduler(parse_schedule(SCHEDULE))
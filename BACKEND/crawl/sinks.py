@@ -0,0 +1,133 @@
+"""
+크롤링 결과 저장.
+
+- FileSink:  작업 단위마다 <출력>.parts/<key>.csv (임시 파일 → rename), 회차 끝에 시드 순서대로 한 파일씩
+             읽어 <출력>.parquet / <출력>.csv 로 합친다 (컬럼은 합집합, 값은 문자열).
+             CSV는 pipeline.build 가 읽는 원본 파일명과 같게 둔다.
+- MongoSink: 행 문서({_task, _crawled_at, ...컬럼})를 모아 bulk_write (작업 단위별로 기존 행 삭제 후 삽입)
+
+write/remove 는 작업 단위 하나가 끝날 때마다, finalize 는 회차가 끝날 때 호출된다.
+has 는 내용이 바뀌지 않은 작업 단위를 건너뛰기 전에 이전 결과가 실제로 남아 있는지 확인한다.
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Dict, List, Sequence
+
+import pandas as pd
+from pymongo import DeleteMany, InsertOne
+
+from utils.database import db_manager
+
+try:
+    import pyarrow as pa  # requirements 에 포함. 없는 환경에서는 기본 출력이 CSV만
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover
+    pa = pq = None
+
+logger = logging.getLogger("crawl.sinks")
+
+CRAWL_OUTPUT_DIR = os.getenv("CRAWL_OUTPUT_DIR",
+                             os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "crawl_output"))
+MONGO_BULK_SIZE = int(os.getenv("CRAWL_MONGO_BULK_SIZE", "1000"))
+DEFAULT_FORMATS = ("parquet", "csv") if pa is not None else ("csv",)
+
+
+class FileSink:
+    def __init__(self, out_dir: str, name: str, formats: Sequence[str] = DEFAULT_FORMATS):
+        if "parquet" in formats and pa is None:
+            raise RuntimeError("parquet 출력에는 pyarrow 필요 (pip install pyarrow) - CSV만 쓰려면 --format csv")
+        self.out_dir = out_dir
+        self.name = name
+        self.formats = tuple(formats)
+        self.parts_dir = os.path.join(out_dir, f"{name}.parts")
+        os.makedirs(self.parts_dir, exist_ok=True)
+
+    def _part(self, key: str) -> str:
+        return os.path.join(self.parts_dir, f"{key}.csv")
+
+    async def has(self, key: str) -> bool:
+        return os.path.exists(self._part(key))
+
+    async def write(self, key: str, df: pd.DataFrame):
+        tmp = self._part(key) + ".tmp"
+        df.to_csv(tmp, index=False, encoding="utf-8")
+        os.replace(tmp, self._part(key))
+
+    async def remove(self, key: str):
+        if os.path.exists(self._part(key)):
+            os.remove(self._part(key))
+
+    async def finalize(self, keys: Sequence[str]) -> Dict[str, str]:
+        return await asyncio.to_thread(self._merge, list(keys))
+
+    def _merge(self, keys: List[str]) -> Dict[str, str]:
+        parts = [p for p in map(self._part, keys) if os.path.exists(p)]
+        columns = list(dict.fromkeys(c for p in parts for c in pd.read_csv(p, nrows=0).columns))
+        outputs = {fmt: os.path.join(self.out_dir, f"{self.name}.{fmt}") for fmt in self.formats}
+        csv_file = writer = None
+        try:
+            if "csv" in outputs:
+                csv_file = open(outputs["csv"] + ".tmp", "w", encoding="utf-8-sig", newline="")
+            if "parquet" in outputs:
+                schema = pa.schema([(c, pa.string()) for c in columns])
+                writer = pq.ParquetWriter(outputs["parquet"] + ".tmp", schema, compression="zstd")
+            for i, part in enumerate(parts):  # 한 번에 작업 단위 하나만 메모리에
+                df = pd.read_csv(part, dtype=str).reindex(columns=columns)
+                if csv_file is not None:
+                    df.to_csv(csv_file, index=False, header=(i == 0))
+                if writer is not None:
+                    writer.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False))
+        finally:
+            if csv_file is not None:
+                csv_file.close()
+            if writer is not None:
+                writer.close()
+        for path in outputs.values():
+            os.replace(path + ".tmp", path)
+        return outputs
+
+    def reset(self):
+        for entry in os.listdir(self.parts_dir):
+            os.remove(os.path.join(self.parts_dir, entry))
+
+
+class MongoSink:
+    def __init__(self, collection_name: str, bulk_size: int = MONGO_BULK_SIZE):
+        if not db_manager.is_connected():
+            raise RuntimeError("MongoDB 미연결 - MONGODB_URI 확인")
+        self.collection_name = collection_name
+        self.bulk_size = bulk_size
+        self._operations: List = []
+
+    async def has(self, key: str) -> bool:
+        """버퍼만 쌓인 채 중단됐을 수 있으므로 컬렉션에서 확인"""
+        collection = db_manager.get_collection(self.collection_name)
+        return await asyncio.to_thread(collection.find_one, {"_task": key}, {"_id": 1}) is not None
+
+    async def write(self, key: str, df: pd.DataFrame):
+        now = time.time()
+        records = df.astype(object).where(df.notna(), None).to_dict("records")
+        self._operations.append(DeleteMany({"_task": key}))
+        self._operations.extend(InsertOne({"_task": key, "_crawled_at": now, **r}) for r in records)
+        if len(self._operations) >= self.bulk_size:
+            await self._flush()
+
+    async def remove(self, key: str):
+        self._operations.append(DeleteMany({"_task": key}))
+
+    async def _flush(self):
+        operations, self._operations = self._operations, []
+        if operations:
+            collection = db_manager.get_collection(self.collection_name)
+            await asyncio.to_thread(collection.bulk_write, operations, ordered=True)
+
+    async def finalize(self, keys: Sequence[str]) -> Dict[str, str]:
+        await self._flush()
+        collection = db_manager.get_collection(self.collection_name)
+        await asyncio.to_thread(collection.create_index, "_task")
+        return {"mongo": self.collection_name}
+
+    def reset(self):
+        db_manager.get_collection(self.collection_name).delete_many({})
@@ -0,0 +1,180 @@
+"""
+작업 단위 큐 (SQLite, 작업마다 파일 하나).
+
+    tasks: key(기업 등) · seq(시드 순서) · url · meta · status · attempts · next_at
+           · hash(마지막으로 저장한 표 내용) · etag · last_modified · rows · error
+    runs:  실행 기록 (시작/종료 시각, 결과 집계) - 스케줄러가 다음 실행 시각 계산에 사용
+
+status: pending → running → done | empty | failed (재시도 한도 초과)
+한 회차(round)가 끝나기 전에 중단되면 다음 실행은 남은 작업만 처리하고,
+회차가 끝난 뒤 실행하면 모든 작업을 pending 으로 되돌려 새 회차를 시작한다 (hash/ETag는 유지).
+호출은 이벤트 루프 스레드에서만 하며, 쿼리가 짧아 스레드로 넘기지 않는다.
+"""
+import json
+import os
+import sqlite3
+import time
+from typing import Dict, Iterable, List, Optional
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS tasks (
+    key TEXT PRIMARY KEY,
+    seq INTEGER NOT NULL,
+    url TEXT NOT NULL,
+    meta TEXT NOT NULL DEFAULT '{}',
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_at REAL NOT NULL DEFAULT 0,
+    hash TEXT,
+    etag TEXT,
+    last_modified TEXT,
+    rows INTEGER,
+    error TEXT,
+    updated_at REAL
+);
+CREATE INDEX IF NOT EXISTS tasks_ready ON tasks (status, next_at, seq);
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at REAL NOT NULL,
+    finished_at REAL,
+    counts TEXT
+);
+"""
+
+
+class Task:
+    """작업 단위 하나 (큐에 저장된 이전 결과 포함)"""
+
+    def __init__(self, key: str, url: str, meta: Optional[Dict] = None, hash: Optional[str] = None,
+                 etag: Optional[str] = None, last_modified: Optional[str] = None, attempts: int = 0):
+        self.key = key
+        self.url = url
+        self.meta = meta or {}
+        self.hash = hash
+        self.etag = etag
+        self.last_modified = last_modified
+        self.attempts = attempts
+
+    def __repr__(self):
+        return f"Task({self.key!r})"
+
+
+class TaskQueue:
+    def __init__(self, path: str):
+        self.path = path
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        self._db = sqlite3.connect(path, isolation_level=None)  # autocommit
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.executescript(SCHEMA)
+
+    def close(self):
+        self._db.close()
+
+    # ------------------------------------------------------------ 회차
+
+    def sync(self, tasks: Iterable[Task]) -> int:
+        """
+        시드 반영: 새 작업은 추가, 기존 작업은 url/meta/순서만 갱신 (상태 유지).
+        시드에 없는 작업(상장폐지 등)은 삭제. 삭제한 수 반환
+        """
+        rows = [(t.key, seq, t.url, json.dumps(t.meta, ensure_ascii=False)) for seq, t in enumerate(tasks)]
+        self._db.execute("BEGIN")
+        try:
+            self._db.execute("CREATE TEMP TABLE IF NOT EXISTS seed_keys (key TEXT PRIMARY KEY)")
+            self._db.execute("DELETE FROM seed_keys")
+            self._db.executemany("INSERT OR IGNORE INTO seed_keys VALUES (?)", [(r[0],) for r in rows])
+            removed = self._db.execute("DELETE FROM tasks WHERE key NOT IN (SELECT key FROM seed_keys)").rowcount
+            self._db.executemany(
+                "INSERT INTO tasks (key, seq, url, meta) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET seq=excluded.seq, url=excluded.url, meta=excluded.meta",
+                rows,
+            )
+        except BaseException:
+            self._db.execute("ROLLBACK")
+            raise
+        self._db.execute("COMMIT")
+        return removed
+
+    def recover(self) -> int:
+        """이전 실행이 중단되어 running 으로 남은 작업을 pending 으로"""
+        return self._db.execute("UPDATE tasks SET status='pending' WHERE status='running'").rowcount
+
+    def has_unfinished(self) -> bool:
+        return self._db.execute("SELECT 1 FROM tasks WHERE status IN ('pending', 'running') LIMIT 1").fetchone() \
+            is not None
+
+    def new_round(self):
+        self._db.execute("UPDATE tasks SET status='pending', attempts=0, next_at=0, error=NULL")
+
+    def forget_content(self):
+        """저장된 해시/검증자 삭제 (다음 회차에서 모두 다시 파싱)"""
+        self._db.execute("UPDATE tasks SET hash=NULL, etag=NULL, last_modified=NULL")
+
+    # ------------------------------------------------------------ 작업
+
+    def claim(self, now: Optional[float] = None) -> Optional[Task]:
+        now = time.time() if now is None else now
+        row = self._db.execute(
+            "SELECT * FROM tasks WHERE status='pending' AND next_at<=? ORDER BY seq LIMIT 1", (now,)
+        ).fetchone()
+        if row is None:
+            return None
+        self._db.execute("UPDATE tasks SET status='running', updated_at=? WHERE key=?", (now, row["key"]))
+        return Task(row["key"], row["url"], json.loads(row["meta"]), row["hash"], row["etag"],
+                    row["last_modified"], row["attempts"])
+
+    def next_retry_at(self) -> Optional[float]:
+        """재시도 대기 중인 작업의 가장 이른 시각 (대기 중인 작업이 없으면 None)"""
+        row = self._db.execute("SELECT MIN(next_at) FROM tasks WHERE status='pending'").fetchone()
+        return row[0]
+
+    def finish(self, task: Task, status: str, **fields):
+        """status: done | empty. fields: hash, etag, last_modified, rows 중 바뀐 값"""
+        columns = {k: v for k, v in fields.items() if k in ("hash", "etag", "last_modified", "rows")}
+        assignments = "".join(f", {k}=?" for k in columns)
+        self._db.execute(
+            f"UPDATE tasks SET status=?, error=NULL, updated_at=?{assignments} WHERE key=?",
+            (status, time.time(), *columns.values(), task.key),
+        )
+
+    def retry(self, task: Task, error: str, max_attempts: int, backoff: float) -> bool:
+        """실패 기록. 한도 안이면 지수 백오프 후 재시도(True), 넘으면 failed(False)"""
+        attempts = task.attempts + 1
+        retry = attempts < max_attempts
+        self._db.execute(
+            "UPDATE tasks SET status=?, attempts=?, next_at=?, error=?, updated_at=? WHERE key=?",
+            ("pending" if retry else "failed", attempts,
+             time.time() + backoff * 2 ** (attempts - 1) if retry else 0, error[:500], time.time(), task.key),
+        )
+        return retry
+
+    # ------------------------------------------------------------ 조회
+
+    def ordered_keys(self) -> List[str]:
+        return [r[0] for r in self._db.execute("SELECT key FROM tasks ORDER BY seq")]
+
+    def counts(self) -> Dict[str, int]:
+        return dict(self._db.execute("SELECT status, COUNT(*) FROM tasks GROUP BY status").fetchall())
+
+    def failures(self, limit: int = 10) -> List[Dict]:
+        rows = self._db.execute(
+            "SELECT key, attempts, error FROM tasks WHERE status='failed' ORDER BY seq LIMIT ?", (limit,)
+        )
+        return [dict(r) for r in rows]
+
+    def start_run(self) -> int:
+        return self._db.execute("INSERT INTO runs (started_at) VALUES (?)", (time.time(),)).lastrowid
+
+    def finish_run(self, run_id: int, counts: Dict[str, int]):
+        self._db.execute("UPDATE runs SET finished_at=?, counts=? WHERE id=?",
+                         (time.time(), json.dumps(counts), run_id))
+
+    def last_run(self) -> Optional[Dict]:
+        row = self._db.execute("SELECT * FROM runs ORDER BY id DESC LIMIT 1").fetchone()
+        if row is None:
+            return None
+        return {**dict(row), "counts": json.loads(row["counts"]) if row["counts"] else None}
+
+    def last_finished_at(self) -> Optional[float]:
+        return self._db.execute("SELECT MAX(finished_at) FROM runs").fetchone()[0]
@@ -141,6 +141,18 @@ def create_app() -> FastAPI:
                 },
             )
 
+    @app.get("/health/caches")
+    async def cache_stats():
+        """캐시별 항목 수/바이트/적중률/축출 수"""
+        from utils.cache import cache_registry
+        return cache_registry.stats()
+
+    @app.get("/health/breakers")
+    async def breaker_stats():
+        """업스트림별 회로 차단기 상태 (closed/open/half_open, 실패율, 재시도까지 남은 초)"""
+        from utils.circuit_breaker import breakers
+        return breakers.stats()
+
     # -------------------------------------------------
     # 라우터 연결
     # -------------------------------------------------
@@ -151,7 +163,7 @@ def create_app() -> FastAPI:
     app.include_router(investor.router, prefix="/api/v1/investor")
 
     # -------------------------------------------------
-    # 데이터베이스 연결 (startup 이벤트)
+    # 데이터베이스 연결 / WebDriver 풀 / 뉴스 갱신 (startup, shutdown 이벤트)
     # -------------------------------------------------
     @app.on_event("startup")
     async def startup_event():
@@ -163,6 +175,61 @@ def create_app() -> FastAPI:
             logger.error("❌ 데이터베이스 연결 실패: %s", e)
             # 연결 실패해도 서버는 시작 (폴백 데이터 사용)
 
+        try:
+            from utils.selenium_utils import driver_pool
+            await driver_pool.start()  # pre-warm은 백그라운드에서 진행
+        except Exception as e:
+            logger.error("❌ WebDriver 풀 초기화 실패: %s", e)
+
+        try:
+            from services.news_service import news_service  # noqa: F401 (핫 피드 등록)
+            from services.news_cache import news_cache
+            news_cache.start()
+        except Exception as e:
+            logger.error("❌ 뉴스 백그라운드 갱신 시작 실패: %s", e)
+
+        try:
+            from services.news_ingest import news_ingestor
+            news_ingestor.start()  # MongoDB 연결된 경우에만
+        except Exception as e:
+            logger.error("❌ 뉴스 수집 워커 시작 실패: %s", e)
+
+        if os.getenv("CRAWL_SCHEDULE"):
+            try:
+                from crawl.schedule import crawl_scheduler
+                crawl_scheduler.start()
+            except Exception as e:
+                logger.error("❌ 크롤링 스케줄러 시작 실패: %s", e)
+
+    @app.on_event("shutdown")
+    async def shutdown_event():
+        if os.getenv("CRAWL_SCHEDULE"):
+            try:
+                from crawl.schedule import crawl_scheduler
+                await crawl_scheduler.stop()
+            except Exception as e:
+                logger.error("❌ 크롤링 스케줄러 종료 실패: %s", e)
+        try:
+            from services.news_ingest import news_ingestor
+            await news_ingestor.stop()
+        except Exception as e:
+            logger.error("❌ 뉴스 수집 워커 종료 실패: %s", e)
+        try:
+            from services.news_cache import news_cache
+            await news_cache.stop()
+        except Exception as e:
+            logger.error("❌ 뉴스 백그라운드 갱신 종료 실패: %s", e)
+        try:
+            from utils.selenium_utils import driver_pool
+            await driver_pool.close()
+        except Exception as e:
+            logger.error("❌ WebDriver 풀 종료 실패: %s", e)
+        try:
+            from utils.scraper import scrape_engine
+            await scrape_engine.close()
+        except Exception as e:
+            logger.error("❌ HTTP 세션 종료 실패: %s", e)
+
     logger.info("✅ 앱 초기화 완료")
     return app
 
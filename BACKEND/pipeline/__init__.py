@@ -0,0 +1 @@
+"""원본 데이터 → 서빙 아티팩트 오프라인 빌드 파이프라인 (python -m pipeline.build)"""
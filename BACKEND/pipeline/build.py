@@ -0,0 +1,235 @@
+"""
+서빙 아티팩트 빌드 CLI.
+
+    cd BACKEND
+    python -m pipeline.build                         # crawl_output + BACKEND + ../코드 에서 원본 탐색 → artifacts/
+    python -m pipeline.build --raw-dir /data/crawl   # 크롤링 결과 디렉토리 추가 (우선 탐색)
+    python -m pipeline.build --dry-run               # 검증만
+    python -m pipeline.build --verify                # 현재 매니페스트 체크섬 확인
+
+데이터셋마다 원본을 읽어 스키마 검증/정규화한 뒤 utils.snapshot 형식(컬럼 배열 + 문자열 테이블
++ 인덱스용 범위)으로 쓰고, /data/* 응답 본문(identity/gzip/br)도 미리 만들어 둔다.
+모든 파일의 sha256과 입력 파일 정보를 manifest.json에 기록하며, 서버(utils.artifacts)는
+매니페스트에 있는 데이터셋을 원본 파싱 없이 아티팩트에서 바로 매핑한다.
+"""
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+from crawl.sinks import CRAWL_OUTPUT_DIR  # noqa: E402
+from pipeline.sources import (  # noqa: E402
+    BuildReport,
+    SchemaError,
+    read_financial_metrics,
+    read_industry_explain,
+    read_industry_metrics,
+    read_sales_chart,
+    read_sales_composition,
+    read_shareholders,
+)
+from services.financial_metrics_service import DATASET as FINANCIAL_METRICS_DATASET  # noqa: E402
+from services.financial_metrics_service import metrics_snapshot_parts  # noqa: E402
+from services.metrics_cube import INDUSTRY_DATASET  # noqa: E402
+from services.sales_composition_service import DATASET as SALES_DATASET  # noqa: E402
+from services.sales_composition_service import sales_snapshot_parts  # noqa: E402
+from services.shareholder_service import DATASET as SHAREHOLDER_DATASET  # noqa: E402
+from services.shareholder_service import shareholder_snapshot_parts  # noqa: E402
+from services.ticker_resolver import UNIVERSE_DATASET  # noqa: E402
+from utils.artifacts import (  # noqa: E402
+    ARTIFACT_DIR,
+    MANIFEST_NAME,
+    ArtifactStore,
+    describe_files,
+    file_checksum,
+    prune_builds,
+    write_manifest,
+)
+from utils.snapshot import write_snapshot  # noqa: E402
+from utils.static_response import encode_payload  # noqa: E402
+
+logger = logging.getLogger("pipeline.build")
+
+MANIFEST_VERSION = 1
+INDUSTRY_EXPLAIN_DATASET = "industry_explain"  # services.stock_service 와 동일
+# 크롤링 결과(python -m crawl.run)가 있으면 저장소에 들어 있는 CSV보다 먼저 사용
+DEFAULT_RAW_DIRS = [CRAWL_OUTPUT_DIR, BACKEND_DIR, os.path.join(os.path.dirname(BACKEND_DIR), "코드")]
+
+
+class DatasetSpec:
+    """
+    빌드 대상 데이터셋.
+    inputs: 우선순위 순 후보 파일명 (크롤링 원본 → 가공본)
+    parts: 정규화 데이터 → 스냅샷 구성요소. None이면 JSON 본문 블롭으로 저장
+    payload: /data/* 응답 본문을 함께 빌드할지 여부
+    """
+
+    def __init__(self, name: str, inputs: List[str], reader: Callable[[str, BuildReport], Any],
+                 parts: Optional[Callable[[Any], Dict]] = None, payload: bool = False):
+        self.name = name
+        self.inputs = inputs
+        self.reader = reader
+        self.parts = parts
+        self.payload = payload
+
+
+DATASETS = [
+    DatasetSpec(FINANCIAL_METRICS_DATASET, ["기업별_재무지표.json"], read_financial_metrics,
+                parts=metrics_snapshot_parts, payload=True),
+    DatasetSpec(INDUSTRY_DATASET, ["industry_metrics.json"], read_industry_metrics, payload=True),
+    DatasetSpec(SHAREHOLDER_DATASET, ["코스피_주주구분현황_전체.csv", "지분현황.json"], read_shareholders,
+                parts=shareholder_snapshot_parts, payload=True),
+    DatasetSpec(UNIVERSE_DATASET, ["코스피_매출비중추이_전체.csv", "매출비중_chartjs_데이터.json"],
+                read_sales_chart, payload=True),
+    DatasetSpec(SALES_DATASET, ["NICE_내수수출_코스피전체.csv", "NICE_내수수출_코스피.csv"],
+                read_sales_composition, parts=sales_snapshot_parts),
+    DatasetSpec(INDUSTRY_EXPLAIN_DATASET, ["산업별설명.json"], read_industry_explain),
+]
+
+
+def find_input(spec: DatasetSpec, raw_dirs: List[str]) -> Optional[str]:
+    for filename in spec.inputs:
+        for directory in raw_dirs:
+            path = os.path.join(directory, filename)
+            if os.path.exists(path):
+                return path
+    return None
+
+
+def _row_count(data) -> int:
+    return len(data.index) if hasattr(data, "index") and hasattr(data, "columns") else len(data)
+
+
+def _cross_check(built: Dict[str, Any], reports: Dict[str, BuildReport]):
+    """데이터셋 간 기업명 일관성 (산업 소속 기업이 재무지표에 있는지 등)"""
+    metrics = built.get(FINANCIAL_METRICS_DATASET)
+    industries = built.get(INDUSTRY_DATASET)
+    if metrics is not None and industries is not None:
+        missing = {n for v in industries.values() for n in v["companies"]} - set(metrics)
+        if missing:
+            reports[INDUSTRY_DATASET].warn(f"재무지표에 없는 산업 소속 기업 {len(missing)}개")
+
+
+def build(raw_dirs: List[str], out_dir: str, only: Optional[List[str]] = None,
+          dry_run: bool = False, keep: int = 2) -> Dict:
+    specs = [s for s in DATASETS if not only or s.name in only]
+    # 같은 초에 시작한 빌드끼리 디렉토리가 겹치지 않도록 pid + 임의 접미사
+    build_id = f"{time.strftime('%Y%m%dT%H%M%S')}-{os.getpid()}-{uuid.uuid4().hex[:6]}"
+    build_dir = os.path.join(out_dir, build_id)
+
+    built, reports, entries = {}, {}, {}
+    for spec in specs:
+        path = find_input(spec, raw_dirs)
+        if path is None:
+            raise SchemaError(f"{spec.name}: 입력 파일 없음 ({', '.join(spec.inputs)})")
+        report = reports[spec.name] = BuildReport(spec.name)
+        started = time.perf_counter()
+        data = built[spec.name] = spec.reader(path, report)
+        entries[spec.name] = {
+            "rows": _row_count(data),
+            "input": {"path": os.path.relpath(path, BACKEND_DIR), "sha256": file_checksum(path),
+                      "bytes": os.path.getsize(path)},
+            "read_ms": round((time.perf_counter() - started) * 1000, 1),
+        }
+    _cross_check(built, reports)
+
+    if dry_run:
+        return {name: {**entry, **reports[name].to_dict()} for name, entry in entries.items()}
+
+    os.makedirs(build_dir)
+    datasets = {}
+    for spec in specs:
+        data, path = built[spec.name], entries[spec.name]["input"]["path"]
+        source = os.path.join(BACKEND_DIR, path)
+        if spec.parts is not None:
+            parts = spec.parts(data)
+        else:
+            parts = {"blobs": {"data": json.dumps(data, ensure_ascii=False).encode("utf-8")}}
+        targets = [(spec.name, parts)]
+        if spec.payload:
+            targets.append((f"{spec.name}.payload", encode_payload(data)))
+
+        for name, snapshot_parts in targets:
+            directory = write_snapshot(name, source, snapshot_dir=build_dir, **snapshot_parts)
+            datasets[name] = {
+                "dir": os.path.relpath(directory, out_dir).replace(os.sep, "/"),
+                "files": describe_files(directory),
+                **entries[spec.name],
+                **reports[spec.name].to_dict(),
+            }
+
+    # 기존 매니페스트의 다른 데이터셋(--only 빌드 시)은 유지
+    previous = ArtifactStore(out_dir, verify=False).manifest() or {}
+    merged = {**previous.get("datasets", {}), **datasets} if only else datasets
+    manifest = {
+        "format_version": MANIFEST_VERSION,
+        "build_id": build_id,
+        "built_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "datasets": merged,
+    }
+    write_manifest(out_dir, manifest)
+    prune_builds(out_dir, manifest, keep=keep)
+    return datasets
+
+
+def verify(out_dir: str) -> List[str]:
+    """매니페스트의 모든 아티팩트 체크섬 확인. 실패한 데이터셋 목록 반환"""
+    store = ArtifactStore(out_dir, verify=True)
+    manifest = store.manifest()
+    if manifest is None:
+        return [MANIFEST_NAME]
+    failed = []
+    for name in manifest.get("datasets", {}):
+        try:
+            store.open(name)
+        except (OSError, ValueError) as e:
+            logger.error("❌ %s: %s", name, e)
+            failed.append(name)
+    return failed
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="서빙 아티팩트 빌드")
+    parser.add_argument("--raw-dir", action="append", default=[],
+                        help="원본(크롤링 결과) 디렉토리. 여러 번 지정 가능, 기본 경로보다 우선")
+    parser.add_argument("--out", default=ARTIFACT_DIR, help="아티팩트 출력 디렉토리")
+    parser.add_argument("--only", nargs="+", choices=[s.name for s in DATASETS], help="일부 데이터셋만 빌드")
+    parser.add_argument("--keep", type=int, default=2,
+                        help="보관할 빌드 개수 (현재 매니페스트가 참조하는 빌드는 항상 보관)")
+    parser.add_argument("--dry-run", action="store_true", help="검증만 하고 쓰지 않음")
+    parser.add_argument("--verify", action="store_true", help="현재 매니페스트 체크섬 확인")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+
+    if args.verify:
+        failed = verify(args.out)
+        print("✅ 아티팩트 검증 통과" if not failed else f"❌ 검증 실패: {', '.join(failed)}")
+        return 1 if failed else 0
+
+    try:
+        result = build(args.raw_dir + DEFAULT_RAW_DIRS, args.out, args.only, args.dry_run, args.keep)
+    except SchemaError as e:
+        logger.error("❌ 스키마 오류: %s", e)
+        return 2
+
+    for name, entry in result.items():
+        size = sum(f["bytes"] for f in entry.get("files", {}).values())
+        dropped = sum(entry["dropped"].values())
+        print(f"  {name:<28} rows={entry['rows']:<6} dropped={dropped:<4} "
+              f"warnings={len(entry['warnings'])} size={size / 1e6:.2f}MB  ← {entry['input']['path']}")
+        for warning in entry["warnings"]:
+            print(f"      ⚠️ {warning}")
+    print("📁 검증 완료 (dry-run)" if args.dry_run else f"📁 저장 완료: {args.out}/{MANIFEST_NAME}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,251 @@
+"""
+원본(크롤링 결과 CSV / 가공 JSON) 읽기 + 스키마 검증 + 정규화.
+
+각 reader는 (경로, BuildReport)를 받아 서버가 쓰는 형태의 정규화된 데이터를 반환한다.
+복구할 수 없는 스키마 오류는 SchemaError, 버릴 수 있는 행은 report에 사유별로 기록한다.
+"""
+import json
+import math
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Optional
+
+import pandas as pd
+
+from utils.ticker_utils import normalize_company_name, normalize_ticker, to_gicode
+
+YEAR_KEY = re.compile(r"^\d{4}$")
+SALES_YEAR_COLUMN = re.compile(r"^\d{4}_\d{2} 매출액$")
+PERIOD_COLUMN = re.compile(r"^(\d{4})/(\d{2})$")
+KNOWN_SALES_TYPES = {"내수", "수출", "로컬", "미분류", "비중"}
+
+
+class SchemaError(ValueError):
+    """원본 파일 스키마 오류 (빌드 중단)"""
+
+
+class BuildReport:
+    """데이터셋 하나의 검증 결과 (버린 행 수, 경고)"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.dropped: Counter = Counter()
+        self.warnings: List[str] = []
+
+    def drop(self, reason: str, count: int = 1):
+        if count:
+            self.dropped[reason] += count
+
+    def warn(self, message: str):
+        self.warnings.append(message)
+
+    def to_dict(self) -> Dict:
+        return {"dropped": dict(self.dropped), "warnings": self.warnings}
+
+
+def _require(condition: bool, message: str):
+    if not condition:
+        raise SchemaError(message)
+
+
+def _require_columns(df: pd.DataFrame, columns: Iterable[str], path: str):
+    missing = [c for c in columns if c not in df.columns]
+    _require(not missing, f"{path}: 필수 컬럼 없음 {missing}")
+
+
+def _load_json(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _number(value, where: str) -> Optional[float]:
+    """숫자 또는 null만 허용 (NaN은 null로)"""
+    if value is None:
+        return None
+    _require(isinstance(value, (int, float)) and not isinstance(value, bool),
+             f"{where}: 숫자가 아닌 값 {value!r}")
+    return None if math.isnan(value) else value
+
+
+def _metric_table(value, where: str) -> Dict[str, Optional[float]]:
+    _require(isinstance(value, dict), f"{where}: {{연도: 값}} 형식이 아님")
+    out = {}
+    for year, v in value.items():
+        _require(bool(YEAR_KEY.match(str(year))), f"{where}: 연도 키 형식 오류 {year!r}")
+        out[str(year)] = _number(v, f"{where}.{year}")
+    return out
+
+
+def read_financial_metrics(path: str, report: BuildReport) -> Dict:
+    """기업별_재무지표.json → {기업명: {지표: {연도: 값}}}"""
+    raw = _load_json(path)
+    _require(isinstance(raw, dict), f"{path}: 최상위가 객체가 아님")
+    out = {}
+    for name, metrics in raw.items():
+        key = normalize_company_name(name)
+        if not key:
+            report.drop("기업명 없음")
+            continue
+        if key in out:
+            report.drop("중복 기업명")
+            continue
+        _require(isinstance(metrics, dict), f"{path}: {name} 지표가 객체가 아님")
+        out[key] = {str(m): _metric_table(v, f"{name}.{m}") for m, v in metrics.items()}
+    return out
+
+
+def read_industry_metrics(path: str, report: BuildReport) -> Dict:
+    """industry_metrics.json → {산업: {지표: {연도: 값}, companies: [기업명]}}"""
+    raw = _load_json(path)
+    _require(isinstance(raw, dict), f"{path}: 최상위가 객체가 아님")
+    out = {}
+    for industry, body in raw.items():
+        _require(isinstance(body, dict), f"{path}: {industry} 값이 객체가 아님")
+        companies = body.get("companies", [])
+        _require(isinstance(companies, list), f"{path}: {industry}.companies 가 목록이 아님")
+        entry = {str(m): _metric_table(v, f"{industry}.{m}") for m, v in body.items() if m != "companies"}
+        names = [normalize_company_name(c) for c in companies]
+        report.drop("기업명 없음", sum(1 for n in names if not n))
+        entry["companies"] = list(dict.fromkeys(n for n in names if n))
+        out[normalize_company_name(industry)] = entry
+    return out
+
+
+def read_industry_explain(path: str, report: BuildReport) -> List[Dict]:
+    """산업별설명.json → [{industry, analysis}]"""
+    raw = _load_json(path)
+    _require(isinstance(raw, list), f"{path}: 최상위가 목록이 아님")
+    out = []
+    for item in raw:
+        _require(isinstance(item, dict) and "industry" in item, f"{path}: industry 키 없음")
+        out.append({**item, "industry": normalize_company_name(item["industry"])})
+    return out
+
+
+def read_shareholders(path: str, report: BuildReport) -> Dict[str, List[Dict]]:
+    """
+    주주구분 현황 → {A접두 종목코드: [{주주구분, 지분율, 대표주주수}]}
+    - CSV: 크롤링 원본 (코스피_주주구분현황_전체.csv). 지분율이 없는 주주구분 행은 제외
+    - JSON: 가공본 (지분현황.json)
+    """
+    if path.lower().endswith(".csv"):
+        df = pd.read_csv(path, encoding="utf-8-sig")
+        _require_columns(df, ["종목코드", "주주구분", "지분율"], path)
+        holders_col = next((c for c in ("대표 주주수", "대표주주수") if c in df.columns), None)
+        records = [
+            {"종목코드": row["종목코드"], "주주구분": row["주주구분"], "지분율": row["지분율"],
+             "대표주주수": row[holders_col] if holders_col else None}
+            for row in df.to_dict(orient="records")
+        ]
+    else:
+        raw = _load_json(path)
+        _require(isinstance(raw, dict), f"{path}: 최상위가 객체가 아님")
+        records = []
+        for code, items in raw.items():
+            _require(isinstance(items, list), f"{path}: {code} 값이 목록이 아님")
+            records.extend({"종목코드": code, **item} for item in items)
+
+    out: Dict[str, List[Dict]] = {}
+    for record in records:
+        code = to_gicode(record.get("종목코드"))
+        if not code:
+            report.drop("종목코드 형식 오류")
+            continue
+        ratio = pd.to_numeric(record.get("지분율"), errors="coerce")
+        if pd.isna(ratio):
+            report.drop("지분율 없음")
+            continue
+        if not 0 <= ratio <= 100:
+            report.drop("지분율 범위 오류")
+            continue
+        holders = pd.to_numeric(record.get("대표주주수"), errors="coerce")
+        out.setdefault(code, []).append({
+            "주주구분": str(record.get("주주구분") or ""),
+            "지분율": float(ratio),
+            "대표주주수": 1 if pd.isna(holders) else int(holders),
+        })
+    return out
+
+
+def read_sales_composition(path: str, report: BuildReport) -> pd.DataFrame:
+    """
+    NICE 내수/수출 CSV → 정규화된 프레임.
+    종목코드는 6자리 문자열, 종목명은 정규화. 연도별 매출액 컬럼은 원본 표기(비중 행의 '%') 유지.
+    """
+    df = pd.read_csv(path, encoding="utf-8-sig")
+    _require_columns(df, ["종목코드", "종목명", "구분"], path)
+    year_cols = [c for c in df.columns if SALES_YEAR_COLUMN.match(str(c))]
+    _require(bool(year_cols), f"{path}: 'YYYY_MM 매출액' 컬럼 없음")
+
+    df["종목코드"] = df["종목코드"].map(normalize_ticker)
+    df["종목명"] = df["종목명"].map(normalize_company_name)
+    invalid = df["종목코드"].isna() | df["종목명"].isna()
+    report.drop("종목코드/종목명 오류", int(invalid.sum()))
+    df = df[~invalid].reset_index(drop=True)
+
+    unknown = set(df["구분"].dropna().unique()) - KNOWN_SALES_TYPES
+    if unknown:
+        report.warn(f"알 수 없는 구분 값: {sorted(unknown)}")
+    return df
+
+
+def _chart_items(labels: List[str], values: List[float]) -> List[Dict]:
+    total = sum(values)
+    return [
+        {"label": label, "value": round(value, 2), "percentage": round(value / total * 100, 1)}
+        for label, value in zip(labels, values)
+    ]
+
+
+def read_sales_chart(path: str, report: BuildReport) -> List[Dict]:
+    """
+    제품별 매출비중 → [{종목코드(A접두), 종목명, data: [{label, value, percentage}]}]
+    - CSV: FnGuide 매출비중추이 크롤링 원본. 기업별로 값이 있는 가장 최근 연간(12월) 컬럼을 사용
+    - JSON: 가공본 (매출비중_chartjs_데이터.json)
+    """
+    out = []
+    if path.lower().endswith(".csv"):
+        df = pd.read_csv(path, encoding="utf-8-sig")
+        _require_columns(df, ["종목코드", "종목명"], path)
+        label_col = "제품명" if "제품명" in df.columns else df.columns[2]
+        annual = sorted(
+            (c for c in df.columns if PERIOD_COLUMN.match(str(c)) and str(c).endswith("/12")),
+            reverse=True,
+        )
+        _require(bool(annual), f"{path}: 'YYYY/12' 기간 컬럼 없음")
+        for code, group in df.groupby("종목코드", sort=False):
+            values = group[annual].apply(pd.to_numeric, errors="coerce")
+            latest = next((c for c in annual if values[c].notna().any()), None)
+            if latest is None:
+                report.drop("매출비중 값 없음")
+                continue
+            mask = values[latest] > 0
+            out.append({
+                "종목코드": code,
+                "종목명": group["종목명"].iloc[0],
+                "data": _chart_items(group.loc[mask, label_col].astype(str).tolist(),
+                                     values.loc[mask, latest].astype(float).tolist()),
+            })
+    else:
+        raw = _load_json(path)
+        _require(isinstance(raw, list), f"{path}: 최상위가 목록이 아님")
+        for item in raw:
+            _require(isinstance(item, dict) and isinstance(item.get("data"), list),
+                     f"{path}: data 목록 없음")
+            for point in item["data"]:
+                _require({"label", "value", "percentage"} <= set(point), f"{path}: data 항목 키 오류")
+            out.append(item)
+
+    normalized = []
+    seen = set()
+    for item in out:
+        code, name = to_gicode(item.get("종목코드")), normalize_company_name(item.get("종목명"))
+        if not code or not name:
+            report.drop("종목코드/종목명 오류")
+            continue
+        if code in seen:
+            report.drop("중복 종목코드")
+            continue
+        seen.add(code)
+        normalized.append({**item, "종목코드": code, "종목명": name})
+    return normalized
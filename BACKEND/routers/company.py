@@ -1,13 +1,21 @@
-import pandas as pd
-import os
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query, Request
 from fastapi.responses import JSONResponse
-import json
-from utils.selenium_utils import SeleniumManager
+from utils.selenium_utils import cancel_on_disconnect
 from services.company_service import CompanyService
 from services.stock_service import StockService
 from services.investor_service import InvestorService
-from typing import List, Dict
+from services.ticker_resolver import ticker_resolver, UNIVERSE_DATASET
+from services.shareholder_service import shareholder_service, RANKING_FIELDS, DATASET as SHAREHOLDER_DATASET
+from services.sales_composition_service import sales_composition_service
+from utils.static_response import precompressed_response, dataset_payload
+from utils.dataset_registry import dataset_registry
+from services.financial_metrics_service import financial_metrics_service, DATASET as FINANCIAL_METRICS_DATASET
+from services.metrics_cube import INDUSTRY_DATASET
+from services.export_analytics_service import export_analytics_service
+from services.company_news_service import company_news_service
+from services.news_service import news_service
+from services.news_ingest import news_ingestor
+from typing import List, Dict, Optional
 
 router = APIRouter(prefix="/company", tags=["기업 정보"])
 
@@ -15,10 +23,26 @@ router = APIRouter(prefix="/company", tags=["기업 정보"])
 company_service = CompanyService()
 stock_service = StockService()
 investor_service = InvestorService()
-selenium_manager = SeleniumManager()
 
-# CSV 파일 경로
-CSV_FILE_PATH = "NICE_내수수출_코스피.csv"
+# 일괄 조회 최대 기업 수
+BULK_MAX_COMPANIES = 50
+
+@router.get("/bulk")
+async def get_companies_bulk(names: str = Query(..., description="쉼표로 구분된 기업명 목록 (예: 삼성전자,SK하이닉스)")):
+    """여러 기업 데이터 일괄 조회 (컬렉션별 $in 쿼리 1회)"""
+    # 공백 제거 + 순서 유지 중복 제거
+    company_names = list(dict.fromkeys(n.strip() for n in names.split(",") if n.strip()))
+    if not company_names:
+        raise HTTPException(status_code=400, detail="기업명을 하나 이상 입력하세요")
+    if len(company_names) > BULK_MAX_COMPANIES:
+        raise HTTPException(status_code=400, detail=f"한 번에 최대 {BULK_MAX_COMPANIES}개 기업까지 조회할 수 있습니다")
+
+    try:
+        return company_service.get_companies_bulk(company_names)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"기업 일괄 조회 실패: {str(e)}")
 
 @router.get("/{name}")
 async def get_company_data(name: str):
@@ -80,107 +104,52 @@ async def get_company_info(company_name: str):
 
 @router.get("/company/{company_name}/sales-composition")
 async def get_company_sales_composition(company_name: str):
-    """기업별 매출 구성 데이터 조회 (CSV 파일에서)"""
+    """기업별 매출 구성 데이터 조회 (메모리에 적재된 CSV 인덱스에서)"""
     try:
-        if not os.path.exists(CSV_FILE_PATH):
+        if not sales_composition_service.is_available():
             raise HTTPException(status_code=404, detail="매출 구성 데이터 파일을 찾을 수 없습니다.")
         
-        # CSV 파일 읽기
-        df = pd.read_csv(CSV_FILE_PATH, encoding='utf-8')
+        # 기업명 인덱스 조회 (정확 일치 → 부분 일치)
+        result = sales_composition_service.get_by_name(company_name)
         
-        # 종목명으로 데이터 찾기
-        company_data = df[df['종목명'] == company_name]
-        
-        if company_data.empty:
-            # 정확한 매칭이 안되면 부분 매칭 시도
-            company_data = df[df['종목명'].str.contains(company_name, na=False)]
-        
-        if company_data.empty:
+        if not result:
             return {"message": "해당 기업의 매출 구성 데이터를 찾을 수 없습니다.", "data": []}
         
-        # 모든 매칭 데이터 반환 (리스트로)
-        result = company_data.to_dict(orient='records')
-        
         return {
             "message": "매출 구성 데이터 조회 성공",
             "data": result
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"매출 구성 데이터 조회 실패: {str(e)}")
 
 @router.get("/company/{company_name}/news")
-async def get_company_news(company_name: str):
-    """기업 관련 뉴스 크롤링"""
-    try:    
-        news_data = await selenium_manager.crawl_company_news(company_name)
-        return {"news": news_data}
+async def get_company_news(request: Request, company_name: str):
+    """기업 관련 뉴스 (네이버/다음 동시 검색, 중복 제거, 제한 시간 내 도착분만)"""
+    try:
+        news_ingestor.watch(company_name)  # 이후 주기 수집 대상 (저장소 이력)
+        return await cancel_on_disconnect(request, company_news_service.search(company_name))
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"뉴스 크롤링 실패: {str(e)}")
 
 @router.get("/company/{company_name}/analyst-report")
-async def get_analyst_report(company_name: str):
+async def get_analyst_report(request: Request, company_name: str):
     """애널리스트 리포트 크롤링"""
     try:
-        # 기업 정보에서 종목코드 가져오기
-        company_data = company_service.get_company_data(company_name)
-        if not company_data:
-            raise HTTPException(status_code=404, detail="기업을 찾을 수 없습니다.")
-        
-        종목코드 = company_data.get('종목코드')
+        # 캐시된 기업명 → 종목코드 매핑에서 종목코드만 조회 (적재/DB 확인은 스레드에서)
+        종목코드 = await ticker_resolver.resolve_async(company_name)
         if not 종목코드:
-            raise HTTPException(status_code=400, detail="종목코드 정보가 없습니다.")
-        
-        # fnguide.com에서 직접 크롤링
-        url = f"https://www.fnguide.com/SPV/SPV_1000.asp?gnb=1&gno={종목코드}"
-        
-        # 사용자 제공 로직 사용
-        def custom_scraping_logic(driver):
-            try:
-                # 페이지 로드 대기
-                from selenium.webdriver.support.ui import WebDriverWait
-                from selenium.webdriver.support import expected_conditions as EC
-                from selenium.webdriver.common.by import By
-                
-                wait = WebDriverWait(driver, 10)
-                
-                # 애널리스트 리포트 테이블 찾기
-                table = wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table.table_common")))
-                
-                # 테이블 데이터 파싱
-                rows = table.find_elements(By.CSS_SELECTOR, "tr")
-                reports = []
-                
-                for row in rows[1:]:  # 헤더 제외
-                    try:
-                        cells = row.find_elements(By.CSS_SELECTOR, "td")
-                        if len(cells) >= 4:
-                            date = cells[0].text.strip()
-                            title = cells[1].text.strip()
-                            analyst = cells[2].text.strip()
-                            target_price = cells[3].text.strip()
-                            
-                            if date and title:  # 유효한 데이터만
-                                reports.append({
-                                    "date": date,
-                                    "title": title,
-                                    "analyst": analyst,
-                                    "target_price": target_price,
-                                    "summary": f"{title} - {analyst} 분석"
-                                })
-                    except Exception as e:
-                        continue
-                
-                return {"reports": reports}
-                
-            except Exception as e:
-                return {"reports": [], "error": str(e)}
+            raise HTTPException(status_code=404, detail="기업을 찾을 수 없습니다.")
         
-        # Selenium으로 크롤링 실행
-        result = await selenium_manager.scrape_with_custom_logic(url, custom_scraping_logic)
+        # fnguide.com에서 직접 크롤링 (HTTP 우선, 필요 시 Selenium)
+        result = await cancel_on_disconnect(request, news_service.get_company_reports(종목코드))
         
         return result
         
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"애널리스트 리포트 크롤링 실패: {str(e)}")
 
@@ -206,45 +175,165 @@ async def get_company_financial_indicators(company_name: str):
 
 # 추가 API 엔드포인트들
 @router.get("/data/shareholder-data")
-async def get_shareholder_data():
+async def get_shareholder_data(request: Request):
     """지분현황 JSON 데이터"""
     try:
-        with open("BACKEND/지분현황.json", "r", encoding="utf-8") as f:
-            return json.load(f)
+        return precompressed_response(request, dataset_payload(SHAREHOLDER_DATASET))
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="지분현황 파일을 찾을 수 없습니다")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"지분현황 데이터 로드 실패: {str(e)}")
 
+@router.get("/data/shareholders/ranking")
+async def get_shareholder_ranking(
+    sort_by: str = Query("largest_holder", description=f"정렬 기준 ({', '.join(RANKING_FIELDS)})"),
+    order: str = Query("desc", pattern="^(asc|desc)$", description="정렬 순서"),
+    limit: int = Query(50, ge=1, le=1000, description="최대 반환 개수"),
+):
+    """지분 집중도 지표 기준 기업 랭킹"""
+    if sort_by not in RANKING_FIELDS:
+        raise HTTPException(status_code=400, detail=f"정렬 기준은 {', '.join(RANKING_FIELDS)} 중 하나여야 합니다")
+    try:
+        await ticker_resolver.refresh()  # 기업명 매핑 적재는 이벤트 루프 밖에서
+        return shareholder_service.get_ranking(sort_by=sort_by, descending=(order == "desc"), limit=limit)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="지분현황 파일을 찾을 수 없습니다")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"지분 랭킹 조회 실패: {str(e)}")
+
+@router.get("/data/shareholders/{code}")
+async def get_shareholder_concentration(code: str):
+    """종목코드별 지분 구성 및 집중도 지표"""
+    try:
+        await ticker_resolver.refresh()
+        result = shareholder_service.get_concentration(code)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="지분현황 파일을 찾을 수 없습니다")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"지분 정보 조회 실패: {str(e)}")
+    if result is None:
+        raise HTTPException(status_code=404, detail="해당 종목의 지분 정보가 없습니다")
+    return result
+
+@router.get("/data/sales-composition/{code}")
+async def get_sales_composition_by_code(code: str):
+    """종목코드별 매출 구성 데이터 (예: 005930, A005930)"""
+    try:
+        if not sales_composition_service.is_available():
+            raise HTTPException(status_code=404, detail="매출 구성 데이터 파일을 찾을 수 없습니다.")
+        result = sales_composition_service.get_by_code(code)
+        if not result:
+            return {"message": "해당 기업의 매출 구성 데이터를 찾을 수 없습니다.", "data": []}
+        return {"message": "매출 구성 데이터 조회 성공", "data": result}
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"매출 구성 데이터 조회 실패: {str(e)}")
+
+def _split_param(value: Optional[str]) -> List[str]:
+    """쉼표로 구분된 쿼리 파라미터를 목록으로 (빈 값 제거)"""
+    if not value:
+        return []
+    return [v.strip() for v in value.split(",") if v.strip()]
+
 @router.get("/data/financial-metrics")
-async def get_financial_metrics():
-    """기업별 재무지표 JSON 데이터 (recharts용)"""
+async def get_financial_metrics(
+    request: Request,
+    companies: Optional[str] = Query(None, description="쉼표로 구분된 기업명 (예: 삼성전자,SK하이닉스)"),
+    metrics: Optional[str] = Query(None, description="쉼표로 구분된 지표 (예: PER,ROE)"),
+    years: Optional[str] = Query(None, description="쉼표로 구분된 연도 (예: 2023,2024)"),
+):
+    """기업별 재무지표 JSON 데이터 (recharts용). 필터를 주면 요청한 셀만 반환"""
     try:
-        with open("BACKEND/기업별_재무지표.json", "r", encoding="utf-8") as f:
-            return json.load(f)
+        if not (companies or metrics or years):
+            return precompressed_response(request, dataset_payload(FINANCIAL_METRICS_DATASET))
+        return financial_metrics_service.query(
+            companies=_split_param(companies),
+            metrics=_split_param(metrics),
+            years=_split_param(years),
+        )
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="재무지표 파일을 찾을 수 없습니다")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"재무지표 데이터 로드 실패: {str(e)}")
 
 @router.get("/data/industry-metrics")
-async def get_industry_metrics():
+async def get_industry_metrics(request: Request):
     """산업별 지표 JSON 데이터"""
     try:
-        with open("BACKEND/industry_metrics.json", "r", encoding="utf-8") as f:
-            return json.load(f)
+        return precompressed_response(request, dataset_payload(INDUSTRY_DATASET))
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="산업지표 파일을 찾을 수 없습니다")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"산업지표 데이터 로드 실패: {str(e)}")
 
 @router.get("/data/sales-data")
-async def get_sales_data():
+async def get_sales_data(request: Request):
     """매출비중 차트 데이터 JSON"""
     try:
-        with open("BACKEND/매출비중_chartjs_데이터.json", "r", encoding="utf-8") as f:
-            return json.load(f)
+        return precompressed_response(request, dataset_payload(UNIVERSE_DATASET))
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail="매출데이터 파일을 찾을 수 없습니다")
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"매출데이터 로드 실패: {str(e)}")
+
+@router.get("/data/exports/ranking")
+async def get_export_ranking(
+    year: Optional[str] = Query(None, description="연도 (예: 2024, 기본값: 최신 연도)"),
+    scope: str = Query("company", pattern="^(company|industry)$", description="순위 단위 (company/industry)"),
+    order: str = Query("desc", pattern="^(asc|desc)$", description="정렬 순서"),
+    limit: int = Query(20, ge=1, le=1000, description="최대 반환 개수"),
+    min_sales: float = Query(0.0, ge=0, description="최소 총매출 (소규모 기업 제외용)"),
+):
+    """수출 비중 랭킹 (기업/산업)"""
+    try:
+        return export_analytics_service.get_ranking(
+            year=year, scope=scope, descending=(order == "desc"), limit=limit, min_sales=min_sales,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="매출 구성 데이터 파일을 찾을 수 없습니다.")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"수출 비중 랭킹 조회 실패: {str(e)}")
+
+@router.get("/data/exports/market")
+async def get_export_market_trend():
+    """시장 전체 연도별 수출 비중 추이"""
+    try:
+        return {"trend": export_analytics_service.get_market_trend()}
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="매출 구성 데이터 파일을 찾을 수 없습니다.")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"수출 비중 추이 조회 실패: {str(e)}")
+
+@router.get("/data/exports/industry/{industry}")
+async def get_export_industry_trend(industry: str):
+    """산업별 연도별 수출 비중 추이"""
+    try:
+        trend = export_analytics_service.get_industry_trend(industry)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="매출 구성 데이터 파일을 찾을 수 없습니다.")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"수출 비중 추이 조회 실패: {str(e)}")
+    if trend is None:
+        raise HTTPException(status_code=404, detail="해당 산업의 수출 데이터가 없습니다.")
+    return {"industry": industry, "trend": trend}
+
+@router.get("/data/exports/company/{company_name}")
+async def get_export_company_trend(company_name: str):
+    """기업별 연도별 수출 비중 추이 (산업/시장 추이 포함)"""
+    try:
+        result = export_analytics_service.get_company_trend(company_name)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="매출 구성 데이터 파일을 찾을 수 없습니다.")
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"수출 비중 추이 조회 실패: {str(e)}")
+    if result is None:
+        raise HTTPException(status_code=404, detail="해당 기업의 수출 데이터가 없습니다.")
+    return result
+
+@router.get("/data/datasets")
+async def get_dataset_stats():
+    """파일 기반 데이터셋 적재 상태 (버전, 적재 시간, 메모리 사용량)"""
+    return {"datasets": dataset_registry.stats()}
@@ -1,26 +1,40 @@
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request
 import sys
 import os
 
 # 프로젝트 루트를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from services.news_service import NewsService
-from typing import List, Dict
-from datetime import datetime
+from services.news_service import news_service
+from services.news_cache import news_cache
+from services.news_store import KST
+from utils.scraper import scrape_engine
+from utils.selenium_utils import cancel_on_disconnect, selenium_manager
+from typing import List, Dict, Optional, Tuple
+from datetime import date, datetime, time, timedelta
 import logging
 
 router = APIRouter(prefix="/news", tags=["뉴스"])
 logger = logging.getLogger("news_router")
 
-# 서비스 인스턴스
-news_service = NewsService()
+
+def _date_range(since: Optional[date], until: Optional[date]) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """날짜 쿼리(KST) → [since 00:00, until 다음날 00:00) aware datetime (저장소는 UTC 로 비교)"""
+    start = datetime.combine(since, time.min, tzinfo=KST) if since else None
+    end = datetime.combine(until + timedelta(days=1), time.min, tzinfo=KST) if until else None
+    return start, end
+
 
 @router.get("/hot/kospi")
-async def get_kospi_news():
+async def get_kospi_news(
+    request: Request,
+    since: Optional[date] = Query(None, description="시작일 (YYYY-MM-DD, 저장소 조회)"),
+    until: Optional[date] = Query(None, description="종료일 (포함)"),
+    limit: int = Query(5, ge=1, le=100),
+):
     """코스피 관련 뉴스 조회"""
     try:
-        return await news_service.get_kospi_news()
+        return await cancel_on_disconnect(request, news_service.get_kospi_news(*_date_range(since, until), limit))
     except (ValueError, RuntimeError) as e:
         logger.warning("외부 데이터 오류: %s", e)
         raise HTTPException(status_code=503, detail="외부 서비스 일시적 오류")
@@ -29,10 +43,15 @@ async def get_kospi_news():
         raise HTTPException(status_code=500, detail="내부 서버 오류")
 
 @router.get("/earnings")
-async def get_earnings_news():
+async def get_earnings_news(
+    request: Request,
+    since: Optional[date] = Query(None, description="시작일 (YYYY-MM-DD, 저장소 조회)"),
+    until: Optional[date] = Query(None, description="종료일 (포함)"),
+    limit: int = Query(5, ge=1, le=100),
+):
     """실적 발표 관련 뉴스 조회"""
     try:
-        return await news_service.get_earnings_news()
+        return await cancel_on_disconnect(request, news_service.get_earnings_news(*_date_range(since, until), limit))
     except (ValueError, RuntimeError) as e:
         logger.warning("외부 데이터 오류: %s", e)
         raise HTTPException(status_code=503, detail="외부 서비스 일시적 오류")
@@ -41,10 +60,10 @@ async def get_earnings_news():
         raise HTTPException(status_code=500, detail="내부 서버 오류")
 
 @router.get("/search")
-async def search_company_news(keyword: str = Query(..., description="검색 키워드")):
+async def search_company_news(request: Request, keyword: str = Query(..., description="검색 키워드")):
     """기업별 키워드 뉴스 검색"""
     try:
-        return await news_service.search_company_news(keyword)
+        return await cancel_on_disconnect(request, news_service.search_company_news(keyword))
     except (ValueError, RuntimeError) as e:
         logger.warning("외부 데이터 오류: %s", e)
         raise HTTPException(status_code=503, detail="외부 서비스 일시적 오류")
@@ -52,14 +71,39 @@ async def search_company_news(keyword: str = Query(..., description="검색 키
         logger.exception("서버 내부 오류")
         raise HTTPException(status_code=500, detail="내부 서버 오류")
 
+@router.get("/archive")
+async def search_news_archive(
+    q: Optional[str] = Query(None, description="제목/본문 검색어"),
+    company: Optional[str] = Query(None, description="기업명"),
+    feed: Optional[str] = Query(None, description="피드 (예: daum_news:코스피)"),
+    since: Optional[date] = Query(None, description="시작일 (YYYY-MM-DD)"),
+    until: Optional[date] = Query(None, description="종료일 (포함)"),
+    limit: int = Query(20, ge=1, le=200),
+):
+    """저장된 뉴스 검색 (MongoDB, 수집 워커가 채움)"""
+    try:
+        start, end = _date_range(since, until)
+        return await news_service.search_archive(q, company, feed, start, end, limit)
+    except (ValueError, RuntimeError) as e:
+        logger.warning("뉴스 저장소 오류: %s", e)
+        raise HTTPException(status_code=503, detail="뉴스 저장소를 사용할 수 없습니다")
+    except Exception as e:
+        logger.exception("서버 내부 오류")
+        raise HTTPException(status_code=500, detail="내부 서버 오류")
+
 @router.get("/analyst/report")
-async def get_analyst_report(code: str = Query(..., description="종목 코드 (예: A005930)")):
+async def get_analyst_report(request: Request, code: str = Query(..., description="종목 코드 (예: A005930)")):
     """종목분석 리포트 조회"""
     try:
-        return await news_service.get_analyst_reports(code)
+        return await cancel_on_disconnect(request, news_service.get_analyst_reports(code))
     except (ValueError, RuntimeError) as e:
         logger.warning("외부 데이터 오류: %s", e)
         raise HTTPException(status_code=503, detail="외부 서비스 일시적 오류")
     except Exception as e:
         logger.exception("서버 내부 오류")
         raise HTTPException(status_code=500, detail="내부 서버 오류")
+
+@router.get("/scraper/stats")
+async def get_scraper_stats():
+    """사이트별 스크래핑 경로(HTTP/Selenium) 집계, Selenium 지연 시간, 뉴스 캐시 현황"""
+    return {"scraper": scrape_engine.stats(), "selenium": selenium_manager.stats(), "cache": news_cache.stats()}
@@ -12,6 +12,7 @@ import inspect
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from services.stock_service import StockService
+from services.metrics_cube import metrics_cube_service
 
 # -------------------------
 # 로거
@@ -143,3 +144,45 @@ async def get_industry_analysis(
     except Exception as e:
         logger.error("산업 분석 데이터 조회 실패(name=%s): %s", name, str(e))
         raise HTTPException(status_code=503, detail="industry analysis service unavailable")
+
+
+@router.get(
+    "/industry/{name}/metrics",
+    response_model=Dict[str, Any],
+    summary="산업별 재무지표 평균/중앙값 조회",
+)
+async def get_industry_metrics_summary(
+    name: str = Path(..., description="산업(업종) 명칭")
+) -> Dict[str, Any]:
+    """
+    기업×지표×연도 큐브에서 산업 평균/중앙값을 계산해 반환합니다.
+    """
+    try:
+        data = metrics_cube_service.get_industry_summary(name)
+    except Exception as e:
+        logger.error("산업 지표 집계 실패(name=%s): %s", name, str(e))
+        raise HTTPException(status_code=503, detail="industry metrics service unavailable")
+    if data is None:
+        raise HTTPException(status_code=404, detail="해당 산업 정보가 없습니다.")
+    return _ok(data)
+
+
+@router.get(
+    "/metrics/{name}/vs-industry",
+    response_model=Dict[str, Any],
+    summary="기업 재무지표 vs 산업 비교",
+)
+async def get_company_vs_industry(
+    name: str = Path(..., description="기업명")
+) -> Dict[str, Any]:
+    """
+    기업 지표와 소속 산업 평균/중앙값, 산업 내 백분위 순위를 반환합니다.
+    """
+    try:
+        data = metrics_cube_service.compare_company(name)
+    except Exception as e:
+        logger.error("기업-산업 비교 실패(name=%s): %s", name, str(e))
+        raise HTTPException(status_code=503, detail="industry comparison service unavailable")
+    if data is None:
+        raise HTTPException(status_code=404, detail="해당 기업 지표 또는 산업 정보가 없습니다.")
+    return _ok(data)
@@ -0,0 +1,91 @@
+"""
+FnGuide 애널리스트 리포트 표 파서 (lxml, 한 번 훑기).
+
+Selenium 경로에서도 셀마다 find_element/.text 를 호출하지 않고 page_source(또는 표의 outerHTML)를
+한 번만 가져와 여기서 파싱한다. HTTP 경로와 같은 함수를 쓰므로 두 경로의 결과 형식이 같다.
+"""
+from typing import Dict, List, Optional
+
+import lxml.html
+
+CONSENSUS_ROWS = '//*[@id="bodycontent4"]/tr'
+SPV_TABLE = '//table[contains(concat(" ", normalize-space(@class), " "), " table_common ")]'
+
+
+def _text(element: Optional[lxml.html.HtmlElement]) -> str:
+    """화면 텍스트처럼 공백을 한 칸으로 정리"""
+    if element is None:
+        return ""
+    for br in element.iter("br"):  # 작성자<br/>제공처 → 공백으로 구분
+        br.tail = "\n" + (br.tail or "")
+    return " ".join(element.text_content().split())
+
+
+def _first(element: lxml.html.HtmlElement, xpath: str) -> Optional[lxml.html.HtmlElement]:
+    found = element.xpath(xpath)
+    return found[0] if found else None
+
+
+def to_document(html) -> lxml.html.HtmlElement:
+    return html if isinstance(html, lxml.html.HtmlElement) else lxml.html.document_fromstring(html)
+
+
+def parse_consensus_reports(html, limit: int = 5) -> List[Dict]:
+    """
+    컨센서스 리포트 (SVD_Consensus.asp, #bodycontent4 행)
+    → [{date, title, summary, opinion, target_price, closing_price, analyst}]
+    """
+    data = []
+    for row in to_document(html).xpath(CONSENSUS_ROWS):
+        cells = row.xpath("./td")
+        if len(cells) < 2:
+            continue
+        date = _text(cells[0])
+        title = _text(_first(cells[1], './/span[@class="txt2"]'))
+        if not date or not title:
+            continue
+
+        def cell(index: int, xpath: Optional[str] = None) -> str:
+            if index >= len(cells):
+                return ""
+            return _text(_first(cells[index], xpath) if xpath else cells[index])
+
+        summary_parts = (_text(dd) for dd in cells[1].iter("dd"))
+        data.append({
+            "date": date,
+            "title": title,
+            "summary": " / ".join(p for p in summary_parts if p),
+            "opinion": cell(2, "./span"),
+            "target_price": cell(3, "./span"),
+            "closing_price": cell(4),
+            "analyst": cell(5),
+        })
+        if len(data) >= limit:
+            break
+    return data
+
+
+def parse_spv_reports(html) -> List[Dict]:
+    """
+    기업 리포트 표 (SPV_1000.asp, table.table_common 첫 번째 표, 헤더 행 제외)
+    → [{date, title, analyst, target_price, summary}]
+    """
+    tables = to_document(html).xpath(SPV_TABLE)
+    if not tables:
+        return []
+
+    reports = []
+    for row in list(tables[0].iter("tr"))[1:]:  # 헤더 제외
+        cells = row.xpath("./td")
+        if len(cells) < 4:
+            continue
+        date, title, analyst, target_price = (_text(c) for c in cells[:4])
+        if date and title:  # 유효한 데이터만
+            reports.append({
+                "date": date,
+                "title": title,
+                "analyst": analyst,
+                "target_price": target_price,
+                "summary": f"{title} - {analyst} 분석",
+            })
+    return reports
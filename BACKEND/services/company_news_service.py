@@ -0,0 +1,187 @@
+"""
+기업 뉴스 통합 검색.
+
+네이버/다음 뉴스 검색을 동시에 요청해 URL·제목 유사도로 중복을 제거하고 합친다.
+요청별 제한 시간(budget) 안에 도착한 소스만으로 응답하며, 늦은 소스는 백그라운드에서
+마저 수집되어 뉴스 캐시에 들어가므로 다음 요청부터 포함된다.
+"""
+import asyncio
+import logging
+import os
+import re
+from difflib import SequenceMatcher
+from typing import Callable, Dict, List, Optional
+from urllib.parse import quote, urljoin, urlsplit
+
+from services.news_cache import news_cache, SEARCH_TTL
+from utils.scraper import parse_html, scrape_engine
+
+logger = logging.getLogger("company_news_service")
+
+REQUEST_BUDGET = float(os.getenv("COMPANY_NEWS_BUDGET", "6"))  # 요청당 대기 한도 (초)
+TITLE_SIMILARITY = 0.85  # 이 이상이면 같은 기사로 간주
+
+_TITLE_TAGS = re.compile(r"\[[^\]]*\]|\([^)]*\)|【[^】]*】")  # [단독], (종합) 등 말머리
+_NON_WORD = re.compile(r"[^\w]+")
+
+
+def _text(element, selector: str) -> str:
+    found = element.select_one(selector)
+    return found.get_text(" ", strip=True) if found else ""
+
+
+class NewsSource:
+    """검색 결과 페이지 하나의 URL 템플릿과 항목 셀렉터"""
+
+    def __init__(self, name: str, url: str, item: str, title: str, content: str, press: str, date: str):
+        self.name = name
+        self.url = url
+        self.item = item
+        self.title = title
+        self.content = content
+        self.press = press
+        self.date = date
+
+    def search_url(self, query: str) -> str:
+        return self.url.format(query=quote(query))
+
+    def parse(self, soup, base_url: str, max_items: int) -> List[Dict]:
+        items = []
+        for element in soup.select(self.item):
+            link = element.select_one(self.title)
+            if link is None or not link.get("href"):
+                continue
+            title = link.get_text(" ", strip=True)
+            if not title:
+                continue
+            items.append({
+                "title": title,
+                "link": urljoin(base_url, link["href"]),
+                "content": _text(element, self.content),
+                "date": _text(element, self.date),
+                "category": _text(element, self.press),
+                "source": self.name,
+            })
+            if len(items) >= max_items:
+                break
+        return items
+
+
+SOURCES = [
+    NewsSource(
+        "naver",
+        os.getenv("NEWS_NAVER_URL", "https://search.naver.com/search.naver?where=news&query={query}&sort=1"),
+        item="li.bx",
+        title="a.news_tit",
+        content="div.dsc_wrap, div.news_dsc",
+        press="a.info.press, a.press",
+        date="span.info",
+    ),
+    NewsSource(
+        "daum",
+        os.getenv("NEWS_DAUM_URL", "https://search.daum.net/search?w=news&sort=recency&q={query}"),
+        item="ul.c-list-basic > li",
+        title="div.item-title a, strong.tit-g a",
+        content="p.conts-desc, div.item-contents p",
+        press="a.item-writer, strong.tit_item, span.txt_info",
+        date="span.gem-subinfo, span.txt_info:last-child",
+    ),
+]
+
+
+def normalize_url(url: str) -> str:
+    """스킴/www/프래그먼트/끝 슬래시 차이 무시"""
+    parts = urlsplit(url)
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if host.startswith("m."):
+        host = host[2:]
+    path = parts.path.rstrip("/")
+    return f"{host}{path}?{parts.query}" if parts.query else f"{host}{path}"
+
+
+def normalize_title(title: str) -> str:
+    """말머리·문장부호·공백 제거, 소문자"""
+    return _NON_WORD.sub("", _TITLE_TAGS.sub("", title)).lower()
+
+
+def _is_similar(a: str, b: str) -> bool:
+    if not a or not b:
+        return False
+    if a in b or b in a:
+        return min(len(a), len(b)) / max(len(a), len(b)) >= TITLE_SIMILARITY
+    matcher = SequenceMatcher(None, a, b)
+    return matcher.real_quick_ratio() >= TITLE_SIMILARITY and matcher.ratio() >= TITLE_SIMILARITY
+
+
+def merge_news(results: List[List[Dict]], max_news: int) -> List[Dict]:
+    """소스별 결과를 번갈아 가며 합치고 URL/제목 유사도 중복 제거 (각 소스의 정렬 순서 유지)"""
+    merged, urls, titles = [], set(), []
+    for rank in range(max((len(r) for r in results), default=0)):
+        for items in results:
+            if rank >= len(items):
+                continue
+            item = items[rank]
+            url, title = normalize_url(item["link"]), normalize_title(item["title"])
+            if url in urls or any(_is_similar(title, seen) for seen in titles):
+                continue
+            urls.add(url)
+            titles.append(title)
+            merged.append(item)
+            if len(merged) >= max_news:
+                return merged
+    return merged
+
+
+class CompanyNewsService:
+    def __init__(self, sources: List[NewsSource] = SOURCES, budget: float = REQUEST_BUDGET):
+        self.sources = sources
+        self.budget = budget
+
+    def _fetcher(self, source: NewsSource, query: str, max_items: int) -> Callable:
+        url = source.search_url(query)
+
+        def html_logic(soup):
+            return source.parse(soup, url, max_items)
+
+        def driver_logic(driver):
+            return source.parse(parse_html(driver.page_source), url, max_items)
+
+        return lambda: scrape_engine.scrape(f"{source.name}_news", url, html_logic, driver_logic)
+
+    async def search(self, company_name: str, max_news: int = 10, budget: Optional[float] = None) -> Dict:
+        """
+        소스별 동시 검색 → 병합. budget 초과 시 도착한 결과만 반환 (partial=True).
+        각 소스 결과는 뉴스 캐시(짧은 TTL)에 공유된다.
+        """
+        query = company_name.strip()
+        tasks = {
+            source.name: asyncio.ensure_future(
+                news_cache.get(f"{source.name}_company", query, self._fetcher(source, query, max_news),
+                               ttl=SEARCH_TTL)
+            )
+            for source in self.sources
+        }
+        done, pending = await asyncio.wait(tasks.values(), timeout=self.budget if budget is None else budget)
+        for task in pending:
+            task.cancel()  # 대기만 중단 (스크래핑 자체는 캐시에서 계속 진행)
+
+        results, status = [], {}
+        for name, task in tasks.items():
+            if task in pending:
+                status[name] = "timeout"
+            elif task.exception() is not None:
+                logger.warning("⚠️ %s 뉴스 검색 실패 (%s): %s", name, query, task.exception())
+                status[name] = "error"
+            else:
+                results.append(task.result() or [])
+                status[name] = len(results[-1])
+
+        news = merge_news(results, max_news)
+        logger.info("📰 %s 뉴스 %d건 (소스: %s)", query, len(news), status)
+        return {"news": news, "sources": status, "partial": bool(pending)}
+
+
+# 인스턴스 (라우터에서 import)
+company_news_service = CompanyNewsService()
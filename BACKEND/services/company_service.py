@@ -1,9 +1,10 @@
 import os
 from fastapi import HTTPException
 from utils.database import db_manager
+from services.shareholder_service import shareholder_service
 import logging
 from bson import ObjectId
-from typing import Dict
+from typing import Dict, List, Optional
 
 logger = logging.getLogger("company_service")
 
@@ -31,6 +32,40 @@ class CompanyService:
         else:
             return obj
 
+    def _merge_company(self, explain_data: Optional[Dict], users_data: Optional[Dict],
+                       outline_data: Optional[Dict]) -> Dict:
+        """explain/users/outline 문서를 하나의 기업 데이터로 병합"""
+        company = {}
+
+        # explain에서 짧은요약 추가
+        if explain_data:
+            company.update({
+                "기업명": explain_data.get("기업명"),
+                "종목코드": explain_data.get("종목코드"),
+                "업종명": explain_data.get("업종명"),
+                "짧은요약": explain_data.get("짧은요약")
+            })
+
+        # users에서 재무지표 추가
+        if users_data:
+            company.update({
+                "지표": users_data.get("지표", {})
+            })
+
+        # outline에서 기업개요 추가
+        if outline_data:
+            company.update({
+                "개요": {
+                    "주소": outline_data.get("주", ""),
+                    "설립일": outline_data.get("설립일", ""),
+                    "대표자": outline_data.get("대표자", ""),
+                    "전화번호": outline_data.get("전화번호", ""),
+                    "홈페이지": outline_data.get("홈페이지", "")
+                }
+            })
+
+        return company
+
     def get_company_data(self, company_name: str) -> Dict:
         """기업 데이터 조회 (explain 컬렉션에서 짧은요약, users에서 재무지표)"""
         try:
@@ -54,23 +89,7 @@ class CompanyService:
             if explain_data or users_data:
                 logger.info(f"✅ 기업 데이터 찾음: {company_name}")
                 
-                # 기본 데이터 구조 생성
-                company = {}
-                
-                # explain에서 짧은요약 추가
-                if explain_data:
-                    company.update({
-                        "기업명": explain_data.get("기업명"),
-                        "종목코드": explain_data.get("종목코드"),
-                        "업종명": explain_data.get("업종명"),
-                        "짧은요약": explain_data.get("짧은요약")
-                    })
-                
-                # users에서 재무지표 추가
-                if users_data:
-                    company.update({
-                        "지표": users_data.get("지표", {})
-                    })
+                company = self._merge_company(explain_data, users_data, None)
                 
                 # outline 컬렉션에서 기업개요 가져오기
                 try:
@@ -79,15 +98,7 @@ class CompanyService:
                     outline_data = outline_collection.find_one(outline_query)
                     
                     if outline_data:
-                        company.update({
-                            "개요": {
-                                "주소": outline_data.get("주", ""),
-                                "설립일": outline_data.get("설립일", ""),
-                                "대표자": outline_data.get("대표자", ""),
-                                "전화번호": outline_data.get("전화번호", ""),
-                                "홈페이지": outline_data.get("홈페이지", "")
-                            }
-                        })
+                        company = self._merge_company(explain_data, users_data, outline_data)
                 except Exception as e:
                     logger.warning(f"outline 컬렉션 조회 실패: {e}")
                     company.update({"개요": {}})
@@ -95,33 +106,8 @@ class CompanyService:
                 # ObjectId 변환
                 company = self._convert_objectid(company)
                 
-                # 지분현황.json에서 해당 기업의 지분 정보 찾기
-                try:
-                    import json
-                    with open("지분현황.json", "r", encoding="utf-8") as f:
-                        shareholder_data = json.load(f)
-                    
-                    # 종목코드로 지분 정보 찾기 (A005930 형태)
-                    종목코드_str = str(company.get("종목코드", ""))
-                    if 종목코드_str:
-                        # 종목코드가 5자리면 앞에 A 추가
-                        if len(종목코드_str) == 5:
-                            종목코드_key = f"A{종목코드_str}"
-                        else:
-                            종목코드_key = 종목코드_str
-                        
-                        if 종목코드_key in shareholder_data:
-                            company["지분정보"] = shareholder_data[종목코드_key]
-                            logger.info(f"✅ 지분 정보 로드 성공: {종목코드_key}")
-                        else:
-                            logger.warning(f"⚠️ 지분 정보 없음: {종목코드_key}")
-                            company["지분정보"] = []
-                    else:
-                        company["지분정보"] = []
-                        
-                except Exception as e:
-                    logger.warning(f"지분현황.json 로드 실패: {e}")
-                    company["지분정보"] = []
+                # 메모리 인덱스에서 해당 기업의 지분 정보 찾기
+                company["지분정보"] = shareholder_service.get_holdings(company.get("종목코드"))
                 
                 return company
             else:
@@ -132,6 +118,60 @@ class CompanyService:
             logger.error(f"❌ 기업 데이터 조회 실패 ({company_name}): {e}")
             return None
 
+    def get_companies_bulk(self, company_names: List[str]) -> Dict:
+        """
+        여러 기업 데이터를 한 번에 조회.
+        컬렉션별로 $in 쿼리를 한 번씩만 보내고 메모리에서 병합한다 (3N → 3 라운드트립).
+        """
+        result = {"companies": {}, "not_found": []}
+        if not company_names:
+            return result
+
+        logger.info(f"🔍 기업 일괄 조회 시작: {len(company_names)}개")
+
+        # 1) explain / users 컬렉션 일괄 조회
+        explain_collection = self._get_collection("explain")
+        users_collection = self._get_collection("users")
+        name_query = {"기업명": {"$in": company_names}}
+
+        explain_by_name = {}
+        for doc in explain_collection.find(name_query):
+            explain_by_name.setdefault(doc.get("기업명"), doc)
+
+        users_by_name = {}
+        for doc in users_collection.find(name_query):
+            users_by_name.setdefault(doc.get("기업명"), doc)
+
+        # 2) outline 컬렉션 일괄 조회 (explain에서 얻은 종목코드 기준)
+        outline_by_code = {}
+        codes = list({str(doc.get("종목코드", "")) for doc in explain_by_name.values()})
+        if codes:
+            try:
+                outline_collection = self._get_collection("outline")
+                for doc in outline_collection.find({"종목": {"$in": codes}}):
+                    outline_by_code.setdefault(doc.get("종목"), doc)
+            except Exception as e:
+                logger.warning(f"outline 컬렉션 일괄 조회 실패: {e}")
+
+        # 3) 메모리에서 병합
+        for name in company_names:
+            explain_data = explain_by_name.get(name)
+            users_data = users_by_name.get(name)
+            if not (explain_data or users_data):
+                result["not_found"].append(name)
+                continue
+
+            code = str(explain_data.get("종목코드", "")) if explain_data else ""
+            company = self._merge_company(explain_data, users_data, outline_by_code.get(code))
+            company = self._convert_objectid(company)
+            company["지분정보"] = shareholder_service.get_holdings(company.get("종목코드"))
+            result["companies"][name] = company
+
+        logger.info(
+            f"✅ 기업 일괄 조회 완료: {len(result['companies'])}개 성공, {len(result['not_found'])}개 없음"
+        )
+        return result
+
     def get_company_financial_metrics(self, company_name: str) -> Dict:
         """기업 재무지표 조회 (users 컬렉션에서)"""
         try:
@@ -0,0 +1,166 @@
+import logging
+import threading
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from services.metrics_cube import INDUSTRY_DATASET
+from services.sales_composition_service import DATASET as SALES_DATASET, sales_frame
+from utils.dataset_registry import dataset_registry
+
+logger = logging.getLogger("export_analytics_service")
+
+# 매출 구분 (비중/총계 행은 제외)
+SALES_TYPES = ["내수", "수출", "로컬", "미분류"]
+RANKING_SCOPES = ("company", "industry")
+
+
+def _add_ratios(frame: pd.DataFrame, group_cols: List[str]) -> pd.DataFrame:
+    """
+    매출 구분별 합계 프레임에 비율/전년 대비 변화 컬럼 추가.
+    비율의 분모는 구분이 확인된 매출(내수+수출+로컬)이며, 미분류 비중은 별도로 제공한다.
+    """
+    frame = frame.copy()
+    classified = frame["내수"] + frame["수출"] + frame["로컬"]
+    total = classified + frame["미분류"]
+    frame["총매출"] = total
+    with np.errstate(invalid="ignore", divide="ignore"):
+        frame["export_ratio"] = np.where(classified > 0, frame["수출"] / classified * 100, np.nan)
+        frame["local_ratio"] = np.where(classified > 0, frame["로컬"] / classified * 100, np.nan)
+        frame["unclassified_ratio"] = np.where(total > 0, frame["미분류"] / total * 100, np.nan)
+
+    frame = frame.sort_values(group_cols + ["year"])
+    if group_cols:
+        frame["export_ratio_yoy"] = frame.groupby(group_cols)["export_ratio"].diff()
+    else:
+        frame["export_ratio_yoy"] = frame["export_ratio"].diff()
+    return frame.round(2)
+
+
+class ExportCube:
+    """
+    NICE 내수/수출 CSV에서 한 번에 계산한 수출 비중 큐브.
+    - company: (종목명, year) 별 구분 합계/비율
+    - industry: (industry, year) 별
+    - market: year 별 (시장 전체)
+    """
+
+    def __init__(self, df: pd.DataFrame, industries: Dict[str, List[str]]):
+        year_cols = [c for c in df.columns if c.endswith("매출액")]
+        rows = df[df["구분"].isin(SALES_TYPES)]
+
+        # 연도 컬럼 → long 포맷 (벡터 연산)
+        long = rows.melt(
+            id_vars=["종목코드", "종목명", "구분"], value_vars=year_cols,
+            var_name="year", value_name="amount",
+        )
+        long["year"] = long["year"].str.slice(0, 4)
+        long["amount"] = pd.to_numeric(long["amount"], errors="coerce").fillna(0.0)
+
+        industry_of = {name: industry for industry, names in industries.items() for name in names}
+        long["industry"] = long["종목명"].map(industry_of)
+
+        by_company = long.pivot_table(
+            index=["종목명", "year"], columns="구분", values="amount", aggfunc="sum", fill_value=0.0,
+        ).reindex(columns=SALES_TYPES, fill_value=0.0).reset_index()
+        by_company["industry"] = by_company["종목명"].map(industry_of)
+        self.company = _add_ratios(by_company, ["종목명"])
+
+        sums = self.company.groupby(["industry", "year"], as_index=False)[SALES_TYPES].sum()
+        self.industry = _add_ratios(sums, ["industry"])
+
+        market = self.company.groupby("year", as_index=False)[SALES_TYPES].sum()
+        self.market = _add_ratios(market, [])
+
+        self.years = sorted(self.company["year"].unique().tolist())
+        self._company_groups = {name: g for name, g in self.company.groupby("종목명")}
+        self._industry_groups = {name: g for name, g in self.industry.groupby("industry")}
+
+    @staticmethod
+    def _records(frame: pd.DataFrame, drop: Tuple[str, ...] = ()) -> List[Dict]:
+        frame = frame.drop(columns=list(drop))
+        return frame.astype(object).where(frame.notna(), None).to_dict(orient="records")
+
+    def ranking(self, year: str, scope: str = "company", descending: bool = True,
+                limit: int = 20, min_sales: float = 0.0) -> List[Dict]:
+        frame = self.company if scope == "company" else self.industry
+        frame = frame[(frame["year"] == year) & frame["export_ratio"].notna()]
+        if min_sales:
+            frame = frame[frame["총매출"] >= min_sales]
+        frame = frame.sort_values("export_ratio", ascending=not descending).head(limit)
+        return self._records(frame)
+
+    def company_trend(self, name: str) -> Optional[Dict]:
+        group = self._company_groups.get(name)
+        if group is None:
+            return None
+        industry = group["industry"].iloc[0]
+        return {
+            "company": name,
+            "industry": industry if isinstance(industry, str) else None,
+            "trend": self._records(group, drop=("종목명", "industry")),
+            "industry_trend": self.industry_trend(industry) if isinstance(industry, str) else None,
+            "market_trend": self.market_trend(),
+        }
+
+    def industry_trend(self, industry: str) -> Optional[List[Dict]]:
+        group = self._industry_groups.get(industry)
+        if group is None:
+            return None
+        return self._records(group, drop=("industry",))
+
+    def market_trend(self) -> List[Dict]:
+        return self._records(self.market)
+
+
+class ExportAnalyticsService:
+    """ExportCube 지연 생성 및 보관 (원본 데이터셋이 다시 적재되면 재생성)"""
+
+    def __init__(self):
+        self._cube: Optional[ExportCube] = None
+        self._versions: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+
+    def get_cube(self) -> ExportCube:
+        versions = (dataset_registry.version(SALES_DATASET), dataset_registry.version(INDUSTRY_DATASET))
+        if self._cube is not None and self._versions == versions:
+            return self._cube
+        with self._lock:
+            if self._cube is None or self._versions != versions:
+                industry_data = dataset_registry.get(INDUSTRY_DATASET)
+                industries = {k: v.get("companies", []) for k, v in industry_data.items()}
+                self._cube = ExportCube(sales_frame(dataset_registry.get(SALES_DATASET)), industries)
+                self._versions = versions
+                logger.info(
+                    "✅ 수출 비중 큐브 생성: 기업 %d행, 산업 %d행",
+                    len(self._cube.company), len(self._cube.industry),
+                )
+        return self._cube
+
+    def get_ranking(self, year: Optional[str] = None, scope: str = "company",
+                    descending: bool = True, limit: int = 20, min_sales: float = 0.0) -> Dict:
+        if scope not in RANKING_SCOPES:
+            raise ValueError(f"지원하지 않는 범위: {scope}")
+        cube = self.get_cube()
+        year = year or cube.years[-1]
+        if year not in cube.years:
+            raise ValueError(f"지원하지 않는 연도: {year} ({', '.join(cube.years)})")
+        return {
+            "year": year,
+            "scope": scope,
+            "ranking": cube.ranking(year, scope, descending, limit, min_sales),
+        }
+
+    def get_company_trend(self, name: str) -> Optional[Dict]:
+        return self.get_cube().company_trend(name.strip())
+
+    def get_industry_trend(self, industry: str) -> Optional[List[Dict]]:
+        return self.get_cube().industry_trend(industry.strip())
+
+    def get_market_trend(self) -> List[Dict]:
+        return self.get_cube().market_trend()
+
+
+# 인스턴스 (라우터에서 import)
+export_analytics_service = ExportAnalyticsService()
@@ -0,0 +1,137 @@
+import logging
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+from utils.artifacts import read_snapshot_artifact
+from utils.dataset_registry import dataset_registry, load_json
+from utils.snapshot import Snapshot, load_or_build
+
+logger = logging.getLogger("financial_metrics_service")
+
+DATASET = "financial_metrics"
+
+
+def metrics_snapshot_parts(raw: Dict[str, Dict[str, Dict[str, Optional[float]]]]) -> Dict:
+    """
+    {기업명: {지표: {연도: 값}}} → 기업 × 지표 × 연도 float64 배열 스냅샷 구성요소.
+    원본에 명시적으로 null인 칸과 아예 없는 칸을 구분하기 위해 present 마스크를 함께 저장한다.
+    """
+    companies = list(raw)
+    metrics = list(dict.fromkeys(m for v in raw.values() for m in v))
+    years = sorted({y for v in raw.values() for by_year in v.values() for y in by_year})
+    metric_index = {m: i for i, m in enumerate(metrics)}
+    year_index = {y: i for i, y in enumerate(years)}
+
+    values = np.full((len(companies), len(metrics), len(years)), np.nan)
+    present = np.zeros(values.shape, dtype=bool)
+    for ci, name in enumerate(companies):
+        for metric, by_year in raw[name].items():
+            mi = metric_index[metric]
+            for year, value in by_year.items():
+                present[ci, mi, year_index[year]] = True
+                if value is not None:
+                    values[ci, mi, year_index[year]] = value
+    return {
+        "arrays": {"values": values, "present": present},
+        "strings": {"companies": companies, "metrics": metrics, "years": years},
+    }
+
+
+def load_metrics_snapshot(path: str) -> Snapshot:
+    return load_or_build(DATASET, path, lambda p: metrics_snapshot_parts(load_json(p)))
+
+
+def build_metrics_index(snapshot: Snapshot) -> Dict:
+    """축 이름 목록과 기업명 → 행 번호"""
+    companies = snapshot.strings("companies").table()
+    return {
+        "companies": companies,
+        "company_index": {name: i for i, name in enumerate(companies)},
+        "metrics": snapshot.strings("metrics").table(),
+        "years": snapshot.strings("years").table(),
+    }
+
+
+dataset_registry.register(
+    DATASET, "기업별_재무지표.json", loader=load_metrics_snapshot, indexer=build_metrics_index,
+    artifact_loader=read_snapshot_artifact,
+)
+
+
+def _as_filter(values: Optional[Iterable[str]]) -> Optional[set]:
+    """None/빈 목록이면 필터 없음(None), 아니면 set"""
+    if not values:
+        return None
+    return {str(v) for v in values}
+
+
+def _axis(names: List[str], selected: Optional[set]) -> List[int]:
+    if selected is None:
+        return list(range(len(names)))
+    return [i for i, n in enumerate(names) if n in selected]
+
+
+class FinancialMetricsService:
+    """
+    기업별_재무지표.json ({기업명: {지표: {연도: 값}}})을 매핑된 큐브 스냅샷에서 읽어
+    기업/지표/연도 단위로 필요한 셀만 잘라서 원래 중첩 dict 형태로 반환한다.
+    """
+
+    def _cells(self, company_rows: List[int], metric_cols: List[int], year_cols: List[int]) -> Dict:
+        snapshot = dataset_registry.get(DATASET)
+        index = dataset_registry.index(DATASET)
+        if not company_rows or not metric_cols or not year_cols:
+            return {}
+        grid = np.ix_(company_rows, metric_cols, year_cols)
+        values = snapshot.array("values")[grid]
+        present = snapshot.array("present")[grid]
+
+        result = {}
+        metrics = [index["metrics"][i] for i in metric_cols]
+        years = [index["years"][i] for i in year_cols]
+        for ci, row in enumerate(company_rows):
+            company_metrics = {}
+            for mi, metric in enumerate(metrics):
+                cells = {
+                    year: (None if np.isnan(values[ci, mi, yi]) else float(values[ci, mi, yi]))
+                    for yi, year in enumerate(years) if present[ci, mi, yi]
+                }
+                if cells:
+                    company_metrics[metric] = cells
+            if company_metrics:
+                result[index["companies"][row]] = company_metrics
+        return result
+
+    def get_company(self, name: str) -> Optional[Dict]:
+        """기업 하나의 전체 지표. 없으면 None"""
+        index = dataset_registry.index(DATASET)
+        row = index["company_index"].get(name)
+        if row is None:
+            return None
+        return self._cells(
+            [row], list(range(len(index["metrics"]))), list(range(len(index["years"])))
+        ).get(name, {})
+
+    def query(self, companies: Optional[Iterable[str]] = None,
+              metrics: Optional[Iterable[str]] = None,
+              years: Optional[Iterable[str]] = None) -> Dict:
+        """
+        요청한 셀만 포함한 {기업명: {지표: {연도: 값}}} 반환.
+        각 조건이 비어 있으면 해당 축은 전체를 의미한다.
+        """
+        index = dataset_registry.index(DATASET)
+        if companies:
+            company_index = index["company_index"]
+            rows = [company_index[n] for n in dict.fromkeys(companies) if n in company_index]
+        else:
+            rows = list(range(len(index["companies"])))
+        return self._cells(
+            rows,
+            _axis(index["metrics"], _as_filter(metrics)),
+            _axis(index["years"], _as_filter(years)),
+        )
+
+
+# 인스턴스 (라우터에서 import)
+financial_metrics_service = FinancialMetricsService()
@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import warnings
 import time
 from contextlib import contextmanager
@@ -13,6 +14,9 @@ import pandas as pd  # ← 스레드 내부 함수에서도 보이도록 전역
 from requests.exceptions import JSONDecodeError as ReqJSONDecodeError, RequestException
 from pykrx import stock
 
+from utils.cache import create_cache
+from utils.circuit_breaker import CircuitOpenError, breakers
+
 # noisy 로거/워닝 억제
 logging.getLogger("pykrx").setLevel(logging.ERROR)
 logging.getLogger("urllib3").setLevel(logging.ERROR)
@@ -21,6 +25,9 @@ warnings.filterwarnings("ignore")
 
 logger = logging.getLogger("investor_service")
 
+INVESTOR_TTL = float(os.getenv("INVESTOR_CACHE_TTL", "600"))  # pykrx 투자자 데이터 캐시 (초)
+investor_cache = create_cache("investor", ttl=INVESTOR_TTL, stale_ttl=86400, max_entries=300)
+
 
 @contextmanager
 def _quiet_pykrx(level: int = logging.ERROR):
@@ -107,6 +114,17 @@ def _get_market_trading_value_by_investor_safe(
     return None
 
 
+def _trading_value_by_investor(fromdate: str, todate: str, target: str):
+    """투자자별 거래대금: detail=False로 먼저, 비었으면 detail=True로 재시도 (pykrx 차단기 적용)"""
+    with breakers.get("pykrx", "investor").guard():
+        with _quiet_pykrx():
+            df = stock.get_market_trading_value_by_investor(fromdate, todate, target, detail=False)
+        if df is None or df.empty:
+            with _quiet_pykrx():
+                df = stock.get_market_trading_value_by_investor(fromdate, todate, target, detail=True)
+    return df
+
+
 def _normalize_investor_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     """
     투자자 데이터프레임 정규화:
@@ -164,17 +182,24 @@ def _normalize_investor_dataframe(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _succeeded(result) -> bool:
+    """에러 dict 가 아닌 결과만 캐시"""
+    return bool(result) and "error" not in result
+
+
 class InvestorService:
     def __init__(self):
         pass
 
     async def get_kospi_investor_value(self):
-        return await self.get_kospi_investor_value_impl()
+        return await investor_cache.aget_or_load(
+            "kospi_value", self.get_kospi_investor_value_impl, ok=lambda r: r is not None
+        ) or {"투자자별_거래량": self._get_static_investor_data()}
 
     async def get_kospi_investor_value_impl(self):
         """
         코스피 투자자별 매매대금/순매수 등(스키마는 pykrx 상황에 따라 일부 변동 가능)
-        - 어떤 경우에도 dict 반환(폴백 포함)
+        - 조회/파싱 실패 시 None (get_kospi_investor_value 가 마지막 성공 데이터 또는 정적 폴백으로 대체)
         - '거래대금' 컬럼 의존성 제거 (과거 KeyError 원인 제거)
         """
         try:
@@ -189,7 +214,7 @@ class InvestorService:
                 )
                 if df is None:
                     logger.warning("pykrx 투자자 데이터 조회 실패: 휴장/네트워크/응답 이상")
-                    return {"투자자별_거래량": self._get_static_investor_data()}
+                    return None
 
                 # 대표 컬럼들만 안전하게 추출
                 cols = df.columns.tolist()
@@ -218,16 +243,23 @@ class InvestorService:
 
                 if not out:
                     logger.warning("투자자 데이터 파싱 결과 없음 → 폴백")
-                    return {"투자자별_거래량": self._get_static_investor_data()}
+                    return None
 
                 logger.info("pykrx로 투자자 데이터 조회 성공")
                 return {"투자자별_거래량": out}
 
-            return await asyncio.to_thread(_fetch)
+            # 안전 래퍼는 영업일을 거슬러 올라가며 최대 7번 재시도하므로, 차단 중이면 아예 호출하지 않음
+            with breakers.get("pykrx", "investor_value").guard():
+                result = await asyncio.to_thread(_fetch)
+                if result is None:
+                    raise RuntimeError("pykrx 투자자 데이터 조회 실패")
+            return result
 
+        except CircuitOpenError:
+            return None
         except Exception as e:
             logger.error("❌ 투자자 데이터 조회 실패(최상위): %s", e)
-            return {"투자자별_거래량": self._get_static_investor_data()}
+            return None
 
     def _get_static_investor_data(self):
         today = date.today().strftime("%Y-%m-%d")
@@ -263,6 +295,10 @@ class InvestorService:
         """
         종목별 최신 투자자 요약 (가능하면 사용, 실패 시 에러 메시지 dict)
         """
+        return await investor_cache.aget_or_load(("summary", ticker), lambda: self._fetch_investor_summary(ticker),
+                                                 ok=_succeeded)
+
+    async def _fetch_investor_summary(self, ticker: str):
         try:
             def _fetch():
                 today = _nearest_business_day_str()
@@ -271,19 +307,7 @@ class InvestorService:
                 )
 
                 try:
-                    # detail=False로 먼저 시도
-                    with _quiet_pykrx():
-                        df = stock.get_market_trading_value_by_investor(
-                            yesterday, today, ticker, detail=False
-                        )
-                    
-                    if df is None or df.empty:
-                        # detail=True로 재시도
-                        with _quiet_pykrx():
-                            df = stock.get_market_trading_value_by_investor(
-                                yesterday, today, ticker, detail=True
-                            )
-                    
+                    df = _trading_value_by_investor(yesterday, today, ticker)
                     if df is None or df.empty:
                         return {"error": "투자자 요약 데이터가 없습니다"}
 
@@ -318,30 +342,16 @@ class InvestorService:
         """
         최근 n일 투자자 트렌드. 실패 시 에러 dict.
         """
+        return await investor_cache.aget_or_load(("trends", days), lambda: self._fetch_investor_trends(days),
+                                                 ok=_succeeded)
+
+    async def _fetch_investor_trends(self, days: int):
         try:
             def _fetch():
                 end_d = date.today()
                 start_d = end_d - timedelta(days=days)
                 try:
-                    # detail=False로 먼저 시도
-                    with _quiet_pykrx():
-                        df = stock.get_market_trading_value_by_investor(
-                            start_d.strftime("%Y%m%d"),
-                            end_d.strftime("%Y%m%d"),
-                            "KOSPI",
-                            detail=False
-                        )
-                    
-                    if df is None or df.empty:
-                        # detail=True로 재시도
-                        with _quiet_pykrx():
-                            df = stock.get_market_trading_value_by_investor(
-                                start_d.strftime("%Y%m%d"),
-                                end_d.strftime("%Y%m%d"),
-                                "KOSPI",
-                                detail=True
-                            )
-                    
+                    df = _trading_value_by_investor(start_d.strftime("%Y%m%d"), end_d.strftime("%Y%m%d"), "KOSPI")
                     if df is None or df.empty:
                         return {"error": "트렌드 데이터가 없습니다"}
 
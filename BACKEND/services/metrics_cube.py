@@ -0,0 +1,168 @@
+import logging
+import threading
+import warnings
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from services.financial_metrics_service import DATASET as FINANCIAL_METRICS_DATASET
+from utils.dataset_registry import dataset_registry
+
+logger = logging.getLogger("metrics_cube")
+
+INDUSTRY_DATASET = "industry_metrics"
+dataset_registry.register(INDUSTRY_DATASET, "industry_metrics.json")
+
+
+def _nan_to_none(arr: np.ndarray, ndigits: int = 2):
+    """NaN → None 으로 바꿔 JSON 직렬화 가능한 중첩 리스트로 변환"""
+    return [
+        _nan_to_none(a, ndigits) if isinstance(a, np.ndarray) else
+        (None if np.isnan(a) else round(float(a), ndigits))
+        for a in arr
+    ]
+
+
+def percentile_ranks(values: np.ndarray) -> np.ndarray:
+    """
+    axis 0(기업) 기준 백분위 순위 (0~100, 동점은 절반씩). NaN은 NaN 유지.
+    values: (n, ...) 배열
+    """
+    valid = ~np.isnan(values)
+    a = values[:, None]
+    b = values[None, :]
+    with np.errstate(invalid="ignore"):
+        less = np.sum((b < a) & valid[None, :], axis=1)
+        equal = np.sum((b == a) & valid[None, :], axis=1)
+    count = valid.sum(axis=0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        ranks = (less + 0.5 * (equal - 1)) / (count - 1) * 100.0
+    ranks = np.where(count > 1, ranks, 50.0)
+    return np.where(valid, ranks, np.nan)
+
+
+class MetricsCube:
+    """
+    기업 × 지표 × 연도 float64 큐브 (결측은 NaN) + 산업 소속 인덱스.
+    values는 재무지표 스냅샷의 읽기 전용 매핑 배열을 그대로 사용한다.
+    산업 평균/중앙값/백분위는 nan-aware 벡터 연산으로 한 번 계산해 캐시한다.
+    """
+
+    def __init__(self, companies: List[str], metrics: List[str], years: List[str],
+                 values: np.ndarray, industries: Dict[str, List[str]]):
+        self.companies = companies
+        self.metrics = metrics
+        self.years = years
+        self.company_index = {name: i for i, name in enumerate(self.companies)}
+        self.values = values
+
+        # 산업 → 소속 기업 인덱스 배열, 기업 → 산업
+        self.industry_members: Dict[str, np.ndarray] = {}
+        self.company_industry: Dict[str, str] = {}
+        for industry, names in industries.items():
+            idx = [self.company_index[n] for n in names if n in self.company_index]
+            self.industry_members[industry] = np.array(idx, dtype=np.intp)
+            for n in names:
+                self.company_industry.setdefault(n, industry)
+
+        self._stats_cache: Dict[str, Dict[str, np.ndarray]] = {}
+        self._stats_lock = threading.Lock()
+
+    def _industry_stats(self, industry: str) -> Dict[str, np.ndarray]:
+        """산업별 mean/median/count (지표×연도) 및 소속 기업 백분위 (n×지표×연도)"""
+        cached = self._stats_cache.get(industry)
+        if cached is not None:
+            return cached
+        members = self.industry_members[industry]
+        sub = self.values[members]
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", category=RuntimeWarning)  # 전부 NaN인 칸
+            stats = {
+                "mean": np.nanmean(sub, axis=0),
+                "median": np.nanmedian(sub, axis=0),
+                "count": np.sum(~np.isnan(sub), axis=0),
+                "percentile": percentile_ranks(sub),
+            }
+        with self._stats_lock:
+            self._stats_cache[industry] = stats
+        return stats
+
+    def industry_summary(self, industry: str) -> Optional[Dict]:
+        """산업 평균/중앙값 ({지표: {연도: 값}})"""
+        if industry not in self.industry_members:
+            return None
+        stats = self._industry_stats(industry)
+        members = self.industry_members[industry]
+        return {
+            "industry": industry,
+            "companies": [self.companies[i] for i in members],
+            "mean": self._to_nested(stats["mean"]),
+            "median": self._to_nested(stats["median"]),
+            "count": {
+                m: {y: int(stats["count"][mi, yi]) for yi, y in enumerate(self.years)}
+                for mi, m in enumerate(self.metrics)
+            },
+        }
+
+    def compare_company(self, name: str) -> Optional[Dict]:
+        """기업 지표 vs 소속 산업 평균/중앙값/백분위"""
+        ci = self.company_index.get(name)
+        industry = self.company_industry.get(name)
+        if ci is None or industry is None:
+            return None
+        stats = self._industry_stats(industry)
+        pos = int(np.flatnonzero(self.industry_members[industry] == ci)[0])
+        return {
+            "company": name,
+            "industry": industry,
+            "values": self._to_nested(self.values[ci]),
+            "industry_mean": self._to_nested(stats["mean"]),
+            "industry_median": self._to_nested(stats["median"]),
+            "percentile": self._to_nested(stats["percentile"][pos], ndigits=1),
+        }
+
+    def _to_nested(self, matrix: np.ndarray, ndigits: int = 2) -> Dict[str, Dict[str, float]]:
+        rows = _nan_to_none(matrix, ndigits)
+        return {m: dict(zip(self.years, rows[mi])) for mi, m in enumerate(self.metrics)}
+
+
+class MetricsCubeService:
+    """MetricsCube 지연 생성 및 보관 (원본 데이터셋이 다시 적재되면 재생성)"""
+
+    def __init__(self):
+        self._cube: Optional[MetricsCube] = None
+        self._versions: Optional[Tuple[int, int]] = None
+        self._lock = threading.Lock()
+
+    def get_cube(self) -> MetricsCube:
+        versions = (
+            dataset_registry.version(FINANCIAL_METRICS_DATASET),
+            dataset_registry.version(INDUSTRY_DATASET),
+        )
+        if self._cube is not None and self._versions == versions:
+            return self._cube
+        with self._lock:
+            if self._cube is None or self._versions != versions:
+                industry_data = dataset_registry.get(INDUSTRY_DATASET)
+                industries = {k: v.get("companies", []) for k, v in industry_data.items()}
+                axes = dataset_registry.index(FINANCIAL_METRICS_DATASET)
+                self._cube = MetricsCube(
+                    axes["companies"], axes["metrics"], axes["years"],
+                    dataset_registry.get(FINANCIAL_METRICS_DATASET).array("values"), industries,
+                )
+                self._versions = versions
+                logger.info(
+                    "✅ 재무지표 큐브 생성: %s (산업 %d개)",
+                    self._cube.values.shape, len(industries),
+                )
+        return self._cube
+
+    def get_industry_summary(self, industry: str) -> Optional[Dict]:
+        return self.get_cube().industry_summary(industry.strip())
+
+    def compare_company(self, name: str) -> Optional[Dict]:
+        return self.get_cube().compare_company(name.strip())
+
+
+# 인스턴스 (라우터에서 import)
+metrics_cube_service = MetricsCubeService()
@@ -0,0 +1,139 @@
+"""
+뉴스 캐시 ((source, query) → 기사 목록).
+
+- 핫 피드(코스피/실적 발표)는 백그라운드 태스크 하나가 고정 주기로 갱신 → 요청은 메모리 조회만
+- 임의 키워드 검색은 짧은 TTL로 캐시
+- 같은 키를 동시에 요청하면 스크래핑은 한 번만 (single-flight). 스크래핑 태스크는 요청과 분리되어
+  있어 한 클라이언트가 연결을 끊어도 다른 대기자에게는 영향이 없다
+- 갱신 실패/빈 결과면 이전 값을 그대로 제공 (stale, 검색 결과는 만료 후 NEWS_STALE_TTL까지)
+- 저장은 utils.cache (LRU + 용량 제한, CACHE_BACKEND=disk 면 워커 간 공유)
+"""
+import asyncio
+import logging
+import os
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from utils.cache import create_cache
+
+logger = logging.getLogger("news_cache")
+
+REFRESH_INTERVAL = float(os.getenv("NEWS_REFRESH_INTERVAL", "300"))  # 핫 피드 갱신 주기 (초)
+SEARCH_TTL = float(os.getenv("NEWS_SEARCH_TTL", "120"))  # 키워드 검색 캐시 (초)
+STALE_TTL = float(os.getenv("NEWS_STALE_TTL", "3600"))  # 만료 후 갱신 실패 시 대신 제공할 기간 (초)
+MAX_ENTRIES = int(os.getenv("NEWS_CACHE_MAX_ENTRIES", "500"))
+
+Key = Tuple[str, str]
+Fetcher = Callable[[], Awaitable[List[Dict]]]
+
+
+class NewsCache:
+    def __init__(self, refresh_interval: float = REFRESH_INTERVAL, max_entries: int = MAX_ENTRIES):
+        self.refresh_interval = refresh_interval
+        self.max_entries = max_entries
+        # 핫 피드는 만료 없음(ttl=None, 백그라운드 갱신), 검색 결과는 요청별 TTL
+        self._entries = create_cache("news", ttl=SEARCH_TTL, stale_ttl=STALE_TTL, max_entries=max_entries)
+        self._feed_fetched_at: Dict[Key, float] = {}
+        self._inflight: Dict[Key, asyncio.Task] = {}
+        self._feeds: Dict[Key, Fetcher] = {}
+        self._refresher: Optional[asyncio.Task] = None
+        self._stats = {"hits": 0, "misses": 0, "stale": 0, "refreshes": 0, "errors": 0}
+
+    def register_feed(self, source: str, query: str, fetcher: Fetcher):
+        """백그라운드에서 주기적으로 갱신할 핫 피드 등록"""
+        self._feeds[(source, query)] = fetcher
+
+    async def get(self, source: str, query: str, fetcher: Fetcher, ttl: Optional[float] = SEARCH_TTL) -> List[Dict]:
+        key = (source, query)
+        if key in self._feeds:
+            ttl = None
+        previous, fresh = self._entries.lookup(key)
+        if fresh:
+            self._stats["hits"] += 1
+            return previous
+
+        self._stats["misses"] += 1
+        try:
+            return await asyncio.shield(self._refresh(key, fetcher, ttl))
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            if previous is None:
+                raise
+            logger.warning("⚠️ 뉴스 갱신 실패 - 이전 캐시 사용 %s: %s", key, e)
+            self._stats["stale"] += 1
+            return previous
+
+    def _refresh(self, key: Key, fetcher: Fetcher, ttl: Optional[float]) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._fetch(key, fetcher, ttl))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return task
+
+    async def _fetch(self, key: Key, fetcher: Fetcher, ttl: Optional[float]) -> List[Dict]:
+        try:
+            value = await fetcher()
+        except Exception:
+            self._stats["errors"] += 1
+            raise
+        if not value:
+            previous = self._entries.get(key, allow_stale=True)
+            if previous is not None:
+                self._stats["stale"] += 1
+                return previous
+            return value  # 빈 결과는 캐시하지 않음
+        self._entries.set(key, value, ttl)
+        if key in self._feeds:
+            self._feed_fetched_at[key] = time.time()
+        return value
+
+    async def refresh_feeds(self):
+        results = await asyncio.gather(
+            *(self._refresh(key, fetcher, None) for key, fetcher in self._feeds.items()),
+            return_exceptions=True,
+        )
+        self._stats["refreshes"] += 1
+        for key, result in zip(self._feeds, results):
+            if isinstance(result, Exception):
+                logger.warning("⚠️ 핫 피드 갱신 실패 %s: %s", key, result)
+
+    async def _refresh_loop(self):
+        while True:
+            try:
+                await self.refresh_feeds()
+            except Exception as e:
+                logger.error("❌ 뉴스 백그라운드 갱신 오류: %s", e)
+            await asyncio.sleep(self.refresh_interval)
+
+    def start(self):
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.create_task(self._refresh_loop())
+            logger.info("🔄 핫 뉴스 백그라운드 갱신 시작 (%d개 피드, %.0fs 주기)",
+                        len(self._feeds), self.refresh_interval)
+
+    async def stop(self):
+        """백그라운드 갱신 + 진행 중인 스크래핑 취소"""
+        tasks = list(self._inflight.values())
+        if self._refresher is not None:
+            tasks.append(self._refresher)
+            self._refresher = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def stats(self) -> Dict:
+        return {
+            **self._stats,
+            "entries": self._entries.stats()["entries"],
+            "feeds": {
+                f"{source}:{query}": round(time.time() - self._feed_fetched_at[(source, query)], 1)
+                if (source, query) in self._feed_fetched_at else None
+                for source, query in self._feeds
+            },
+        }
+
+
+# 인스턴스 (서비스에서 import)
+news_cache = NewsCache()
@@ -0,0 +1,159 @@
+"""
+뉴스 수집 워커: 핫 피드(코스피/실적 발표)와 기업 뉴스를 주기적으로 news_store에 저장.
+핫 피드는 news_cache 가 갱신한 값을 그대로 저장한다 (같은 페이지를 따로 스크래핑하지 않음).
+
+    cd BACKEND
+    python -m services.news_ingest --once                      # 한 번 수집 (MONGODB_URI 필요)
+    python -m services.news_ingest --once --company 삼성전자 LG전자
+
+대상 기업 = NEWS_INGEST_COMPANIES(쉼표 구분) + 최근 /company/{name}/news 로 조회된 기업(최대 NEWS_INGEST_WATCH개).
+테스트: MONGODB_URI=mongodb://localhost:27017 python -m pytest tests/test_news_ingest.py
+      (로컬 mongod + benchmarks/fixtures 고정 페이지 서버. NEWS_DAUM_HOT_URL 등은 conftest 가 지정)
+"""
+import argparse
+import asyncio
+import logging
+import os
+import sys
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+# .env 로드 - 아래 서비스 모듈과 이 모듈의 os.getenv 상수보다 먼저 (CLI 실행 시)
+import config  # noqa: E402,F401
+from services.company_news_service import company_news_service  # noqa: E402
+from services.news_cache import news_cache  # noqa: E402
+from services.news_service import EARNINGS_QUERY, KOSPI_QUERY, news_service  # noqa: E402
+from services.news_store import news_store  # noqa: E402
+
+logger = logging.getLogger("news_ingest")
+
+INGEST_INTERVAL = float(os.getenv("NEWS_INGEST_INTERVAL", "900"))
+INGEST_COMPANIES = [c.strip() for c in os.getenv("NEWS_INGEST_COMPANIES", "").split(",") if c.strip()]
+WATCH_LIMIT = int(os.getenv("NEWS_INGEST_WATCH", "50"))
+COMPANY_CONCURRENCY = 2
+COMPANY_BUDGET = 60.0  # 수집은 응답 시간 제약이 없으므로 소스가 모두 끝날 때까지 대기
+
+
+def hot_feed_key(query: str) -> str:
+    return f"daum_news:{query}"
+
+
+class NewsIngestor:
+    def __init__(self, interval: float = INGEST_INTERVAL, companies: Optional[List[str]] = None,
+                 watch_limit: int = WATCH_LIMIT):
+        self.interval = interval
+        self.companies = list(companies if companies is not None else INGEST_COMPANIES)
+        self.watch_limit = watch_limit
+        self._watched: "OrderedDict[str, None]" = OrderedDict()
+        self._task: Optional[asyncio.Task] = None
+        self.last_run: Dict = {}
+
+    def watch(self, company_name: str):
+        """조회된 기업을 수집 대상에 추가 (오래된 순으로 밀려남)"""
+        name = company_name.strip()
+        if not name:
+            return
+        self._watched[name] = None
+        self._watched.move_to_end(name)
+        while len(self._watched) > self.watch_limit:
+            self._watched.popitem(last=False)
+
+    def targets(self) -> List[str]:
+        return list(dict.fromkeys(self.companies + list(self._watched)))
+
+    async def _ingest_company(self, name: str, semaphore: asyncio.Semaphore) -> int:
+        async with semaphore:
+            result = await company_news_service.search(name, max_news=20, budget=COMPANY_BUDGET)
+            return await news_store.upsert(result["news"], company=name)
+
+    async def run_once(self, companies: Optional[List[str]] = None) -> Dict[str, int]:
+        """한 번 수집. 피드/기업별 새로 저장된 기사 수 반환"""
+        if not news_store.available():
+            logger.warning("⚠️ MongoDB 미연결 - 뉴스 수집 생략")
+            return {}
+        counts = {}
+        for query in (KOSPI_QUERY, EARNINGS_QUERY):
+            try:
+                items = await news_cache.get("daum_news", query, lambda q=query: news_service._scrape_daum_news(q))
+                counts[hot_feed_key(query)] = await news_store.upsert(items, feed=hot_feed_key(query))
+            except Exception as e:
+                logger.error("❌ 핫 피드 수집 실패 (%s): %s", query, e)
+
+        names = self.targets() if companies is None else companies
+        semaphore = asyncio.Semaphore(COMPANY_CONCURRENCY)
+        results = await asyncio.gather(*(self._ingest_company(n, semaphore) for n in names), return_exceptions=True)
+        for name, result in zip(names, results):
+            if isinstance(result, Exception):
+                logger.error("❌ 기업 뉴스 수집 실패 (%s): %s", name, result)
+            else:
+                counts[name] = result
+        self.last_run = counts
+        logger.info("📥 뉴스 수집 완료: 새 기사 %d건 (%s)", sum(counts.values()), counts)
+        return counts
+
+    async def _loop(self):
+        try:
+            await news_store.ensure_indexes()
+        except Exception as e:
+            logger.error("❌ 뉴스 인덱스 생성 실패: %s", e)
+        while True:
+            try:
+                await self.run_once()
+            except Exception as e:
+                logger.error("❌ 뉴스 수집 오류: %s", e)
+            await asyncio.sleep(self.interval)
+
+    def start(self):
+        if not news_store.available():
+            logger.warning("⚠️ MongoDB 미연결 - 뉴스 수집 워커 시작 안 함")
+            return
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._loop())
+            logger.info("📥 뉴스 수집 워커 시작 (%.0fs 주기)", self.interval)
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+
+# 인스턴스 (라우터/앱에서 import)
+news_ingestor = NewsIngestor()
+
+
+async def _main(args) -> int:
+    from utils.database import db_manager
+    from utils.scraper import scrape_engine
+    from utils.selenium_utils import driver_pool
+
+    await db_manager.connect()
+    try:
+        await news_store.ensure_indexes()
+        counts = await news_ingestor.run_once(args.company or None)
+    finally:
+        await scrape_engine.close()
+        await driver_pool.close()
+        db_manager.close()
+    for key, count in counts.items():
+        print(f"  {key:<24} +{count}")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="뉴스 수집")
+    parser.add_argument("--once", action="store_true", help="한 번 수집하고 종료")
+    parser.add_argument("--company", nargs="+", help="수집할 기업 (기본: NEWS_INGEST_COMPANIES)")
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    if not args.once:
+        parser.error("주기 수집은 서버(startup)에서 실행됨. 수동 실행은 --once")
+    return asyncio.run(_main(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,45 +1,105 @@
-from utils.selenium_utils import selenium_manager
+from utils.scraper import parse_document, scrape_engine
+from services.analyst_report_parser import parse_consensus_reports, parse_spv_reports
+from services.news_cache import news_cache, SEARCH_TTL
+from services.news_store import news_store
 from fastapi import HTTPException
-from typing import List, Dict
+from typing import List, Dict, Optional
+from datetime import datetime
+import logging
+import os
+import time
+
+logger = logging.getLogger("news_service")
+
+DAUM_NEWS_SELECTOR = '#dnsColl > div:nth-child(1) > ul > li > div.c-item-content > div > div.item-title > strong > a'
+
+# 검색 URL ({query} 치환). 스텁 사이트로 테스트할 때 환경변수로 교체
+DAUM_NEWS_URL = os.getenv(
+    "NEWS_DAUM_HOT_URL",
+    'https://search.daum.net/nate?w=news&nil_search=btn&DA=PGD&enc=utf8&cluster=y&cluster_page=1&q={query}',
+)
+NAVER_NEWS_URL = os.getenv("NEWS_NAVER_URL", 'https://search.naver.com/search.naver?where=news&query={query}&sort=1')
+# FnGuide 리포트 URL ({code} 치환)
+FNGUIDE_CONSENSUS_URL = os.getenv(
+    "FNGUIDE_CONSENSUS_URL",
+    'https://comp.fnguide.com/SVO2/ASP/SVD_Consensus.asp?pGB=1&gicode={code}&MenuYn=Y&ReportGB=&NewMenuID=108',
+)
+FNGUIDE_SPV_URL = os.getenv("FNGUIDE_SPV_URL", 'https://www.fnguide.com/SPV/SPV_1000.asp?gnb=1&gno={code}')
+
+# 백그라운드에서 주기적으로 갱신하는 핫 피드
+KOSPI_QUERY = '코스피'
+EARNINGS_QUERY = '실적 발표'
+
 
 class NewsService:
     def __init__(self):
-        # 전역 selenium_manager 인스턴스 사용
-        pass
-    
-    async def get_kospi_news(self) -> List[Dict]:
-        """코스피 관련 뉴스 조회"""
+        # 전역 scrape_engine 사용 (HTTP 우선, 필요 시 Selenium 풀), 결과는 news_cache에 공유
+        for query in (KOSPI_QUERY, EARNINGS_QUERY):
+            news_cache.register_feed("daum_news", query, lambda q=query: self._scrape_daum_news(q))
+
+    async def _scrape_daum_news(self, query: str) -> List[Dict]:
+        return await scrape_engine.scrape_links(
+            "daum_news", DAUM_NEWS_URL.format(query=query), DAUM_NEWS_SELECTOR, max_items=5
+        )
+
+    async def _hot_feed(self, query: str, since: Optional[datetime], until: Optional[datetime],
+                        limit: int) -> List[Dict]:
+        """
+        핫 피드: 기간 조건이 없으면 news_cache (백그라운드 갱신본, 수집 워커도 같은 값을 저장),
+        기간 조회는 저장소(MongoDB)에서만 가능
+        """
+        if since or until:
+            if not news_store.available():
+                raise RuntimeError("뉴스 저장소(MongoDB) 미연결 - 기간 조회 불가")
+            return await news_store.find(feed=f"daum_news:{query}", since=since, until=until, limit=limit)
+        items = await news_cache.get("daum_news", query, lambda: self._scrape_daum_news(query))
+        return items[:limit]
+
+    async def get_kospi_news(self, since: Optional[datetime] = None, until: Optional[datetime] = None,
+                             limit: int = 5) -> List[Dict]:
+        """코스피 관련 뉴스 조회 (캐시, 기간 조회는 저장소)"""
         try:
-            url = 'https://search.daum.net/nate?w=news&nil_search=btn&DA=PGD&enc=utf8&cluster=y&cluster_page=1&q=코스피'
-            selector = '#dnsColl > div:nth-child(1) > ul > li > div.c-item-content > div > div.item-title > strong > a'
-            
-            return await selenium_manager.scrape_news(url, selector, max_items=5)
-            
+            return await self._hot_feed(KOSPI_QUERY, since, until, limit)
+
+        except RuntimeError:
+            raise
         except Exception as e:
-            print(f"❌ 코스피 뉴스 조회 실패: {e}")
+            logger.error("❌ 코스피 뉴스 조회 실패: %s", e)
             return []
-    
-    async def get_earnings_news(self) -> List[Dict]:
-        """실적 발표 관련 뉴스 조회"""
+
+    async def get_earnings_news(self, since: Optional[datetime] = None, until: Optional[datetime] = None,
+                                limit: int = 5) -> List[Dict]:
+        """실적 발표 관련 뉴스 조회 (캐시, 기간 조회는 저장소)"""
         try:
-            url = 'https://search.daum.net/nate?w=news&nil_search=btn&DA=PGD&enc=utf8&cluster=y&cluster_page=1&q=실적 발표'
-            selector = '#dnsColl > div:nth-child(1) > ul > li > div.c-item-content > div > div.item-title > strong > a'
-            
-            return await selenium_manager.scrape_news(url, selector, max_items=5)
-            
+            return await self._hot_feed(EARNINGS_QUERY, since, until, limit)
+
+        except RuntimeError:
+            raise
         except Exception as e:
-            print(f"❌ 실적 뉴스 조회 실패: {e}")
+            logger.error("❌ 실적 뉴스 조회 실패: %s", e)
             return []
-    
+
+    async def search_archive(self, text: Optional[str] = None, company: Optional[str] = None,
+                             feed: Optional[str] = None, since: Optional[datetime] = None,
+                             until: Optional[datetime] = None, limit: int = 20) -> List[Dict]:
+        """저장된 기사 검색 (텍스트/기업/피드/기간)"""
+        if not news_store.available():
+            raise RuntimeError("뉴스 저장소(MongoDB) 미연결")
+        return await news_store.find(feed=feed, company=company, text=text, since=since, until=until, limit=limit)
+
     async def search_company_news(self, keyword: str) -> List[Dict]:
-        """기업별 키워드 뉴스 검색"""
+        """기업별 키워드 뉴스 검색 (짧은 TTL 캐시)"""
         try:
             # 네이버 뉴스로 변경
-            url = f'https://search.naver.com/search.naver?where=news&query={keyword}&sort=1'
+            url = NAVER_NEWS_URL.format(query=keyword)
             selector = 'a.news_tit'
-            
+
             # 대기 시간 증가 및 최대 아이템 수 조정
-            return await selenium_manager.scrape_news(url, selector, max_items=10, wait_time=5)
+            return await news_cache.get(
+                "naver_news", keyword.strip(),
+                lambda: scrape_engine.scrape_links("naver_news", url, selector, max_items=10, wait_time=5),
+                ttl=SEARCH_TTL,
+            )
             
         except Exception as e:
             logger.error(f"❌ 기업 뉴스 조회 실패: {e}")
@@ -51,73 +111,56 @@ class NewsService:
             }]
     
     async def get_analyst_reports(self, code: str) -> List[Dict]:
-        """종목분석 리포트 조회"""
+        """종목분석 리포트 조회 (FnGuide 컨센서스)"""
         try:
-            url = f"https://comp.fnguide.com/SVO2/ASP/SVD_Consensus.asp?pGB=1&gicode={code}&MenuYn=Y&ReportGB=&NewMenuID=108"
-            
+            url = FNGUIDE_CONSENSUS_URL.format(code=code)
+
             def custom_scraping_logic(driver):
-                from selenium.webdriver.common.by import By
-                
-                data = []
-                try:
-                    rows = driver.find_elements(By.XPATH, '//*[@id="bodycontent4"]/tr')
-                    
-                    for row in rows:
-                        try:
-                            # 각 컬럼 데이터 추출
-                            date = row.find_element(By.XPATH, './td[1]').text.strip()
-                            title = row.find_element(By.XPATH, './td[2]//span[@class="txt2"]').text.strip()
-                            
-                            # 요약 정보 추출
-                            summary_parts = row.find_elements(By.XPATH, './td[2]//dd')
-                            summary = " / ".join([p.text.strip() for p in summary_parts if p.text.strip()])
-                            
-                            # 추가 정보 추출
-                            opinion = self._extract_text_safely(row, './td[3]/span', '')
-                            target_price = self._extract_text_safely(row, './td[4]/span', '')
-                            closing_price = self._extract_text_safely(row, './td[5]', '')
-                            analyst = self._extract_text_safely(row, './td[6]', '')
-                            
-                            data.append({
-                                "date": date,
-                                "title": title,
-                                "summary": summary,
-                                "opinion": opinion,
-                                "target_price": target_price,
-                                "closing_price": closing_price,
-                                "analyst": analyst
-                            })
-                            
-                            if len(data) >= 5:
-                                break
-                                
-                        except Exception as e:
-                            print(f"⚠️ 행 파싱 중 오류 발생: {e}")
-                            continue
-                            
-                except Exception as e:
-                    print(f"⚠️ 전체 파싱 중 오류 발생: {e}")
-                
-                return data
-            
-            return await selenium_manager.scrape_with_custom_logic(url, custom_scraping_logic, wait_time=2)
-            
+                # 셀마다 WebDriver 왕복하지 않고 페이지 소스를 한 번만 가져와 파싱
+                return parse_consensus_reports(driver.page_source)
+
+            return await scrape_engine.scrape(
+                "fnguide_consensus", url, parse_consensus_reports, custom_scraping_logic,
+                wait_time=2, parser=parse_document,
+            )
+
         except Exception as e:
-            print(f"❌ 애널리스트 리포트 조회 실패: {e}")
+            logger.error("❌ 애널리스트 리포트 조회 실패: %s", e)
             return []
-    
-    def _extract_text_safely(self, element, xpath: str, default: str = "") -> str:
-        """안전한 텍스트 추출"""
-        try:
+
+    async def get_company_reports(self, code: str) -> Dict:
+        """기업 리포트 조회 (FnGuide SPV 리포트 표)"""
+        url = FNGUIDE_SPV_URL.format(code=code)
+
+        def custom_scraping_logic(driver):
+            from selenium.webdriver.support.ui import WebDriverWait
+            from selenium.webdriver.support import expected_conditions as EC
             from selenium.webdriver.common.by import By
-            text = element.find_element(By.XPATH, xpath).text.strip()
-            return text if text else default
-        except:
-            return default
-    
+
+            try:
+                # 애널리스트 리포트 테이블 대기 후 표 HTML을 한 번만 가져와 파싱
+                table = WebDriverWait(driver, 10).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "table.table_common"))
+                )
+                return {"reports": parse_spv_reports(table.get_attribute("outerHTML"))}
+            except Exception as e:
+                return {"reports": [], "error": str(e)}
+
+        def html_logic(doc):
+            reports = parse_spv_reports(doc)
+            return {"reports": reports} if reports else None
+
+        return await scrape_engine.scrape(
+            "fnguide_spv", url, html_logic, custom_scraping_logic, parser=parse_document
+        )
+
     def safe_get(self, data, key, default=""):
         """안전한 데이터 추출"""
         try:
             return data.get(key, default)
         except:
             return default
+
+
+# 인스턴스 (라우터에서 import)
+news_service = NewsService()
@@ -0,0 +1,168 @@
+"""
+뉴스 기사 저장소 (MongoDB news 컬렉션).
+
+    {_id: sha1(정규화 URL), url, title, content, press, source,
+     feeds: ["daum_news:코스피", ...], companies: ["삼성전자", ...],
+     published_at, first_seen, fetched_at}
+
+- 같은 기사는 URL 해시로 한 문서에 upsert 되고 feeds/companies 만 누적된다
+- fetched_at TTL 인덱스로 NEWS_TTL_DAYS 동안 다시 수집되지 않은 기사는 자동 만료
+- title/content 텍스트 인덱스 (한국어 형태소 분석이 없어 default_language="none", 어절 단위 검색)
+- 시각은 UTC(aware)로 저장 (TTL 인덱스/기간 조회 기준). 기사 날짜 표기와 응답 표시는 한국 시간(KST)
+- pymongo는 동기 드라이버이므로 모든 호출은 스레드에서 실행
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+
+from pymongo import DESCENDING, UpdateOne
+
+from services.company_news_service import normalize_url
+from utils.database import db_manager
+
+logger = logging.getLogger("news_store")
+
+COLLECTION_NEWS = os.getenv("COLLECTION_NEWS", "news")
+TTL_DAYS = int(os.getenv("NEWS_TTL_DAYS", "30"))
+KST = timezone(timedelta(hours=9))  # 기사 날짜 표기/날짜 쿼리 기준 (일광 절약 시간 없음)
+
+_ABSOLUTE_DATE = re.compile(r"(\d{4})[./-](\d{1,2})[./-](\d{1,2})")
+_RELATIVE_DATE = re.compile(r"(\d+)\s*(분|시간|일|주)\s*전")
+_RELATIVE_UNITS = {"분": "minutes", "시간": "hours", "일": "days", "주": "weeks"}
+
+
+def article_id(url: str) -> str:
+    return hashlib.sha1(normalize_url(url).encode("utf-8")).hexdigest()
+
+
+def parse_published(text: Optional[str], now: datetime) -> Optional[datetime]:
+    """검색 결과의 날짜 표기 → aware datetime ('2024.01.02.'는 KST 자정, '3시간 전'/'어제'는 now 기준). 알 수 없으면 None"""
+    if not text:
+        return None
+    match = _ABSOLUTE_DATE.search(text)
+    if match:
+        try:
+            return datetime(*map(int, match.groups()), tzinfo=KST)
+        except ValueError:
+            return None
+    match = _RELATIVE_DATE.search(text)
+    if match:
+        return now - timedelta(**{_RELATIVE_UNITS[match.group(2)]: int(match.group(1))})
+    if "어제" in text:
+        return now - timedelta(days=1)
+    return None
+
+
+def to_document(item: Dict, now: datetime) -> Dict:
+    """스크래핑 결과(뉴스 목록/기업 뉴스 형식 모두) → 저장 필드"""
+    url = item.get("url") or item.get("link")
+    return {
+        "url": url,
+        "title": item.get("title", ""),
+        "content": item.get("content", ""),
+        "press": item.get("category", ""),
+        "source": item.get("source", ""),
+        "published_at": parse_published(item.get("date"), now),
+    }
+
+
+def _local(value: datetime) -> datetime:
+    """저장 시각 → KST (pymongo 는 tz_aware 없이 UTC 를 naive 로 돌려줌)"""
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(KST)
+
+
+def to_item(doc: Dict) -> Dict:
+    """저장 문서 → API 응답 (기존 뉴스 목록 필드 + 기업 뉴스 필드)"""
+    published = doc.get("published_at") or doc.get("first_seen")
+    return {
+        "title": doc.get("title", ""),
+        "url": doc.get("url"),
+        "link": doc.get("url"),
+        "content": doc.get("content", ""),
+        "category": doc.get("press", ""),
+        "source": doc.get("source", ""),
+        "date": _local(published).strftime("%Y-%m-%d %H:%M") if published else "",
+        "timestamp": _local(doc["fetched_at"]).strftime("%Y-%m-%d %H:%M:%S") if doc.get("fetched_at") else "",
+    }
+
+
+class NewsStore:
+    def __init__(self, collection_name: str = COLLECTION_NEWS, ttl_days: int = TTL_DAYS):
+        self.collection_name = collection_name
+        self.ttl_days = ttl_days
+        self._indexed = False
+
+    def available(self) -> bool:
+        return db_manager.is_connected()
+
+    def _collection(self):
+        return db_manager.get_collection(self.collection_name)
+
+    def _ensure_indexes(self):
+        collection = self._collection()
+        collection.create_index("fetched_at", expireAfterSeconds=self.ttl_days * 86400, name="ttl_fetched_at")
+        collection.create_index([("title", "text"), ("content", "text")], default_language="none",
+                                weights={"title": 3, "content": 1}, name="text_title_content")
+        collection.create_index([("feeds", 1), ("published_at", DESCENDING)], name="feed_published")
+        collection.create_index([("companies", 1), ("published_at", DESCENDING)], name="company_published")
+        self._indexed = True
+        logger.info("✅ 뉴스 컬렉션 인덱스 확인 (%s, TTL %d일)", self.collection_name, self.ttl_days)
+
+    async def ensure_indexes(self):
+        await asyncio.to_thread(self._ensure_indexes)
+
+    def _upsert(self, items: List[Dict], feed: Optional[str], company: Optional[str]) -> int:
+        if not self._indexed:
+            self._ensure_indexes()
+        now = datetime.now(timezone.utc)
+        operations = []
+        for item in items:
+            doc = to_document(item, now)
+            if not doc["url"] or not doc["title"]:
+                continue
+            published = doc.pop("published_at")
+            update = {"$set": {**doc, "fetched_at": now}, "$setOnInsert": {"first_seen": now}}
+            if published:
+                update["$set"]["published_at"] = published
+            else:  # 날짜 표기가 없으면 처음 수집한 시각
+                update["$setOnInsert"]["published_at"] = now
+            added = {k: v for k, v in (("feeds", feed), ("companies", company)) if v}
+            if added:
+                update["$addToSet"] = added
+            operations.append(UpdateOne({"_id": article_id(doc["url"])}, update, upsert=True))
+        if not operations:
+            return 0
+        result = self._collection().bulk_write(operations, ordered=False)
+        return result.upserted_count
+
+    async def upsert(self, items: List[Dict], feed: Optional[str] = None, company: Optional[str] = None) -> int:
+        """기사 upsert. 새로 추가된 기사 수 반환"""
+        return await asyncio.to_thread(self._upsert, items, feed, company)
+
+    def _find(self, feed, company, text, since, until, limit) -> List[Dict]:
+        query: Dict = {}
+        if feed:
+            query["feeds"] = feed
+        if company:
+            query["companies"] = company
+        if text:
+            query["$text"] = {"$search": text}
+        if since or until:
+            query["published_at"] = {k: v for k, v in (("$gte", since), ("$lt", until)) if v}
+        cursor = self._collection().find(query).sort([("published_at", DESCENDING), ("first_seen", DESCENDING)])
+        return [to_item(doc) for doc in cursor.limit(limit)]
+
+    async def find(self, feed: Optional[str] = None, company: Optional[str] = None, text: Optional[str] = None,
+                   since: Optional[datetime] = None, until: Optional[datetime] = None, limit: int = 20) -> List[Dict]:
+        """피드/기업/텍스트/기간 조건으로 최신순 조회"""
+        return await asyncio.to_thread(self._find, feed, company, text, since, until, limit)
+
+
+# 인스턴스 (서비스/라우터에서 import)
+news_store = NewsStore()
@@ -0,0 +1,119 @@
+import logging
+import os
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pandas as pd
+
+from utils.artifacts import read_snapshot_artifact
+from utils.dataset_registry import dataset_registry
+from utils.snapshot import Snapshot, load_or_build
+from utils.ticker_utils import normalize_ticker
+
+logger = logging.getLogger("sales_composition_service")
+
+DATASET = "sales_composition"
+SNAPSHOT_NAME = "sales_composition.v2"  # v2: 종목코드를 6자리 문자열로 저장 (이전 스냅샷은 다시 빌드)
+
+
+def sales_snapshot_parts(df: pd.DataFrame) -> Dict:
+    """
+    매출 구성 프레임 → 스냅샷 구성요소. 같은 기업의 행이 연속되도록 (첫 등장 순서 유지) 정렬해
+    기업별 조회를 행 범위 슬라이스로 만든다. 문자열 컬럼(연도별 매출액 포함, 비중 행은 '%' 문자열)은
+    사전 인코딩으로 저장한다. 종목코드는 원본 CSV/아티팩트 빌드 모두 6자리 문자열로 맞춘다.
+    """
+    df = df.assign(종목코드=df["종목코드"].map(normalize_ticker))
+    codes, _ = pd.factorize(df["종목명"])
+    df = df.iloc[np.argsort(codes, kind="stable")].reset_index(drop=True)
+
+    arrays, strings = {}, {}
+    for col in df.columns:
+        if pd.api.types.is_numeric_dtype(df[col]):
+            arrays[col] = df[col].to_numpy()
+        else:
+            strings[col] = df[col].to_numpy(dtype=object)
+    return {"arrays": arrays, "strings": strings, "meta": {"columns": list(df.columns)}}
+
+
+def load_sales_snapshot(csv_path: str) -> Snapshot:
+    """NICE 내수/수출 CSV를 스냅샷으로 변환(최초 1회)한 뒤 읽기 전용으로 매핑"""
+    return load_or_build(
+        SNAPSHOT_NAME, csv_path,
+        lambda p: sales_snapshot_parts(pd.read_csv(p, encoding="utf-8-sig", dtype={"종목코드": str})),
+    )
+
+
+def build_sales_index(snapshot: Snapshot) -> Dict:
+    """기업명 / 6자리 종목코드 → 스냅샷 행 범위 (start, stop) 인덱스"""
+    name_col = snapshot.strings("종목명")
+    name_codes = np.asarray(name_col.codes)
+    if not len(name_codes):
+        return {"by_name": {}, "by_code": {}, "names": []}
+    starts = np.concatenate(([0], np.flatnonzero(np.diff(name_codes)) + 1))
+    stops = np.append(starts[1:], len(name_codes))
+    ticker = snapshot.column("종목코드")
+
+    by_name: Dict[str, Tuple[int, int]] = {}
+    by_code: Dict[str, List[Tuple[int, int]]] = {}
+    for start, stop in zip(starts.tolist(), stops.tolist()):
+        by_name[name_col[start]] = (start, stop)
+        code = normalize_ticker(ticker[start])
+        if code:
+            by_code.setdefault(code, []).append((start, stop))
+    return {"by_name": by_name, "by_code": by_code, "names": list(by_name)}
+
+
+def sales_frame(snapshot: Snapshot) -> pd.DataFrame:
+    """벡터 연산(수출 비중 큐브 등)용 DataFrame (큐브 생성 중에만 잠시 보관)"""
+    return snapshot.to_frame(snapshot.meta["columns"], categorical=False)
+
+
+dataset_registry.register(
+    DATASET, "NICE_내수수출_코스피.csv", loader=load_sales_snapshot, indexer=build_sales_index,
+    artifact_loader=read_snapshot_artifact,
+)
+
+
+class SalesCompositionService:
+    """
+    NICE 내수/수출 매출 구성 데이터를 기업별 행 범위 인덱스로 조회한다.
+    - 기업명 인덱스 / 6자리 종목코드 인덱스 → (start, stop)
+    - 행(record)은 요청 시 매핑된 스냅샷에서 만든다 (워커별 전체 사본 없음)
+    """
+
+    def _index(self) -> Dict:
+        return dataset_registry.index(DATASET)
+
+    def _rows(self, ranges: List[Tuple[int, int]]) -> List[Dict]:
+        snapshot = dataset_registry.get(DATASET)
+        columns = snapshot.meta["columns"]
+        rows = []
+        for start, stop in ranges:
+            rows.extend(snapshot.rows(columns, start, stop))
+        return rows
+
+    def get_by_name(self, company_name: str) -> List[Dict]:
+        """
+        기업명으로 매출 구성 조회.
+        정확히 일치하는 기업이 없으면 기업명 목록(수백 개)에서만 부분 일치를 찾는다.
+        """
+        index = self._index()
+        by_name = index["by_name"]
+        exact = by_name.get(company_name)
+        if exact:
+            return self._rows([exact])
+        return self._rows([by_name[name] for name in index["names"] if company_name in name])
+
+    def get_by_code(self, code) -> List[Dict]:
+        """종목코드로 매출 구성 조회"""
+        key = normalize_ticker(code)
+        if not key:
+            return []
+        return self._rows(self._index()["by_code"].get(key, []))
+
+    def is_available(self) -> bool:
+        return os.path.exists(dataset_registry.path(DATASET))
+
+
+# 인스턴스 (라우터에서 import)
+sales_composition_service = SalesCompositionService()
@@ -0,0 +1,196 @@
+import logging
+from typing import Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+from services.ticker_resolver import ticker_resolver
+from utils.artifacts import read_snapshot_artifact
+from utils.dataset_registry import dataset_registry, load_json
+from utils.snapshot import Snapshot, load_or_build
+from utils.ticker_utils import normalize_ticker
+
+logger = logging.getLogger("shareholder_service")
+
+DATASET = "shareholders"
+
+# 랭킹 정렬에 사용할 수 있는 지표
+RANKING_FIELDS = ("largest_holder", "treasury_ratio", "insider_ratio", "free_float", "hhi")
+
+
+def _category(label: str) -> str:
+    """주주구분 문자열(NBSP 포함)을 단순 분류로 변환"""
+    label = (label or "").replace("\xa0", " ")
+    if label.startswith("최대주주"):
+        return "largest"
+    if label.startswith("자기주식"):
+        return "treasury"
+    return "block"
+
+
+def compute_concentration(holdings: List[Dict]) -> Dict:
+    """
+    주주구분별 지분율 목록으로 지분 집중도 지표 계산.
+    - largest_holder: 최대주주등(본인+특별관계자) 지분율
+    - treasury_ratio: 자기주식 비율
+    - insider_ratio: 공시된 주주구분 지분율 합계 (최대주주/5%이상/임원/우리사주/자기주식 등)
+    - free_float: 100 - insider_ratio (추정 유통비율)
+    - hhi: 의결권 있는 주주구분별 HHI (0~10000). 대표주주수가 여럿이면 균등 분할로 근사
+    """
+    largest = 0.0
+    treasury = 0.0
+    insider = 0.0
+    hhi = 0.0
+    for item in holdings:
+        try:
+            ratio = float(item.get("지분율") or 0)
+        except (TypeError, ValueError):
+            continue
+        kind = _category(item.get("주주구분"))
+        insider += ratio
+        if kind == "largest":
+            largest += ratio
+        elif kind == "treasury":
+            treasury += ratio
+            continue  # 자기주식은 의결권이 없어 HHI에서 제외
+        holders = max(int(item.get("대표주주수") or 1), 1)
+        hhi += ratio * ratio / holders
+
+    insider = min(insider, 100.0)
+    return {
+        "largest_holder": round(largest, 2),
+        "treasury_ratio": round(treasury, 2),
+        "insider_ratio": round(insider, 2),
+        "free_float": round(100.0 - insider, 2),
+        "hhi": round(hhi, 1),
+    }
+
+
+def shareholder_snapshot_parts(raw: Dict[str, List[Dict]]) -> Dict:
+    """
+    {종목코드: [지분 항목]} → 스냅샷 구성요소.
+    - 지분 항목은 한 테이블(주주구분/지분율/대표주주수 컬럼)로 펼치고 종목별 [start, stop) 범위를 저장
+    - 종목별 집중도 지표는 지표별 float64 배열로 미리 계산
+    """
+    keys, codes, starts, stops, items = [], [], [], [], []
+    metrics = {field: [] for field in RANKING_FIELDS}
+    for key, holdings in raw.items():
+        code = normalize_ticker(key)
+        if not code:
+            continue
+        keys.append(key)
+        codes.append(code)
+        starts.append(len(items))
+        items.extend(holdings)
+        stops.append(len(items))
+        for field, value in compute_concentration(holdings).items():
+            metrics[field].append(value)
+
+    table = pd.DataFrame(items)
+    arrays = {
+        "start": np.array(starts, dtype=np.int64),
+        "stop": np.array(stops, dtype=np.int64),
+        **{f"metric.{field}": np.array(values, dtype=np.float64) for field, values in metrics.items()},
+    }
+    strings = {"key": keys, "code": codes}
+    for col in table.columns:
+        if pd.api.types.is_numeric_dtype(table[col]):
+            arrays[f"holding.{col}"] = table[col].to_numpy()
+        else:
+            strings[f"holding.{col}"] = table[col].to_numpy(dtype=object)
+    return {"arrays": arrays, "strings": strings, "meta": {"holding_columns": list(table.columns)}}
+
+
+def load_shareholder_snapshot(path: str) -> Snapshot:
+    return load_or_build(DATASET, path, lambda p: shareholder_snapshot_parts(load_json(p)))
+
+
+def build_shareholder_index(snapshot: Snapshot) -> Dict:
+    """종목코드(6자리) → 스냅샷 행 번호"""
+    codes = snapshot.strings("code")
+    return {"rows": {codes[i]: i for i in range(len(codes))}}
+
+
+dataset_registry.register(
+    DATASET, "지분현황.json", loader=load_shareholder_snapshot, indexer=build_shareholder_index,
+    artifact_loader=read_snapshot_artifact,
+)
+
+
+class ShareholderService:
+    """
+    지분현황.json을 스냅샷(지분 항목 테이블 + 종목별 집중도 배열)으로 매핑해
+    종목코드(6자리) → 행 번호 인덱스로 조회한다.
+    """
+
+    def _index(self) -> Dict:
+        return dataset_registry.index(DATASET)
+
+    def _snapshot(self) -> Snapshot:
+        return dataset_registry.get(DATASET)
+
+    def _holdings_at(self, snapshot: Snapshot, row: int) -> List[Dict]:
+        columns = [f"holding.{c}" for c in snapshot.meta["holding_columns"]]
+        start, stop = int(snapshot.array("start")[row]), int(snapshot.array("stop")[row])
+        return [
+            {k.split(".", 1)[1]: v for k, v in item.items()}
+            for item in snapshot.rows(columns, start, stop)
+        ]
+
+    def _metrics_at(self, snapshot: Snapshot, row: int) -> Dict:
+        return {field: float(snapshot.array(f"metric.{field}")[row]) for field in RANKING_FIELDS}
+
+    def get_raw_data(self) -> Dict[str, List[Dict]]:
+        """원본 형태(A접두 종목코드 키) 전체 데이터"""
+        snapshot = self._snapshot()
+        keys = snapshot.strings("key")
+        return {keys[i]: self._holdings_at(snapshot, i) for i in range(len(keys))}
+
+    def get_holdings(self, code) -> List[Dict]:
+        """종목코드로 주주구분별 지분 정보 조회. 없으면 []"""
+        key = normalize_ticker(code)
+        if not key:
+            return []
+        try:
+            row = self._index()["rows"].get(key)
+            return [] if row is None else self._holdings_at(self._snapshot(), row)
+        except Exception as e:
+            logger.warning("지분현황.json 로드 실패: %s", e)
+            return []
+
+    def get_concentration(self, code) -> Optional[Dict]:
+        """종목코드로 지분 집중도 지표 조회. 없으면 None"""
+        key = normalize_ticker(code)
+        if not key:
+            return None
+        row = self._index()["rows"].get(key)
+        if row is None:
+            return None
+        snapshot = self._snapshot()
+        return {
+            "종목코드": key,
+            "기업명": ticker_resolver.names().get(key),
+            **self._metrics_at(snapshot, row),
+            "holdings": self._holdings_at(snapshot, row),
+        }
+
+    def get_ranking(self, sort_by: str = "largest_holder", descending: bool = True,
+                    limit: int = 50) -> List[Dict]:
+        """지분 집중도 지표 기준 전체 종목 랭킹"""
+        if sort_by not in RANKING_FIELDS:
+            raise ValueError(f"지원하지 않는 정렬 기준: {sort_by}")
+        snapshot = self._snapshot()
+        values = snapshot.array(f"metric.{sort_by}")
+        # 안정 정렬: 동률이면 원본 순서 유지
+        order = np.argsort(-values if descending else values, kind="stable")[:limit]
+        codes = snapshot.strings("code")
+        names = ticker_resolver.names()  # 적재 확인은 한 번, 행마다 dict 조회
+        return [
+            {"종목코드": codes[row], "기업명": names.get(codes[row]),
+             **self._metrics_at(snapshot, row)}
+            for row in order.tolist()
+        ]
+
+
+# 인스턴스 (라우터에서 import)
+shareholder_service = ShareholderService()
@@ -1,12 +1,23 @@
 import logging
+import os
+import time
 from datetime import datetime, timedelta, date
 from typing import List, Dict, Optional
 
 import yfinance as yf
 from pykrx import stock
 
+from services.financial_metrics_service import financial_metrics_service
+from utils.cache import create_cache
+from utils.circuit_breaker import breakers
+from utils.dataset_registry import dataset_registry
+
 logger = logging.getLogger("stock_service")
 
+MARKET_TTL = float(os.getenv("STOCK_CACHE_TTL", "600"))  # 외부 시세 조회 결과 캐시 (초)
+# 라우터가 StockService 를 따로 만들어도 공유되도록 모듈 수준. 만료 후 1일까지는 조회 실패 시 대신 사용
+market_cache = create_cache("stock_market", ttl=MARKET_TTL, stale_ttl=86400, max_entries=500)
+
 
 def _to_datestring(d) -> str:
     return d.strftime("%Y-%m-%d") if hasattr(d, "strftime") else str(d)
@@ -64,6 +75,15 @@ def _nearest_business_day_str(yyyymmdd: Optional[str] = None, back_limit: int =
     return date.today().strftime("%Y%m%d")
 
 
+# 산업별설명.json: [{"industry": ..., "analysis": ...}] → 산업명 인덱스
+INDUSTRY_EXPLAIN_DATASET = "industry_explain"
+dataset_registry.register(
+    INDUSTRY_EXPLAIN_DATASET,
+    "산업별설명.json",
+    indexer=lambda data: {item.get("industry"): item for item in data},
+)
+
+
 class StockService:
     def __init__(self):
         pass
@@ -73,16 +93,18 @@ class StockService:
         """
         개별 종목 가격. 실패/빈결과여도 [] 반환(예외/에러 dict 금지).
         """
+        return market_cache.get_or_load(("price", ticker), lambda: self._fetch_stock_price(ticker))
+
+    def _fetch_stock_price(self, ticker: str) -> List[Dict]:
         try:
-            # API 요청 제한 방지를 위한 대기
-            time.sleep(1)
-            
             # period 대신 start/end 사용 (더 안정적)
             today = date.today()
             start = today - timedelta(days=365)
             end = today + timedelta(days=1)
-            
-            df = yf.download(ticker, start=start, end=end, interval="1d", progress=False, threads=False)
+
+            with breakers.get("yfinance", "download").guard():
+                time.sleep(1)  # API 요청 제한 방지를 위한 대기 (차단 중이면 생략)
+                df = yf.download(ticker, start=start, end=end, interval="1d", progress=False, threads=False)
             data = _normalize_yf_close(df)
             if data is None:
                 logger.warning("yfinance 종목 데이터 없음: %s", ticker)
@@ -94,19 +116,28 @@ class StockService:
 
     def get_kospi_data(self) -> List[Dict]:
         """
-        코스피 지수 데이터: FDR(KS11) → yfinance(^KS11) → 정적 폴백
+        코스피 지수 데이터: 캐시 → FDR(KS11) → yfinance(^KS11) → 마지막 성공 데이터 → 정적 폴백
         어떤 경우에도 예외를 올리지 않고 리스트 반환.
         """
+        data = market_cache.get_or_load("kospi", self._fetch_kospi_data)
+        if data:
+            return data
+        logger.info("✅ 정적 데이터로 코스피 데이터 조회 성공")
+        return self._get_static_kospi_data()
+
+    def _fetch_kospi_data(self) -> List[Dict]:
+        """FDR → yfinance. 모두 실패하면 []"""
         try:
             today = date.today()
             start = today - timedelta(days=365)
             end = today + timedelta(days=1)  # 서버 타임존 차이로 하루 여유
 
-            # 1) FinanceDataReader (가장 안정적) - 1회만 시도 후 429면 즉시 폴백
+            # 1) FinanceDataReader (가장 안정적) - 1회만 시도 후 429면 즉시 폴백 (차단 중이면 바로 yfinance)
             try:
-                time.sleep(1)  # API 요청 제한 방지
-                import FinanceDataReader as fdr
-                df = fdr.DataReader("KS11", start, end)
+                with breakers.get("fdr", "index").guard():
+                    time.sleep(1)  # API 요청 제한 방지
+                    import FinanceDataReader as fdr
+                    df = fdr.DataReader("KS11", start, end)
                 if df is not None and not df.empty:
                     df = df.reset_index()
                     out = []
@@ -124,8 +155,9 @@ class StockService:
 
             # 2) yfinance (보조 수단) - start~end 사용
             try:
-                time.sleep(1)  # API 요청 제한 방지
-                df = yf.download("^KS11", start=start, end=end, interval="1d", progress=False, threads=False)
+                with breakers.get("yfinance", "index").guard():
+                    time.sleep(1)  # API 요청 제한 방지
+                    df = yf.download("^KS11", start=start, end=end, interval="1d", progress=False, threads=False)
                 out = _normalize_yf_close(df)
                 if out:
                     logger.info("yfinance(^KS11)로 코스피 데이터 조회 성공")
@@ -134,13 +166,11 @@ class StockService:
             except Exception as e:
                 logger.warning("yfinance 실패(^KS11): %s", e)
 
-            # 3) 정적 폴백
-            logger.info("✅ 정적 데이터로 코스피 데이터 조회 성공")
-            return self._get_static_kospi_data()
+            return []
 
         except Exception as e:
             logger.error("코스피 데이터 조회 실패(최상위): %s", e)
-            return self._get_static_kospi_data()
+            return []
 
     def _get_static_kospi_data(self) -> List[Dict]:
         """
@@ -160,10 +190,15 @@ class StockService:
         시가총액 TOP10. 휴장일 보정 후 호출.
         실패 시 빈 리스트로 반환해 프런트가 정상적으로 렌더하도록 함.
         """
+        return market_cache.get_or_load("market_cap_top10", self._fetch_market_cap_top10,
+                                        ok=lambda r: bool(r["시가총액_TOP10"]))
+
+    def _fetch_market_cap_top10(self) -> Dict:
         try:
-            time.sleep(1)  # API 요청 제한 방지
-            ds = _nearest_business_day_str()
-            df = stock.get_market_cap_by_ticker(ds, "KOSPI")
+            with breakers.get("pykrx", "market_cap").guard():
+                time.sleep(1)  # API 요청 제한 방지
+                ds = _nearest_business_day_str()
+                df = stock.get_market_cap_by_ticker(ds, "KOSPI")
             if df is None or df.empty:
                 logger.warning("시가총액 데이터 없음(%s)", ds)
                 return {"시가총액_TOP10": []}
@@ -192,10 +227,14 @@ class StockService:
         """
         거래량 TOP5. 휴장일 보정 후 호출. 실패 시 [].
         """
+        return market_cache.get_or_load("top_volume", self._fetch_top_volume)
+
+    def _fetch_top_volume(self) -> List[Dict]:
         try:
-            time.sleep(1)  # API 요청 제한 방지
-            ds = _nearest_business_day_str()
-            df = stock.get_market_ohlcv(ds, "KOSPI")
+            with breakers.get("pykrx", "ohlcv").guard():
+                time.sleep(1)  # API 요청 제한 방지
+                ds = _nearest_business_day_str()
+                df = stock.get_market_ohlcv(ds, "KOSPI")
             if df is None or df.empty:
                 logger.warning("거래량 데이터 없음(%s)", ds)
                 return []
@@ -218,19 +257,15 @@ class StockService:
             logger.warning("거래량 데이터 조회 실패: %s", e)
             return []
 
-    def get_industry_analysis(self, name: str) -> Dict:
+    def get_industry_analysis(self, name: str, limit: Optional[int] = None) -> Dict:
         """
         산업별 재무지표 분석 정보 조회. 파일 미존재/키 미존재도 예외 올리지 않고 404 메시지로 반환.
+        (limit은 라우터 호환용 인자로, 단일 산업 조회에는 사용하지 않음)
         """
         try:
-            import json
-            with open("산업별설명.json", encoding="utf-8") as f:
-                data = json.load(f)
-
-            name = name.strip()
-            for item in data:
-                if item.get("industry") == name:
-                    return item
+            item = dataset_registry.index(INDUSTRY_EXPLAIN_DATASET).get(name.strip())
+            if item is not None:
+                return item
             return {"error": "해당 산업 정보가 없습니다."}
         except FileNotFoundError:
             return {"error": "산업별설명.json 파일을 찾을 수 없습니다."}
@@ -242,10 +277,8 @@ class StockService:
         기업 재무지표 JSON 조회. 실패 시 에러 메시지 반환.
         """
         try:
-            import json
-            with open("기업별_재무지표.json", "r", encoding="utf-8") as f:
-                data = json.load(f)
-            return data.get(name, {"error": "해당 기업 지표가 없습니다."})
+            data = financial_metrics_service.get_company(name)
+            return data if data is not None else {"error": "해당 기업 지표가 없습니다."}
         except Exception as e:
             return {"error": str(e)}
 
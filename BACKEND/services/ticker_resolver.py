@@ -0,0 +1,168 @@
+import asyncio
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from utils.database import db_manager
+from utils.dataset_registry import dataset_registry
+from utils.ticker_utils import normalize_ticker
+
+logger = logging.getLogger("ticker_resolver")
+
+MAX_MISSES = 1024  # 찾지 못한 기업명 캐시 최대 개수 (기업명은 사용자 입력)
+
+
+def build_universe_index(data: List[Dict]) -> Dict[str, str]:
+    """종목명 → 6자리 종목코드"""
+    codes = {}
+    for item in data:
+        name = item.get("종목명")
+        code = normalize_ticker(item.get("종목코드"))
+        if name and code:
+            codes.setdefault(name, code)
+    return codes
+
+
+# DB 미연결 시 사용할 로컬 종목 유니버스 (종목코드/종목명 포함)
+UNIVERSE_DATASET = "sales_chart"
+dataset_registry.register(UNIVERSE_DATASET, "매출비중_chartjs_데이터.json", indexer=build_universe_index)
+
+
+class TickerResolver:
+    """
+    기업명 → 6자리 종목코드 변환기.
+    explain 컬렉션의 (기업명, 종목코드)만 한 번에 읽어 메모리에 캐시하고,
+    DB를 쓸 수 없으면 로컬 종목 유니버스 파일로 대체한다.
+    적재는 동기(pymongo)이므로 async 라우트는 refresh()/resolve_async() 로 스레드에서 적재한다.
+    적재 실패/빈 결과도 만료 시각까지 기억해 요청마다 다시 적재하지 않는다.
+    """
+
+    def __init__(self, ttl: int = 3600, fallback_ttl: int = 60, miss_ttl: int = 60):
+        self.ttl = ttl
+        # 로컬 파일로 대체했거나 적재에 실패한 경우엔 DB 복구를 빨리 반영하도록 짧게 유지
+        self.fallback_ttl = fallback_ttl
+        # 찾지 못한 기업명은 잠시 기억 (DB 단건 조회 반복 방지)
+        self.miss_ttl = miss_ttl
+        self._codes: Dict[str, str] = {}
+        self._names: Dict[str, str] = {}
+        self._expires_at = 0.0
+        self._source = None
+        self._misses: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _load_from_db(self) -> Dict[str, str]:
+        collection = db_manager.get_collection("explain")
+        codes = {}
+        for doc in collection.find({}, {"기업명": 1, "종목코드": 1, "_id": 0}):
+            name = doc.get("기업명")
+            code = normalize_ticker(doc.get("종목코드"))
+            if name and code:
+                codes.setdefault(name, code)
+        return codes
+
+    def _load_from_file(self) -> Dict[str, str]:
+        return dict(dataset_registry.index(UNIVERSE_DATASET))
+
+    def _is_fresh(self) -> bool:
+        return time.time() < self._expires_at
+
+    def _ensure_loaded(self):
+        """캐시가 만료됐으면 다시 적재 (실패하면 이전 값을 유지하고 fallback_ttl 뒤 재시도)"""
+        if self._is_fresh():
+            return
+        with self._lock:
+            if self._is_fresh():
+                return
+            try:
+                codes, source = self._load_from_db(), "explain"
+            except Exception as e:
+                logger.warning("explain 컬렉션 종목코드 적재 실패 → 로컬 파일 사용: %s", e)
+                try:
+                    codes, source = self._load_from_file(), "file"
+                except Exception as fe:
+                    logger.error("로컬 종목 유니버스 적재 실패: %s", fe)
+                    self._expires_at = time.time() + self.fallback_ttl
+                    return
+            self._codes = codes
+            self._names = {code: name for name, code in codes.items()}
+            self._source = source
+            self._misses.clear()
+            self._expires_at = time.time() + (self.ttl if source == "explain" else self.fallback_ttl)
+            logger.info("✅ 종목코드 캐시 적재 완료: %d개 (%s)", len(codes), source)
+
+    async def refresh(self):
+        """만료됐으면 스레드에서 다시 적재 (async 라우트에서 동기 조회 전에 호출)"""
+        if not self._is_fresh():
+            await asyncio.to_thread(self._ensure_loaded)
+
+    def _missed(self, name: str) -> bool:
+        expires = self._misses.get(name)
+        return expires is not None and time.time() < expires
+
+    def _remember_miss(self, name: str):
+        self._misses[name] = time.time() + self.miss_ttl
+        self._misses.move_to_end(name)
+        while len(self._misses) > MAX_MISSES:
+            self._misses.popitem(last=False)
+
+    def resolve(self, company_name: str) -> Optional[str]:
+        """기업명으로 6자리 종목코드 조회. 없으면 None"""
+        name = (company_name or "").strip()
+        if not name:
+            return None
+
+        self._ensure_loaded()
+        code = self._codes.get(name)
+        if code or self._missed(name):
+            return code
+
+        # 캐시 적재 이후 추가된 기업일 수 있으므로 DB에 한 번 더 확인
+        if self._source == "explain":
+            try:
+                doc = db_manager.get_collection("explain").find_one(
+                    {"기업명": name}, {"종목코드": 1, "_id": 0}
+                )
+                code = normalize_ticker(doc.get("종목코드")) if doc else None
+                if code:
+                    self._codes[name] = code
+                    self._names.setdefault(code, name)
+                else:
+                    self._remember_miss(name)
+                return code
+            except Exception as e:
+                logger.warning("종목코드 단건 조회 실패(%s): %s", name, e)
+        return None
+
+    async def resolve_async(self, company_name: str) -> Optional[str]:
+        """resolve 의 async 버전: 캐시에 있거나 최근에 못 찾은 이름이면 바로, 아니면 스레드에서 조회"""
+        name = (company_name or "").strip()
+        if not name:
+            return None
+        if self._is_fresh():
+            code = self._codes.get(name)
+            if code or self._missed(name):
+                return code
+        return await asyncio.to_thread(self.resolve, name)
+
+    def get_name(self, code) -> Optional[str]:
+        """6자리 종목코드로 기업명 조회 (역방향). 없으면 None"""
+        key = normalize_ticker(code)
+        if not key:
+            return None
+        return self.names().get(key)
+
+    def names(self) -> Dict[str, str]:
+        """6자리 종목코드 → 기업명 (여러 종목을 조회할 때 한 번 받아 dict 로 조회)"""
+        self._ensure_loaded()
+        return self._names
+
+    def invalidate(self):
+        """캐시 무효화 (다음 조회 시 재적재)"""
+        self._expires_at = 0.0
+        self._misses.clear()
+
+
+# 인스턴스 (라우터에서 import)
+ticker_resolver = TickerResolver()
@@ -0,0 +1,29 @@
+"""
+테스트 공통 설정.
+
+- BACKEND 를 import 경로에 추가 (python -m pytest tests/ 또는 pytest tests/)
+- 뉴스/리포트 URL 환경변수를 benchmarks/fixtures 고정 페이지 서버로 지정.
+  서비스 모듈은 import 시점에 URL 을 읽으므로 어떤 테스트 모듈보다 먼저(conftest) 설정한다 → 외부 사이트 접속 없음
+- 앱 startup 을 타지 않는 테스트에서도 WebDriver pre-warm 이 돌지 않도록 SELENIUM_PREWARM=0
+"""
+import os
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if BACKEND_DIR not in sys.path:
+    sys.path.insert(0, BACKEND_DIR)
+
+os.environ.setdefault("SELENIUM_PREWARM", "0")
+
+from benchmarks.scraper_paths import point_sources_at, start_server  # noqa: E402
+
+fixture_server = start_server()
+FIXTURE_BASE_URL = f"http://127.0.0.1:{fixture_server.server_address[1]}"
+point_sources_at(FIXTURE_BASE_URL)
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
@@ -0,0 +1,215 @@
+"""
+크롤링 프레임워크: 작업 큐 이어하기/재시도, 내용 해시가 같으면 건너뛰기, FileSink 병합, 스케줄 파싱/빌드.
+
+페이지는 로컬 스텁 서버에서 받는다 (ETag 없이 응답 → 해시 비교 경로).
+"""
+import asyncio
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+from crawl import schedule
+from crawl.core import CrawlJob, CrawlRunner
+from crawl.fetchers import PageFetcher
+from crawl.jobs import JOBS
+from crawl.parsers import TableParser
+from crawl.schedule import CrawlScheduler, parse_schedule
+from crawl.sinks import FileSink, pa
+from crawl.task_queue import Task, TaskQueue
+
+COMPANIES = {"005930": "삼성전자", "000660": "SK하이닉스"}
+
+
+class TableHandler(BaseHTTPRequestHandler):
+    """/corp/<종목코드> → 매출비중 표 (ETag/Last-Modified 없음)"""
+
+    def do_GET(self):
+        code = self.path.rsplit("/", 1)[-1]
+        body = (
+            "<html><body><table class='sales'>"
+            "<tr><th>제품</th><th>비중</th></tr>"
+            f"<tr><td>{COMPANIES.get(code, '-')} 제품</td><td>100</td></tr>"
+            "</table></body></html>"
+        ).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def stub_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), TableHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/corp"
+    server.shutdown()
+
+
+def make_queue(tmp_path, keys=("a", "b", "c")) -> TaskQueue:
+    queue = TaskQueue(str(tmp_path / "state" / "job.sqlite"))
+    queue.sync([Task(key, f"http://example.com/{key}") for key in keys])
+    return queue
+
+
+def test_queue_resumes_interrupted_round(tmp_path):
+    queue = make_queue(tmp_path)
+    queue.new_round()
+    queue.start_run()
+    first = queue.claim()
+    queue.finish(first, "done", hash="h1", rows=1)
+    interrupted = queue.claim()  # running 상태로 남은 채 중단
+    queue.close()
+
+    queue = TaskQueue(queue.path)
+    try:
+        assert queue.recover() == 1
+        assert queue.has_unfinished() and queue.last_run() is not None  # → CrawlRunner 는 새 회차 대신 이어서
+        claimed = [queue.claim().key, queue.claim().key]
+        assert claimed == [interrupted.key, "c"]  # 끝난 작업은 다시 하지 않음, 시드 순서 유지
+        assert queue.claim() is None
+        assert queue.counts() == {"done": 1, "running": 2}
+
+        # 시드에서 빠진 작업은 삭제, 새 회차는 hash 를 유지한 채 모두 pending 으로
+        assert queue.sync([Task("a", "http://example.com/a"), Task("c", "http://example.com/c")]) == 1
+        queue.new_round()
+        assert queue.counts() == {"pending": 2}
+        assert queue.claim().hash == "h1"
+    finally:
+        queue.close()
+
+
+def test_queue_retries_with_backoff_then_fails(tmp_path):
+    queue = make_queue(tmp_path, keys=("a",))
+    try:
+        now = time.time()
+        task = queue.claim(now)
+        assert queue.retry(task, "TimeoutError: 1", max_attempts=2, backoff=60)
+        assert queue.claim(now) is None  # 백오프 동안은 꺼내지 않음
+        assert queue.next_retry_at() >= now + 60
+
+        task = queue.claim(now + 61)
+        assert task.key == "a" and task.attempts == 1
+        assert not queue.retry(task, "TimeoutError: 2", max_attempts=2, backoff=60)
+        assert queue.counts() == {"failed": 1}
+        assert queue.failures() == [{"key": "a", "attempts": 2, "error": "TimeoutError: 2"}]
+        assert queue.next_retry_at() is None
+    finally:
+        queue.close()
+
+
+@pytest.mark.anyio
+async def test_unchanged_tables_are_skipped(tmp_path, stub_url):
+    from utils.scraper import scrape_engine
+
+    job = CrawlJob(
+        "stub_sales", "스텁 매출비중 표",
+        seeds=lambda path: [Task(code, f"{stub_url}/{code}", {"종목코드": code, "종목명": name})
+                            for code, name in COMPANIES.items()],
+        fetcher=PageFetcher(render=False),
+        parser=TableParser(["//table[@class='sales']"], meta_columns=("종목코드", "종목명")),
+        output="stub_sales",
+    )
+    sink = FileSink(str(tmp_path), job.output, formats=("csv",))
+
+    async def run():
+        queue = TaskQueue(str(tmp_path / ".state" / "stub_sales.sqlite"))
+        try:
+            return await CrawlRunner(job, queue, sink, workers=2).run()
+        finally:
+            queue.close()
+
+    try:
+        first = await run()
+        second = await run()
+    finally:
+        await scrape_engine.close()  # aiohttp 세션은 테스트별 이벤트 루프에 묶임
+
+    assert first["processed"] == {"changed": 2} and not first["resumed"]
+    assert second["processed"] == {"unchanged": 2} and not second["resumed"]
+    df = pd.read_csv(second["outputs"]["csv"], dtype=str, encoding="utf-8-sig")
+    assert list(df["종목코드"]) == list(COMPANIES)  # 병합 결과는 그대로 유지
+    assert list(df["제품"]) == [f"{name} 제품" for name in COMPANIES.values()]
+
+
+@pytest.mark.anyio
+async def test_file_sink_merges_parts_in_seed_order(tmp_path):
+    formats = ("parquet", "csv") if pa is not None else ("csv",)
+    sink = FileSink(str(tmp_path), "merged", formats=formats)
+    await sink.write("b", pd.DataFrame({"종목코드": ["000660"], "매출": [10]}))
+    await sink.write("a", pd.DataFrame({"종목코드": ["005930", "005930"], "비중": [0.5, 0.5]}))
+    await sink.write("gone", pd.DataFrame({"종목코드": ["999999"], "매출": [1]}))
+    await sink.remove("gone")
+
+    outputs = await sink.finalize(["b", "a", "missing"])
+    assert set(outputs) == set(formats)
+    csv = pd.read_csv(outputs["csv"], dtype=str, encoding="utf-8-sig")
+    assert list(csv.columns) == ["종목코드", "매출", "비중"]  # 컬럼은 합집합 (처음 나온 순서)
+    assert list(csv["종목코드"]) == ["000660", "005930", "005930"]  # 시드 순서, 앞자리 0 유지
+    assert csv["매출"].tolist()[0] == "10" and csv["매출"].isna().tolist()[1:] == [True, True]
+    if pa is not None:
+        parquet = pd.read_parquet(outputs["parquet"])
+        assert parquet.astype(object).where(parquet.notna(), None).values.tolist() == \
+            csv.astype(object).where(csv.notna(), None).values.tolist()
+    assert not any(name.endswith(".tmp") for name in os.listdir(tmp_path))
+
+    sink.reset()
+    assert os.listdir(sink.parts_dir) == []
+
+
+def test_parse_schedule():
+    assert parse_schedule("") == {}
+    assert parse_schedule("sales_composition:7d, domestic_export") == {
+        "sales_composition": 7 * 86400,
+        "domestic_export": JOBS["domestic_export"].interval,
+    }
+    assert parse_schedule("sales_composition:90m") == {"sales_composition": 5400}
+    assert parse_schedule("sales_composition:3600") == {"sales_composition": 3600}
+    with pytest.raises(ValueError):
+        parse_schedule("unknown_job:1d")
+
+
+@pytest.mark.anyio
+async def test_scheduled_file_run_rebuilds_datasets(tmp_path, monkeypatch):
+    calls = []
+
+    async def fake_run_job(name, out_dir, **options):
+        calls.append(("run", name, out_dir))
+        return {"job": name, "processed": {"changed": 1}}
+
+    def fake_rebuild(job_names, out_dir):
+        calls.append(("rebuild", job_names, out_dir))
+        return 0
+
+    monkeypatch.setattr(schedule, "run_job", fake_run_job)
+    monkeypatch.setattr(schedule, "rebuild", fake_rebuild)
+
+    async def run_once(**options):
+        scheduler = CrawlScheduler({"sales_composition": 86400})
+        task = asyncio.ensure_future(scheduler.run_forever(out_dir=str(tmp_path), **options))
+        try:
+            for _ in range(100):
+                if "sales_composition" in scheduler.last_results:
+                    break
+                await asyncio.sleep(0.02)
+        finally:
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+        return scheduler.last_results["sales_composition"]
+
+    result = await run_once(sink="file", formats=["csv"])
+    assert result["build"] == 0
+    assert calls == [("run", "sales_composition", str(tmp_path)),
+                     ("rebuild", ["sales_composition"], str(tmp_path))]
+
+    calls.clear()
+    assert (await run_once(sink="mongo"))["build"] is None  # Mongo sink 는 서빙 데이터셋 원본이 아님
+    assert calls == [("run", "sales_composition", str(tmp_path))]
@@ -0,0 +1,170 @@
+"""
+WebDriver 풀: 느린 스크래핑이 풀을 모두 차지해도 다른 엔드포인트는 응답하고,
+제한 시간(with_deadline)/연결 종료(cancel_on_disconnect) 시 작업이 취소되고 드라이버가 교체되는지 확인.
+
+Chrome 대신 FakeDriver(로컬 스텁 페이지를 HTTP로 받음)를 풀 factory 로 쓴다.
+quit() 은 진행 중인 get() 을 끊는다 (실제 드라이버에서 브라우저 종료가 하는 일과 같음).
+"""
+import asyncio
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+from utils import selenium_utils
+from utils.circuit_breaker import breakers
+from utils.selenium_utils import DriverPool, cancel_on_disconnect, selenium_manager
+
+pytestmark = pytest.mark.anyio
+
+POOL_SIZE = 2
+SLOW_SECONDS = 2.0
+RESPONSIVE_BOUND = 0.5  # 풀이 모두 사용 중일 때 다른 엔드포인트 응답 한도 (초)
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """?delay=초 만큼 늦게 응답하는 페이지"""
+
+    def do_GET(self):
+        delay = float(parse_qs(urlparse(self.path).query).get("delay", ["0"])[0])
+        time.sleep(delay)
+        body = f"<html><body><p class='item'>delay {delay}</p></body></html>".encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class FakeDriver:
+    instances = []
+
+    def __init__(self, headless: bool = True):
+        self.page_source = ""
+        self.closed = threading.Event()
+        FakeDriver.instances.append(self)
+
+    def get(self, url: str):
+        if not url.startswith("http"):
+            self.page_source = ""
+            return
+        result = {}
+        fetch = threading.Thread(
+            target=lambda: result.update(body=urllib.request.urlopen(url, timeout=30).read()), daemon=True
+        )
+        fetch.start()
+        while fetch.is_alive():
+            if self.closed.wait(0.02):
+                raise WebDriverException("invalid session id")
+        self.page_source = result["body"].decode("utf-8")
+
+    def execute_script(self, script, *args):
+        if self.closed.is_set():
+            raise WebDriverException("invalid session id")
+        return 1
+
+    def execute_cdp_cmd(self, cmd, params):
+        return {}
+
+    def find_elements(self, by, selector):
+        return []
+
+    def quit(self):
+        self.closed.set()
+
+
+@pytest.fixture(scope="module")
+def stub_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/page"
+    server.shutdown()
+
+
+@pytest.fixture
+async def pool(monkeypatch):
+    pool = DriverPool(size=POOL_SIZE, acquire_timeout=10, factory=FakeDriver)
+    monkeypatch.setattr(selenium_utils, "driver_pool", pool)
+    monkeypatch.setattr(breakers, "_breakers", {})  # 다른 테스트의 실패 기록이 섞이지 않도록
+    FakeDriver.instances.clear()
+    try:
+        yield pool
+    finally:
+        await pool.close()
+
+
+def scrape(url: str, deadline: float = 10):
+    return selenium_manager.scrape_with_custom_logic(url, lambda d: [d.page_source], wait_time=0, deadline=deadline)
+
+
+async def wait_for(condition, timeout: float = 5.0):
+    started = time.perf_counter()
+    while not condition():
+        assert time.perf_counter() - started < timeout, "조건 대기 시간 초과"
+        await asyncio.sleep(0.02)
+
+
+async def test_other_endpoints_respond_while_pool_is_busy(pool, stub_url):
+    from main import app
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        sales = "/api/v1/company/company/company/삼성전자/sales-composition"
+        assert (await client.get(sales)).status_code == 200  # 데이터셋 적재는 측정에서 제외
+
+        slow = [asyncio.ensure_future(scrape(f"{stub_url}?delay={SLOW_SECONDS}")) for _ in range(POOL_SIZE + 1)]
+        await wait_for(lambda: pool.stats()["in_use"] == POOL_SIZE)
+
+        for path in ("/health", sales):
+            started = time.perf_counter()
+            response = await client.get(path)
+            elapsed = time.perf_counter() - started
+            assert response.status_code == 200
+            assert elapsed < RESPONSIVE_BOUND, f"{path}: {elapsed:.2f}s"
+        assert not any(task.done() for task in slow)  # 스크래핑은 아직 진행 중
+
+        results = await asyncio.gather(*slow)
+    assert all(result and "delay" in result[0] for result in results)
+    assert pool.stats()["in_use"] == 0
+
+
+async def test_deadline_cancels_scrape_and_replaces_driver(pool, stub_url):
+    started = time.perf_counter()
+    assert await scrape(f"{stub_url}?delay={SLOW_SECONDS}", deadline=0.3) == []
+    assert time.perf_counter() - started < 1.0
+
+    await wait_for(lambda: pool.stats()["recycled"] == 1)
+    assert FakeDriver.instances[0].closed.is_set()  # 취소된 드라이버는 종료(진행 중인 get 중단)
+
+    result = await scrape(f"{stub_url}?delay=0")
+    assert result and "delay 0" in result[0]
+    assert pool.stats()["in_use"] == 0
+
+
+async def test_disconnect_cancels_scrape(pool, stub_url):
+    class DisconnectingRequest:
+        """0.3초 뒤 연결이 끊기는 요청"""
+
+        def __init__(self):
+            self.url = urlparse("http://test/api/v1/news/search")
+            self._at = time.perf_counter() + 0.3
+
+        async def is_disconnected(self) -> bool:
+            return time.perf_counter() >= self._at
+
+    started = time.perf_counter()
+    result = await cancel_on_disconnect(DisconnectingRequest(), scrape(f"{stub_url}?delay={SLOW_SECONDS}"),
+                                        poll_interval=0.05)
+    assert result is None
+    assert time.perf_counter() - started < 1.0
+
+    await wait_for(lambda: pool.stats()["recycled"] == 1)
+    assert FakeDriver.instances[0].closed.is_set()
@@ -0,0 +1,110 @@
+"""
+뉴스 수집 1회 → MongoDB upsert/중복 제거 → /api/v1/news/news/archive 기간 조회.
+
+    MONGODB_URI=mongodb://localhost:27017 python -m pytest tests/test_news_ingest.py
+
+페이지는 conftest 의 고정 페이지 서버(benchmarks/fixtures)에서 받는다.
+MONGODB_URI 가 없거나 mongod 에 연결되지 않으면 건너뛴다. 데이터는 TEST_DB_NAME(기본 finance_dashboard_test)
+데이터베이스의 임시 컬렉션에 쓰고 끝나면 지운다.
+"""
+import os
+import uuid
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+from pymongo import MongoClient
+
+COMPANY = "삼성전자"
+OLD_ARTICLE = {"title": "지난 실적 기사", "url": "https://news.example.com/2024/01/02/earnings", "date": "2024.01.02."}
+
+
+def _mongod_available() -> bool:
+    uri = os.getenv("MONGODB_URI")
+    if not uri:
+        return False
+    client = None
+    try:  # mongodb+srv 는 생성자에서 DNS 조회
+        client = MongoClient(uri, serverSelectionTimeoutMS=1000)
+        client.admin.command("ping")
+        return True
+    except Exception:
+        return False
+    finally:
+        if client is not None:
+            client.close()
+
+
+pytestmark = [
+    pytest.mark.anyio,
+    pytest.mark.skipif(not _mongod_available(), reason="MONGODB_URI 미설정 또는 mongod 연결 불가"),
+]
+
+
+@pytest.fixture
+async def store(monkeypatch):
+    """임시 컬렉션을 쓰는 news_store (테스트 후 삭제)"""
+    from services.news_store import news_store
+    from utils.database import db_manager
+    from utils.scraper import scrape_engine
+
+    monkeypatch.setenv("DB_NAME", os.getenv("TEST_DB_NAME", "finance_dashboard_test"))
+    monkeypatch.setattr(news_store, "collection_name", f"news_test_{uuid.uuid4().hex[:8]}")
+    monkeypatch.setattr(news_store, "_indexed", False)
+    await db_manager.connect()
+    try:
+        yield news_store
+    finally:
+        db_manager.get_database().drop_collection(news_store.collection_name)
+        db_manager.close()
+        await scrape_engine.close()  # aiohttp 세션은 테스트별 이벤트 루프에 묶임
+
+
+async def test_ingest_upserts_and_dedups(store):
+    from services.news_ingest import NewsIngestor, hot_feed_key
+    from services.news_service import EARNINGS_QUERY, KOSPI_QUERY
+
+    kospi, earnings = hot_feed_key(KOSPI_QUERY), hot_feed_key(EARNINGS_QUERY)
+    ingestor = NewsIngestor(companies=[COMPANY])
+    collection = store._collection()
+
+    first = await ingestor.run_once()
+    assert first[kospi] > 0 and first[COMPANY] > 0
+    # 고정 페이지 서버는 검색어를 무시하므로 실적 피드는 코스피 피드와 같은 기사 → 새 문서 없이 피드만 추가
+    assert first[earnings] == 0
+    assert collection.count_documents({}) == sum(first.values())
+    assert collection.count_documents({"feeds": {"$all": [kospi, earnings]}}) == first[kospi]
+    assert collection.count_documents({"companies": COMPANY}) == first[COMPANY]
+    first_seen = {doc["_id"]: (doc["first_seen"], doc["fetched_at"]) for doc in collection.find()}
+
+    second = await ingestor.run_once()
+    assert set(second.values()) == {0}
+    assert collection.count_documents({}) == len(first_seen)
+    for doc in collection.find():
+        seen, fetched = first_seen[doc["_id"]]
+        assert doc["first_seen"] == seen  # 다시 수집돼도 처음 본 시각은 유지
+        assert doc["fetched_at"] >= fetched  # TTL 기준 시각은 갱신
+        assert len(doc.get("feeds", [])) == len(set(doc.get("feeds", [])))  # $addToSet
+
+
+async def test_archive_date_filter(store):
+    from main import app
+    from services.news_ingest import NewsIngestor
+    from services.news_store import KST
+
+    counts = await NewsIngestor(companies=[COMPANY]).run_once()
+    # 고정 페이지의 기업 뉴스는 'N시간 전' 표기 → 날짜가 정해진 기사 하나를 더해 과거 구간을 확인
+    assert await store.upsert([OLD_ARTICLE], company=COMPANY) == 1
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        async def archive(**params):
+            response = await client.get("/api/v1/news/news/archive", params={"company": COMPANY, "limit": 200, **params})
+            assert response.status_code == 200, response.text
+            return [item["title"] for item in response.json()]
+
+        everything = await archive()
+        assert len(everything) == counts[COMPANY] + 1
+        assert await archive(since="2024-01-02", until="2024-01-02") == [OLD_ARTICLE["title"]]
+        assert await archive(until="2024-01-01") == []
+        recent = await archive(since=(datetime.now(KST).date() - timedelta(days=1)).isoformat())
+        assert OLD_ARTICLE["title"] not in recent and len(recent) == counts[COMPANY]
@@ -0,0 +1,51 @@
+"""
+매출 구성(NICE 내수/수출): 원본 CSV 스냅샷 경로와 pipeline.build 아티팩트 경로가 같은 행을 돌려주는지 확인.
+종목코드는 두 경로 모두 6자리 문자열 (pd.read_csv 기본값이면 005930 → 5930 정수).
+"""
+import functools
+
+import pytest
+
+import services.sales_composition_service as sales
+from pipeline import build
+from utils.artifacts import ArtifactStore
+from utils.snapshot import load_or_build
+
+CSV = """﻿종목코드,종목명,사업부문,매출유형,매출품목명,구분,2023_12 매출액,2024_12 매출액
+005930,삼성전자,DX,제품,"TV, 스마트폰",수출,100,120
+005930,삼성전자,DX,제품,"TV, 스마트폰",내수,50,60
+005930,삼성전자,DX,제품,"TV, 스마트폰",비중,66.7%,66.7%
+95570,AJ네트웍스,렌탈부문,,파렛트,미분류,622886,633736
+A000660,SK하이닉스,반도체,제품,DRAM,수출,300,
+"""
+
+
+@pytest.fixture
+def snapshots(tmp_path, monkeypatch):
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    csv_path = raw_dir / "NICE_내수수출_코스피.csv"
+    csv_path.write_text(CSV, encoding="utf-8")
+    monkeypatch.setattr(sales, "load_or_build",
+                        functools.partial(load_or_build, snapshot_dir=str(tmp_path / "snapshots")))
+
+    raw = sales.load_sales_snapshot(str(csv_path))
+    build.build([str(raw_dir)], str(tmp_path / "artifacts"), only=[sales.DATASET])
+    artifact = ArtifactStore(str(tmp_path / "artifacts")).open(sales.DATASET)
+    return raw, artifact
+
+
+def all_rows(snapshot):
+    columns = snapshot.meta["columns"]
+    return snapshot.rows(columns, 0, len(snapshot.column("종목코드")))
+
+
+def test_raw_csv_and_artifact_paths_match(snapshots):
+    raw, artifact = snapshots
+    assert raw.meta["columns"] == artifact.meta["columns"]
+    assert all_rows(raw) == all_rows(artifact)
+    assert [row["종목코드"] for row in all_rows(raw)] == ["005930"] * 3 + ["095570", "000660"]
+
+    raw_index, artifact_index = sales.build_sales_index(raw), sales.build_sales_index(artifact)
+    assert raw_index == artifact_index
+    assert set(raw_index["by_code"]) == {"005930", "095570", "000660"}
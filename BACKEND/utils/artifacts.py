@@ -0,0 +1,149 @@
+"""
+오프라인 빌드(pipeline.build)가 만든 서빙 아티팩트 저장소.
+
+    artifacts/
+      manifest.json            # 현재 빌드 (build_id, 데이터셋별 디렉토리/파일 체크섬/행 수/입력 정보)
+      <build_id>/.<dataset>@<id>/  # utils.snapshot 형식 디렉토리 (<build_id>/<dataset> 은 이를 가리키는 링크)
+
+manifest.json은 빌드가 끝난 뒤 원자적으로 교체되므로 서버는 항상 완성된 빌드만 본다.
+서버는 매니페스트에 있는 데이터셋을 원본(JSON/CSV) 대신 아티팩트에서 읽는다.
+"""
+import hashlib
+import json
+import logging
+import os
+import shutil
+import threading
+from typing import Any, Dict, Optional
+
+from utils.snapshot import FORMAT_VERSION, Snapshot
+
+logger = logging.getLogger("artifacts")
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ARTIFACT_DIR = os.getenv("ARTIFACT_DIR", os.path.join(BASE_DIR, "artifacts"))
+MANIFEST_NAME = "manifest.json"
+
+# 1이면 매니페스트에 없는 데이터셋은 원본 파싱으로 대체하지 않고 오류
+ARTIFACT_ONLY = os.getenv("ARTIFACT_ONLY", "0") == "1"
+# 0이면 적재 시 체크섬 검증 생략
+ARTIFACT_VERIFY = os.getenv("ARTIFACT_VERIFY", "1") == "1"
+
+
+class ArtifactError(ValueError):
+    """아티팩트 누락/손상"""
+
+
+def file_checksum(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def describe_files(directory: str) -> Dict[str, Dict]:
+    """디렉토리 내 파일별 {sha256, bytes}"""
+    return {
+        name: {"sha256": file_checksum(os.path.join(directory, name)),
+               "bytes": os.path.getsize(os.path.join(directory, name))}
+        for name in sorted(os.listdir(directory))
+    }
+
+
+def write_manifest(root: str, manifest: Dict):
+    """manifest.json 원자적 교체"""
+    path = os.path.join(root, MANIFEST_NAME)
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+    os.replace(tmp, path)
+
+
+def prune_builds(root: str, manifest: Dict, keep: int = 2):
+    """
+    오래된 빌드 디렉토리 정리. 매니페스트가 참조하는 빌드(--only 빌드로 섞인 이전 빌드 포함)는
+    지우지 않고, 참조하지 않는 빌드는 최근 keep-1개를 남긴다
+    (직전 매니페스트로 아직 서빙 중인 워커가 경로로 파일을 읽으므로)
+    """
+    referenced = {entry["dir"].split("/", 1)[0] for entry in manifest.get("datasets", {}).values()}
+    unreferenced = sorted(
+        (d for d in os.listdir(root)
+         if os.path.isdir(os.path.join(root, d)) and not d.startswith(".") and d not in referenced),
+        key=lambda d: os.path.getmtime(os.path.join(root, d)),
+    )
+    retain = max(keep - 1, 0)
+    for stale in unreferenced[:len(unreferenced) - retain]:
+        logger.info("🧹 이전 빌드 삭제: %s", stale)
+        shutil.rmtree(os.path.join(root, stale), ignore_errors=True)
+
+
+def read_json_artifact(snapshot: Snapshot) -> Any:
+    """JSON 데이터셋 아티팩트 (정규화된 JSON 본문 블롭)"""
+    with open(snapshot.blob_path("data"), "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def read_snapshot_artifact(snapshot: Snapshot) -> Snapshot:
+    """스냅샷 형식 데이터셋은 매핑한 그대로 사용"""
+    return snapshot
+
+
+class ArtifactStore:
+    """manifest.json 을 mtime 기준으로 캐시하고 데이터셋 아티팩트를 검증 후 연다"""
+
+    def __init__(self, root: str = ARTIFACT_DIR, verify: bool = ARTIFACT_VERIFY):
+        self.root = root
+        self.verify = verify
+        self._manifest: Optional[Dict] = None
+        self._manifest_mtime: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(self.root, MANIFEST_NAME)
+
+    def manifest(self) -> Optional[Dict]:
+        try:
+            mtime = os.path.getmtime(self.manifest_path)
+        except OSError:
+            return None
+        if mtime != self._manifest_mtime:
+            with self._lock:
+                if mtime != self._manifest_mtime:
+                    with open(self.manifest_path, "r", encoding="utf-8") as f:
+                        self._manifest = json.load(f)
+                    self._manifest_mtime = mtime
+        return self._manifest
+
+    def entry(self, name: str) -> Optional[Dict]:
+        manifest = self.manifest()
+        if not manifest:
+            return None
+        return manifest.get("datasets", {}).get(name)
+
+    def mtime(self, name: str) -> Optional[float]:
+        """데이터셋이 아티팩트로 제공되면 매니페스트 mtime (새 빌드 감지용)"""
+        return self._manifest_mtime if self.entry(name) is not None else None
+
+    def open(self, name: str) -> Optional[Snapshot]:
+        """데이터셋 아티팩트 열기. 매니페스트에 없으면 None, 손상됐으면 ArtifactError"""
+        entry = self.entry(name)
+        if entry is None:
+            return None
+        directory = os.path.join(self.root, entry["dir"])
+        if self.verify:
+            for filename, expected in entry["files"].items():
+                path = os.path.join(directory, filename)
+                if not os.path.exists(path):
+                    raise ArtifactError(f"아티팩트 파일 없음: {path}")
+                if file_checksum(path) != expected["sha256"]:
+                    raise ArtifactError(f"아티팩트 체크섬 불일치: {path}")
+        snapshot = Snapshot(directory)
+        if snapshot.info.get("format_version") != FORMAT_VERSION:
+            raise ArtifactError(f"지원하지 않는 스냅샷 형식: {directory}")
+        return snapshot
+
+
+# 싱글톤 인스턴스
+artifact_store = ArtifactStore()
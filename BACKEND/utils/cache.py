@@ -0,0 +1,359 @@
+"""
+공용 캐시: 크기 제한 LRU + 항목별 TTL + 대략적인 메모리(바이트) 집계 + 적중/실패/축출 통계.
+
+    from utils.cache import create_cache
+    prices = create_cache("stock_price", ttl=600, max_entries=500)
+    data = prices.get(key)                       # 만료/없음이면 None
+    data = prices.get(key, allow_stale=True)     # 만료됐어도 stale 기간 안이면 반환 (외부 API 실패 시 폴백)
+    prices.set(key, data)
+
+백엔드 (CACHE_BACKEND, 캐시별 backend= 로 지정 가능):
+- memory: 프로세스 메모리 (OrderedDict LRU). 크기는 객체 그래프를 훑어 대략 계산
+- disk:   CACHE_DIR/<이름>.sqlite (pickle). 같은 서버의 여러 워커 프로세스가 공유하고 재시작 후에도 유지.
+          크기는 직렬화된 바이트 수, LRU는 마지막 접근 시각 기준
+
+만료된 항목은 stale 기간(stale_ttl)까지만 폴백용으로 남고, 쓰기 시 주기적으로 정리된다.
+용량(max_entries/max_bytes)을 넘으면 만료된 항목부터, 그다음 가장 오래 안 쓴 항목부터 축출한다.
+"""
+import logging
+import os
+import pickle
+import sqlite3
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+logger = logging.getLogger("cache")
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CACHE_BACKEND = os.getenv("CACHE_BACKEND", "memory")
+CACHE_DIR = os.getenv("CACHE_DIR", os.path.join(BASE_DIR, ".cache", "kv"))
+CACHE_MAX_BYTES = int(os.getenv("CACHE_MAX_BYTES", str(64 * 1024 * 1024)))  # 캐시 하나당 기본 상한
+PURGE_INTERVAL = 60.0  # 만료 항목 정리 최소 간격 (초)
+
+_MISSING = object()
+
+
+def approx_size(value: Any, _seen: Optional[set] = None) -> int:
+    """객체 그래프의 대략적인 바이트 수 (공유 객체는 한 번만, DataFrame은 memory_usage 사용)"""
+    seen = _seen if _seen is not None else set()
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+    if hasattr(value, "memory_usage") and hasattr(value, "columns"):  # pandas DataFrame
+        return int(value.memory_usage(index=True, deep=True).sum())
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        size += sum(approx_size(k, seen) + approx_size(v, seen) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(approx_size(v, seen) for v in value)
+    return size
+
+
+class Entry:
+    __slots__ = ("value", "expires_at", "size")
+
+    def __init__(self, value: Any, expires_at: float, size: int):
+        self.value = value
+        self.expires_at = expires_at  # inf 이면 만료 없음
+        self.size = size
+
+
+class MemoryBackend:
+    """프로세스 메모리 LRU (스레드 안전 - 서비스가 asyncio.to_thread 안에서도 호출)"""
+
+    name = "memory"
+
+    def __init__(self):
+        self._entries: "OrderedDict[Hashable, Entry]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Entry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: Hashable, value: Any, expires_at: float):
+        entry = Entry(value, expires_at, approx_size(value))
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous.size
+            self._entries[key] = entry
+            self._bytes += entry.size
+
+    def delete(self, key: Hashable) -> bool:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._bytes -= entry.size
+            return entry is not None
+
+    def purge(self, before: float) -> int:
+        """expires_at < before 인 항목 삭제"""
+        with self._lock:
+            keys = [k for k, e in self._entries.items() if e.expires_at < before]
+            for key in keys:
+                self._bytes -= self._entries.pop(key).size
+            return len(keys)
+
+    def evict(self, max_entries: int, max_bytes: int) -> int:
+        """용량 초과분을 가장 오래 안 쓴 항목부터 삭제"""
+        evicted = 0
+        with self._lock:
+            while self._entries and (len(self._entries) > max_entries or self._bytes > max_bytes):
+                _, entry = self._entries.popitem(last=False)
+                self._bytes -= entry.size
+                evicted += 1
+        return evicted
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def usage(self) -> Tuple[int, int]:
+        return len(self._entries), self._bytes
+
+
+class DiskBackend:
+    """
+    SQLite 파일 하나 (CACHE_DIR/<이름>.sqlite). 키는 str(key).
+    여러 프로세스가 같은 파일을 열어도 되도록 WAL + busy_timeout, 연결은 스레드마다 따로.
+    """
+
+    name = "disk"
+    TOUCH_INTERVAL = 5.0  # 적중 시 접근 시각 갱신 최소 간격 (매 조회마다 쓰지 않도록)
+
+    def __init__(self, cache_name: str, directory: str = CACHE_DIR):
+        os.makedirs(directory, exist_ok=True)
+        self.path = os.path.join(directory, f"{cache_name}.sqlite")
+        self._local = threading.local()
+        self._db().executescript(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL,"
+            " expires_at REAL NOT NULL, accessed_at REAL NOT NULL);"
+            "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at);"
+        )
+
+    def _db(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db = db
+        return db
+
+    def get(self, key: Hashable) -> Optional[Entry]:
+        row = self._db().execute(
+            "SELECT value, size, expires_at, accessed_at FROM entries WHERE key=?", (str(key),)
+        ).fetchone()
+        if row is None:
+            return None
+        now = time.time()
+        if now - row[3] > self.TOUCH_INTERVAL:
+            self._db().execute("UPDATE entries SET accessed_at=? WHERE key=?", (now, str(key)))
+        try:
+            return Entry(pickle.loads(row[0]), row[2], row[1])
+        except Exception as e:  # 다른 버전 코드가 쓴 항목 등
+            logger.warning("⚠️ 디스크 캐시 항목 읽기 실패 (%s) - 삭제: %s", key, e)
+            self.delete(key)
+            return None
+
+    def set(self, key: Hashable, value: Any, expires_at: float):
+        blob = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self._db().execute(
+            "INSERT OR REPLACE INTO entries (key, value, size, expires_at, accessed_at) VALUES (?, ?, ?, ?, ?)",
+            (str(key), blob, len(blob), expires_at, time.time()),
+        )
+
+    def delete(self, key: Hashable) -> bool:
+        return self._db().execute("DELETE FROM entries WHERE key=?", (str(key),)).rowcount > 0
+
+    def purge(self, before: float) -> int:
+        return self._db().execute("DELETE FROM entries WHERE expires_at < ?", (before,)).rowcount
+
+    def evict(self, max_entries: int, max_bytes: int) -> int:
+        entries, total = self.usage()
+        if entries <= max_entries and total <= max_bytes:
+            return 0
+        db = self._db()
+        excess_entries, excess_bytes, victims = entries - max_entries, total - max_bytes, []
+        for key, size in db.execute("SELECT key, size FROM entries ORDER BY accessed_at"):
+            if excess_entries <= 0 and excess_bytes <= 0:
+                break
+            victims.append((key,))
+            excess_entries -= 1
+            excess_bytes -= size
+        db.executemany("DELETE FROM entries WHERE key=?", victims)
+        return len(victims)
+
+    def clear(self):
+        self._db().execute("DELETE FROM entries")
+
+    def usage(self) -> Tuple[int, int]:
+        count, total = self._db().execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries").fetchone()
+        return count, total
+
+
+class Cache:
+    """
+    ttl: 기본 TTL (초, None이면 만료 없음)
+    stale_ttl: 만료 후에도 allow_stale 조회용으로 남겨 둘 시간 (초)
+    """
+
+    def __init__(self, name: str, backend=None, ttl: Optional[float] = 300, stale_ttl: float = 3600,
+                 max_entries: int = 1000, max_bytes: int = CACHE_MAX_BYTES):
+        self.name = name
+        self.backend = backend if backend is not None else MemoryBackend()
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._last_purge = 0.0
+        self._stats = {"hits": 0, "misses": 0, "stale_hits": 0, "sets": 0, "evictions": 0, "expirations": 0}
+
+    def _entry(self, key: Hashable) -> Tuple[Optional[Entry], bool]:
+        """(항목, 유효 여부). stale 기간도 지난 항목은 삭제하고 없는 것으로"""
+        entry = self.backend.get(key)
+        if entry is None:
+            return None, False
+        now = time.time()
+        if now < entry.expires_at:
+            return entry, True
+        if now >= entry.expires_at + self.stale_ttl:
+            self.backend.delete(key)
+            self._stats["expirations"] += 1
+            return None, False
+        return entry, False
+
+    def get(self, key: Hashable, default: Any = None, allow_stale: bool = False) -> Any:
+        entry, fresh = self._entry(key)
+        if fresh:
+            self._stats["hits"] += 1
+            return entry.value
+        if entry is not None and allow_stale:
+            self._stats["stale_hits"] += 1
+            return entry.value
+        self._stats["misses"] += 1
+        return default
+
+    def lookup(self, key: Hashable) -> Tuple[Any, bool]:
+        """(값, 유효 여부) - 만료됐지만 stale 기간 안이면 (이전 값, False), 없으면 (None, False)"""
+        entry, fresh = self._entry(key)
+        self._stats["hits" if fresh else "misses"] += 1
+        return (entry.value if entry is not None else None), fresh
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = _MISSING):
+        ttl = self.ttl if ttl is _MISSING else ttl
+        now = time.time()
+        self.backend.set(key, value, now + ttl if ttl is not None else float("inf"))
+        self._stats["sets"] += 1
+        if now - self._last_purge > PURGE_INTERVAL:
+            self._last_purge = now
+            self._stats["expirations"] += self.backend.purge(now - self.stale_ttl)
+        entries, size = self.backend.usage()
+        if entries > self.max_entries or size > self.max_bytes:
+            self._stats["expirations"] += self.backend.purge(now)  # 용량이 모자라면 stale 항목부터 포기
+            self._stats["evictions"] += self.backend.evict(self.max_entries, self.max_bytes)
+
+    def delete(self, key: Hashable) -> bool:
+        return self.backend.delete(key)
+
+    def clear(self):
+        self.backend.clear()
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], ttl: Optional[float] = _MISSING,
+                    ok: Callable[[Any], bool] = bool) -> Any:
+        """
+        캐시 조회 → 없거나 만료됐으면 loader() 결과를 저장해 반환 (ok(결과)가 참일 때만 저장).
+        loader 가 실패(예외 또는 ok 아님)하면 stale 기간 안의 이전 값이 있으면 그것을 반환
+        """
+        previous, fresh = self.lookup(key)
+        if fresh:
+            return previous
+        try:
+            result = loader()
+        except Exception as e:
+            return self._fallback(key, previous, e)
+        return self._store(key, previous, result, ttl, ok)
+
+    async def aget_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]],
+                           ttl: Optional[float] = _MISSING, ok: Callable[[Any], bool] = bool) -> Any:
+        """get_or_load 의 비동기 버전 (loader는 코루틴 함수)"""
+        previous, fresh = self.lookup(key)
+        if fresh:
+            return previous
+        try:
+            result = await loader()
+        except Exception as e:
+            return self._fallback(key, previous, e)
+        return self._store(key, previous, result, ttl, ok)
+
+    def _store(self, key: Hashable, previous: Any, result: Any, ttl: Optional[float], ok) -> Any:
+        if ok(result):
+            self.set(key, result, ttl)
+            return result
+        if previous is not None:
+            return self._fallback(key, previous, None)
+        return result
+
+    def _fallback(self, key: Hashable, previous: Any, error: Optional[Exception]) -> Any:
+        if previous is None:
+            raise error
+        self._stats["stale_hits"] += 1
+        logger.info("♻️ 조회 실패 - 만료된 캐시 사용 (%s %s)%s", self.name, key, f": {error}" if error else "")
+        return previous
+
+    def stats(self) -> Dict:
+        entries, size = self.backend.usage()
+        lookups = self._stats["hits"] + self._stats["misses"] + self._stats["stale_hits"]
+        return {
+            **self._stats,
+            "backend": self.backend.name,
+            "entries": entries,
+            "bytes": size,
+            "max_entries": self.max_entries,
+            "max_bytes": self.max_bytes,
+            "hit_ratio": round(self._stats["hits"] / lookups, 3) if lookups else None,
+        }
+
+
+class CacheRegistry:
+    def __init__(self):
+        self._caches: Dict[str, Cache] = {}
+
+    def create(self, name: str, backend: Optional[str] = None, **options) -> Cache:
+        """이름별 캐시 생성 (같은 이름이면 기존 캐시 반환)"""
+        if name in self._caches:
+            return self._caches[name]
+        kind = backend or CACHE_BACKEND
+        if kind == "disk":
+            try:
+                store = DiskBackend(name)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning("⚠️ 디스크 캐시 사용 불가 (%s) - 메모리 캐시 사용: %s", name, e)
+                store = MemoryBackend()
+        elif kind == "memory":
+            store = MemoryBackend()
+        else:
+            raise ValueError(f"알 수 없는 캐시 백엔드: {kind} (memory | disk)")
+        cache = self._caches[name] = Cache(name, store, **options)
+        return cache
+
+    def get(self, name: str) -> Optional[Cache]:
+        return self._caches.get(name)
+
+    def stats(self) -> Dict[str, Dict]:
+        return {name: cache.stats() for name, cache in self._caches.items()}
+
+
+# 인스턴스 (서비스에서 import)
+cache_registry = CacheRegistry()
+create_cache = cache_registry.create
@@ -0,0 +1,177 @@
+"""
+외부 의존성(업스트림)별 회로 차단기.
+
+    from utils.circuit_breaker import CircuitOpenError, breakers
+    try:
+        with breakers.get("pykrx", "market_cap").guard():
+            df = stock.get_market_cap_by_ticker(ds, "KOSPI")
+    except CircuitOpenError:
+        ...  # 호출 없이 바로 캐시/폴백 데이터로
+
+키는 "업스트림:작업" (pykrx:market_cap, yfinance:history, fdr:index, mongo, selenium:daum_news 등).
+- closed:    최근 window초 동안의 호출이 min_calls 이상이고 실패율이 failure_rate 이상이면 open
+- open:      open_for초 동안 호출하지 않고 바로 CircuitOpenError (RuntimeError → 라우터에서 503)
+- half_open: open_for가 지나면 호출 하나만 통과(probe). 성공하면 closed, 실패하면 다시 open
+             (차단 시간 2배, 최대 max_open_for). probe가 결과 없이 사라지면 open_for 뒤 다음 호출을 probe로
+guard(ignore=...) 의 예외(예: 종목 하나의 빈 데이터)는 업스트림이 응답한 것이므로 성공으로 센다.
+상태: GET /health/breakers
+"""
+import logging
+import os
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, Optional, Tuple, Type
+
+logger = logging.getLogger("circuit_breaker")
+
+FAILURE_RATE = float(os.getenv("BREAKER_FAILURE_RATE", "0.5"))
+MIN_CALLS = int(os.getenv("BREAKER_MIN_CALLS", "5"))
+WINDOW = float(os.getenv("BREAKER_WINDOW", "60"))  # 실패율 계산 구간 (초)
+OPEN_FOR = float(os.getenv("BREAKER_OPEN_FOR", "30"))  # 처음 차단 시간 (초)
+MAX_OPEN_FOR = float(os.getenv("BREAKER_MAX_OPEN_FOR", "600"))
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitOpenError(RuntimeError):
+    def __init__(self, name: str, retry_in: float):
+        super().__init__(f"회로 차단 중: {name} ({retry_in:.0f}s 후 재시도)")
+        self.name = name
+        self.retry_in = retry_in
+
+
+class CircuitBreaker:
+    """스레드 안전 (pykrx/yfinance 호출은 asyncio.to_thread 안에서도 기록)"""
+
+    def __init__(self, name: str, failure_rate: float = FAILURE_RATE, min_calls: int = MIN_CALLS,
+                 window: float = WINDOW, open_for: float = OPEN_FOR, max_open_for: float = MAX_OPEN_FOR):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.min_calls = min_calls
+        self.window = window
+        self.open_for = open_for
+        self.max_open_for = max_open_for
+        self.state = CLOSED
+        self._calls: Deque[Tuple[float, bool]] = deque()  # (시각, 성공 여부) - closed 상태의 최근 window초
+        self._open_for = open_for  # 현재 차단 시간 (half_open 실패마다 2배)
+        self._opened_at = 0.0
+        self._probe_at: Optional[float] = None
+        self._lock = threading.Lock()
+        self._stats = {"calls": 0, "failures": 0, "rejected": 0, "opened": 0}
+        self.last_error: Optional[str] = None
+
+    def allow(self) -> bool:
+        """호출해도 되면 True (half_open이면 probe 하나만)"""
+        with self._lock:
+            if self.state == CLOSED:
+                return True
+            now = time.monotonic()
+            if self.state == OPEN and now - self._opened_at >= self._open_for:
+                self.state = HALF_OPEN
+                self._probe_at = None
+                logger.info("🔌 회로 반개방 (%s) - 시험 호출 1건 허용", self.name)
+            if self.state == HALF_OPEN and (self._probe_at is None or now - self._probe_at >= self._open_for):
+                self._probe_at = now
+                return True
+            self._stats["rejected"] += 1
+            return False
+
+    def record(self, ok: bool, error=None):
+        """error: 예외 또는 메시지"""
+        with self._lock:
+            now = time.monotonic()
+            self._stats["calls"] += 1
+            if not ok:
+                self._stats["failures"] += 1
+                message = error if isinstance(error, str) else f"{type(error).__name__}: {error}"
+                self.last_error = message[:200] if error is not None else "failed"
+            if self.state == HALF_OPEN:
+                if ok:
+                    self.state = CLOSED
+                    self._open_for = self.open_for
+                    self._probe_at = None
+                    logger.info("✅ 회로 닫힘 (%s)", self.name)
+                else:
+                    self._open(now, min(self._open_for * 2, self.max_open_for))
+                return
+            if self.state == OPEN:
+                return  # 차단 전에 시작된 호출의 늦은 결과
+            self._calls.append((now, ok))
+            while self._calls and now - self._calls[0][0] > self.window:
+                self._calls.popleft()
+            failures = sum(1 for _, success in self._calls if not success)
+            if len(self._calls) >= self.min_calls and failures / len(self._calls) >= self.failure_rate:
+                self._open(now, self._open_for)
+
+    def _open(self, now: float, open_for: float):
+        self.state = OPEN
+        self._opened_at = now
+        self._open_for = open_for
+        self._probe_at = None
+        self._calls.clear()
+        self._stats["opened"] += 1
+        logger.warning("🔌 회로 열림 (%s) - %.0fs 동안 바로 폴백: %s", self.name, open_for, self.last_error)
+
+    def release(self):
+        """결과 없이 끝난 probe(취소 등) 반납 → 다음 호출이 probe"""
+        with self._lock:
+            if self.state == HALF_OPEN:
+                self._probe_at = None
+
+    def retry_in(self) -> float:
+        if self.state != OPEN:
+            return 0.0
+        return max(self._open_for - (time.monotonic() - self._opened_at), 0.0)
+
+    @contextmanager
+    def guard(self, ignore: Tuple[Type[BaseException], ...] = ()) -> Iterator[None]:
+        """열려 있으면 CircuitOpenError, 아니면 블록 실행 결과(예외 여부)를 기록"""
+        if not self.allow():
+            raise CircuitOpenError(self.name, self.retry_in())
+        try:
+            yield
+        except Exception as e:
+            self.record(isinstance(e, ignore), e)
+            raise
+        except BaseException:  # 취소/종료는 업스트림 결과가 아님
+            self.release()
+            raise
+        else:
+            self.record(True)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            failures = sum(1 for _, success in self._calls if not success)
+            return {
+                "state": self.state,
+                "window_calls": len(self._calls),
+                "window_failure_rate": round(failures / len(self._calls), 3) if self._calls else None,
+                "retry_in": round(self.retry_in(), 1),
+                "open_for": self._open_for,
+                **self._stats,
+                "last_error": self.last_error,
+            }
+
+
+class BreakerRegistry:
+    def __init__(self):
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def get(self, upstream: str, operation: Optional[str] = None, **options) -> CircuitBreaker:
+        """업스트림(+작업)별 차단기 (처음 요청 시 생성, options는 그때만 적용)"""
+        name = f"{upstream}:{operation}" if operation else upstream
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(name, CircuitBreaker(name, **options))
+        return breaker
+
+    def stats(self) -> Dict[str, Dict]:
+        return {name: breaker.snapshot() for name, breaker in sorted(self._breakers.items())}
+
+
+# 인스턴스 (서비스에서 import)
+breakers = BreakerRegistry()
@@ -8,66 +8,32 @@ import requests
 from typing import Dict, List, Optional
 from fastapi import HTTPException
 import asyncio
-from functools import wraps
 import aiohttp
 
-logger = logging.getLogger("data_processor")
-
-def circuit_breaker(max_failures: int = 3, reset_time: int = 60):
-    """회로 차단기 데코레이터"""
-    def decorator(func):
-        failures = 0
-        last_failure_time = 0
-
-        @wraps(func)
-        async def wrapper(*args, **kwargs):
-            nonlocal failures, last_failure_time
-            
-            # 실패 횟수 초기화 체크
-            if time.time() - last_failure_time > reset_time:
-                failures = 0
-
-            # 회로 차단 체크
-            if failures >= max_failures:
-                if time.time() - last_failure_time <= reset_time:
-                    raise HTTPException(
-                        status_code=503,
-                        detail="서비스가 일시적으로 불안정합니다. 잠시 후 다시 시도해주세요."
-                    )
-                failures = 0
+from utils.cache import create_cache
+from utils.circuit_breaker import CircuitOpenError, breakers
 
-            try:
-                return await func(*args, **kwargs)
-            except Exception as e:
-                failures += 1
-                last_failure_time = time.time()
-                raise e
-
-        return wrapper
-    return decorator
+logger = logging.getLogger("data_processor")
 
 class DataProcessor:
     def __init__(self):
         self.today = datetime.now()
         self.start_date = (self.today - timedelta(days=365)).strftime('%Y%m%d')
         self.end_date = self.today.strftime('%Y%m%d')
-        self._cache = {}
         self.CACHE_DURATION = 600  # 10분
+        # 만료 후 1일까지는 외부 API 실패 시 마지막 성공 데이터로 사용
+        self._cache = create_cache("data_processor", ttl=self.CACHE_DURATION, stale_ttl=86400, max_entries=500)
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
         }
 
-    def _get_cached_data(self, key: str) -> Optional[Dict]:
-        """캐시된 데이터 조회"""
-        if key in self._cache:
-            timestamp, data = self._cache[key]
-            if time.time() - timestamp < self.CACHE_DURATION:
-                return data
-        return None
+    def _get_cached_data(self, key: str, allow_stale: bool = False) -> Optional[Dict]:
+        """캐시된 데이터 조회 (allow_stale: 만료된 마지막 성공 데이터도 반환)"""
+        return self._cache.get(key, allow_stale=allow_stale)
 
     def _set_cached_data(self, key: str, data: Dict):
         """데이터 캐시에 저장"""
-        self._cache[key] = (time.time(), data)
+        self._cache.set(key, data)
 
     async def _async_request(self, url: str, timeout: int = 10) -> Dict:
         """비동기 HTTP 요청"""
@@ -76,7 +42,6 @@ class DataProcessor:
                 response.raise_for_status()
                 return await response.json()
 
-    @circuit_breaker(max_failures=3, reset_time=60)
     async def get_stock_data(self, ticker: str) -> Dict:
         """주식 데이터 조회 (yfinance)"""
         cache_key = f"stock_data_{ticker}"
@@ -88,7 +53,6 @@ class DataProcessor:
             # yfinance 호출을 비동기 컨텍스트로 이동
             def _fetch_stock():
                 import yfinance as yf
-                import time
                 
                 # Rate Limit 방지를 위한 지연
                 time.sleep(1)
@@ -99,7 +63,9 @@ class DataProcessor:
                     raise ValueError("데이터가 비어있습니다")
                 return hist
 
-            hist = await asyncio.to_thread(_fetch_stock)
+            # 빈 데이터(잘못된 종목 등)는 yfinance 장애가 아니므로 차단 판단에서 성공으로 셈
+            with breakers.get("yfinance", "history").guard(ignore=(ValueError,)):
+                hist = await asyncio.to_thread(_fetch_stock)
 
             data = {
                 "dates": hist.index.strftime('%Y-%m-%d').tolist(),
@@ -109,7 +75,10 @@ class DataProcessor:
             
             self._set_cached_data(cache_key, data)
             return data
-            
+
+        except CircuitOpenError:
+            # 차단 중: 호출 없이 마지막 성공 데이터 또는 더미 데이터
+            return self._get_cached_data(cache_key, allow_stale=True) or self._get_fallback_stock_data(ticker)
         except Exception as e:
             logger.error(f"주식 데이터 조회 실패 ({ticker}): {str(e)}")
             
@@ -117,7 +86,7 @@ class DataProcessor:
             if "429" in str(e) or "Too Many Requests" in str(e):
                 logger.warning(f"Rate Limit 감지 ({ticker}). 캐시된 데이터 반환")
                 # Rate Limit 시 더 긴 시간 캐시 사용
-                last_data = self._get_cached_data(cache_key)
+                last_data = self._get_cached_data(cache_key, allow_stale=True)
                 if last_data:
                     return last_data
                 else:
@@ -125,7 +94,7 @@ class DataProcessor:
                     return self._get_fallback_stock_data(ticker)
             
             # 마지막 성공 데이터 반환 시도
-            last_data = self._get_cached_data(cache_key)
+            last_data = self._get_cached_data(cache_key, allow_stale=True)
             if last_data:
                 logger.info(f"캐시된 마지막 데이터 반환 ({ticker})")
                 return last_data
@@ -166,7 +135,6 @@ class DataProcessor:
             "volumes": volumes
         }
 
-    @circuit_breaker(max_failures=3, reset_time=60)
     async def get_kospi_data(self) -> Dict:
         """코스피 지수 데이터 조회 (pykrx)"""
         cache_key = "kospi_data"
@@ -186,7 +154,8 @@ class DataProcessor:
                     raise ValueError("데이터가 비어있습니다")
                 return df
 
-            df = await asyncio.to_thread(_fetch_kospi)
+            with breakers.get("pykrx", "index").guard():
+                df = await asyncio.to_thread(_fetch_kospi)
 
             data = {
                 "dates": df.index.strftime('%Y-%m-%d').tolist(),
@@ -200,13 +169,12 @@ class DataProcessor:
         except Exception as e:
             logger.error(f"코스피 데이터 조회 실패: {str(e)}")
             # 마지막 성공 데이터 반환 시도
-            last_data = self._get_cached_data(cache_key)
+            last_data = self._get_cached_data(cache_key, allow_stale=True)
             if last_data:
                 logger.info("캐시된 마지막 코스피 데이터 반환")
                 return last_data
             raise HTTPException(status_code=503, detail=f"코스피 데이터 조회 실패: {str(e)}")
 
-    @circuit_breaker(max_failures=3, reset_time=60)
     async def get_market_cap_data(self) -> List[Dict]:
         """시가총액 데이터 조회"""
         cache_key = "market_cap_data"
@@ -238,7 +206,8 @@ class DataProcessor:
                     raise ValueError("데이터가 비어있습니다")
                 return result
 
-            result = await asyncio.to_thread(_fetch_market_cap)
+            with breakers.get("pykrx", "market_cap").guard():
+                result = await asyncio.to_thread(_fetch_market_cap)
             
             self._set_cached_data(cache_key, result)
             return result
@@ -246,7 +215,7 @@ class DataProcessor:
         except Exception as e:
             logger.error(f"시가총액 데이터 조회 실패: {str(e)}")
             # 마지막 성공 데이터 반환 시도
-            last_data = self._get_cached_data(cache_key)
+            last_data = self._get_cached_data(cache_key, allow_stale=True)
             if last_data:
                 logger.info("캐시된 마지막 시가총액 데이터 반환")
                 return last_data
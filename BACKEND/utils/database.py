@@ -1,10 +1,54 @@
-from pymongo import MongoClient
+from pymongo import MongoClient, monitoring
 import os
 import logging
 from typing import Optional
 
+from utils.circuit_breaker import CircuitOpenError, breakers
+
 logger = logging.getLogger("database")
 
+mongo_breaker = breakers.get("mongo")
+heartbeat_breaker = breakers.get("mongo", "heartbeat")
+
+
+class _CommandBreakerListener(monitoring.CommandListener):
+    """
+    명령 결과를 mongo 차단기에 기록.
+    서버가 돌려준 오류(중복 키 등)는 장애가 아니므로 성공으로, 드라이버 쪽 예외(네트워크/시간 초과)만 실패로 센다
+    """
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        mongo_breaker.record(True)
+
+    def failed(self, event):
+        failure = event.failure
+        if isinstance(failure, dict) and "errtype" in failure:  # 드라이버 예외면 errtype 이 있음
+            mongo_breaker.record(False, f"{failure['errtype']}: {failure.get('errmsg')}")
+        else:
+            mongo_breaker.record(True)
+
+
+class _HeartbeatBreakerListener(monitoring.ServerHeartbeatListener):
+    """
+    하트비트 결과는 별도 차단기(mongo:heartbeat)에 기록 - /health/breakers 에서 서버 상태 확인용.
+    성공을 mongo 차단기에 섞으면 주기적인 하트비트가 명령 실패율을 낮추고 half_open 을 닫아 버리므로
+    mongo 차단기에는 실패만 센다 (서버에 닿지 못하면 명령은 서버 선택 단계에서 끝나 명령 이벤트가 없음)
+    """
+
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        heartbeat_breaker.record(True)
+
+    def failed(self, event):
+        heartbeat_breaker.record(False, event.reply)
+        mongo_breaker.record(False, event.reply)
+
+
 class DatabaseManager:
     def __init__(self):
         self.client: Optional[MongoClient] = None
@@ -19,7 +63,7 @@ class DatabaseManager:
             if not mongodb_uri:
                 raise ValueError("MONGODB_URI 환경변수가 설정되지 않았습니다.")
 
-            self.client = MongoClient(mongodb_uri)
+            self.client = MongoClient(mongodb_uri, event_listeners=[_CommandBreakerListener(), _HeartbeatBreakerListener()])
             db_name = os.getenv("DB_NAME", "testDB")
             self.db = self.client[db_name]
             
@@ -45,9 +89,11 @@ class DatabaseManager:
         return self.db
 
     def get_collection(self, collection_name: str):
-        """컬렉션 객체 반환"""
+        """컬렉션 객체 반환 (mongo 차단기가 열려 있으면 CircuitOpenError - 서버 선택 대기 없이 바로 폴백)"""
         if not self.is_connected():
             raise RuntimeError("데이터베이스가 연결되지 않았습니다. connect()를 먼저 호출하세요.")
+        if not mongo_breaker.allow():
+            raise CircuitOpenError(mongo_breaker.name, mongo_breaker.retry_in())
         return self.db[collection_name]
 
     def close(self):
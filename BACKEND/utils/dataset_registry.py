@@ -0,0 +1,219 @@
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from utils.artifacts import ARTIFACT_ONLY, artifact_store, read_json_artifact
+
+logger = logging.getLogger("dataset_registry")
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 파일 변경(mtime) 확인 주기 (초). 매 요청마다 stat 하지 않도록 제한
+CHECK_INTERVAL = float(os.getenv("DATASET_CHECK_INTERVAL", "5"))
+
+
+def load_json(path: str):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def approx_size(obj, _seen: Optional[set] = None) -> int:
+    """객체의 대략적인 메모리 사용량 (bytes). DataFrame/ndarray는 자체 계산 사용"""
+    if _seen is None:
+        _seen = set()
+    if id(obj) in _seen:
+        return 0
+    _seen.add(id(obj))
+
+    if hasattr(obj, "memory_usage") and hasattr(obj, "columns"):  # pandas DataFrame
+        return int(obj.memory_usage(deep=True).sum())
+    if hasattr(obj, "nbytes") and hasattr(obj, "dtype"):  # numpy ndarray
+        # 메모리 매핑 배열(스냅샷)은 워커 간 공유되는 페이지 캐시라 제외
+        return 0 if getattr(obj, "filename", None) else int(obj.nbytes)
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(approx_size(k, _seen) + approx_size(v, _seen) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple, set, frozenset)):
+        size += sum(approx_size(v, _seen) for v in obj)
+    elif hasattr(obj, "__dict__"):
+        size += approx_size(vars(obj), _seen)
+    return size
+
+
+class Dataset:
+    """파일 하나에 대한 적재 상태 (데이터, 키 인덱스, 파생 캐시, 통계)"""
+
+    def __init__(self, name: str, path: str, loader: Callable[[str], Any],
+                 indexer: Optional[Callable[[Any], Any]] = None,
+                 artifact_loader: Callable[[Any], Any] = read_json_artifact):
+        self.name = name
+        self.path = path
+        self.loader = loader
+        self.indexer = indexer
+        self.artifact_loader = artifact_loader
+
+        self.data = None
+        self.index = None
+        self.version = 0
+        self.mtime: Optional[float] = None
+        self.origin: Optional[str] = None  # "artifact" | "file"
+        self.loaded_at: Optional[float] = None
+        self.load_time_ms: Optional[float] = None
+        self.approx_bytes: Optional[int] = None
+        self.last_error: Optional[str] = None
+        self._derived: Dict[str, Any] = {}
+        self._checked_at = 0.0
+        self.lock = threading.RLock()
+
+    def stats(self) -> Dict:
+        return {
+            "name": self.name,
+            "path": os.path.relpath(self.path, BASE_DIR),
+            "loaded": self.data is not None,
+            "origin": self.origin,
+            "version": self.version,
+            "mtime": self.mtime,
+            "loaded_at": self.loaded_at,
+            "load_time_ms": self.load_time_ms,
+            "approx_bytes": self.approx_bytes,
+            "last_error": self.last_error,
+        }
+
+
+class DatasetRegistry:
+    """
+    JSON/CSV 등 파일 기반 데이터셋 레지스트리.
+    - 경로는 BACKEND 패키지 기준으로 해석
+    - 최초 요청 시 한 번 적재하고 키 인덱스를 함께 생성
+    - 빌드된 아티팩트(utils.artifacts)가 있으면 원본 대신 아티팩트에서 적재
+    - 파일(또는 아티팩트 매니페스트) mtime이 바뀌면 다시 적재 (실패 시 이전 데이터 유지)
+    - 데이터셋별 적재 시간/메모리 사용량 보고
+    """
+
+    def __init__(self, base_dir: str = BASE_DIR, check_interval: float = CHECK_INTERVAL):
+        self.base_dir = base_dir
+        self.check_interval = check_interval
+        self._datasets: Dict[str, Dataset] = {}
+
+    def register(self, name: str, filename: str, loader: Callable[[str], Any] = load_json,
+                 indexer: Optional[Callable[[Any], Any]] = None,
+                 artifact_loader: Callable[[Any], Any] = read_json_artifact) -> Dataset:
+        """
+        loader: 원본 파일 경로 → 데이터
+        artifact_loader: 아티팩트 스냅샷 → 데이터 (기본: JSON 본문 블롭)
+        """
+        path = filename if os.path.isabs(filename) else os.path.join(self.base_dir, filename)
+        dataset = Dataset(name, path, loader, indexer, artifact_loader)
+        self._datasets[name] = dataset
+        return dataset
+
+    def path(self, name: str) -> str:
+        return self._dataset(name).path
+
+    def _dataset(self, name: str) -> Dataset:
+        try:
+            return self._datasets[name]
+        except KeyError:
+            raise KeyError(f"등록되지 않은 데이터셋: {name}")
+
+    def _load(self, ds: Dataset, mtime: float, origin: str):
+        started = time.perf_counter()
+        if origin == "artifact":
+            data = ds.artifact_loader(artifact_store.open(ds.name))
+        else:
+            data = ds.loader(ds.path)
+        index = ds.indexer(data) if ds.indexer else None
+        load_time_ms = round((time.perf_counter() - started) * 1000, 1)
+
+        ds.data, ds.index = data, index
+        ds._derived = {}
+        ds.version += 1
+        ds.mtime = mtime
+        ds.origin = origin
+        ds.loaded_at = time.time()
+        ds.load_time_ms = load_time_ms
+        ds.approx_bytes = approx_size(data) + (approx_size(index) if index is not None else 0)
+        ds.last_error = None
+        logger.info(
+            "✅ 데이터셋 적재: %s v%d [%s] (%.1fms, ~%.1fMB)",
+            ds.name, ds.version, origin, load_time_ms, ds.approx_bytes / 1e6,
+        )
+
+    def _source(self, ds: Dataset):
+        """(적재 경로 종류, 변경 감지용 mtime)"""
+        mtime = artifact_store.mtime(ds.name)
+        if mtime is not None:
+            return "artifact", mtime
+        if ARTIFACT_ONLY:
+            raise FileNotFoundError(f"아티팩트 없음: {ds.name}")
+        return "file", os.path.getmtime(ds.path)
+
+    def _ensure_fresh(self, ds: Dataset) -> Dataset:
+        now = time.monotonic()
+        if ds.data is not None and now - ds._checked_at < self.check_interval:
+            return ds
+
+        with ds.lock:
+            if ds.data is not None and time.monotonic() - ds._checked_at < self.check_interval:
+                return ds
+            try:
+                origin, mtime = self._source(ds)
+            except OSError:
+                if ds.data is None:
+                    raise FileNotFoundError(ds.path)
+                # 파일이 잠시 사라진 경우(교체 중 등) 기존 데이터 유지
+                ds._checked_at = time.monotonic()
+                return ds
+
+            if ds.data is None or mtime != ds.mtime or origin != ds.origin:
+                try:
+                    self._load(ds, mtime, origin)
+                except Exception as e:
+                    ds.last_error = str(e)
+                    if ds.data is None:
+                        raise
+                    logger.warning("데이터셋 재적재 실패(%s) - 이전 버전 유지: %s", ds.name, e)
+            ds._checked_at = time.monotonic()
+        return ds
+
+    def get(self, name: str):
+        """데이터셋 본문"""
+        return self._ensure_fresh(self._dataset(name)).data
+
+    def index(self, name: str):
+        """데이터셋 키 인덱스 (indexer 결과)"""
+        return self._ensure_fresh(self._dataset(name)).index
+
+    def version(self, name: str) -> int:
+        return self._ensure_fresh(self._dataset(name)).version
+
+    def derive(self, name: str, key: str, builder: Callable[[Any], Any]):
+        """데이터셋 버전별로 한 번만 계산하는 파생 값 (재적재 시 무효화)"""
+        ds = self._ensure_fresh(self._dataset(name))
+        derived = ds._derived
+        if key in derived:
+            return derived[key]
+        with ds.lock:
+            if key not in ds._derived:
+                ds._derived[key] = builder(ds.data)
+            return ds._derived[key]
+
+    def reload(self, name: Optional[str] = None):
+        """다음 조회 시 mtime과 상관없이 다시 적재"""
+        targets = [self._dataset(name)] if name else list(self._datasets.values())
+        for ds in targets:
+            with ds.lock:
+                ds.mtime = None
+                ds._checked_at = 0.0
+
+    def stats(self) -> List[Dict]:
+        return [ds.stats() for ds in self._datasets.values()]
+
+
+# 싱글톤 인스턴스 (데이터셋 등록은 각 서비스 모듈에서)
+dataset_registry = DatasetRegistry()
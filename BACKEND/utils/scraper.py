@@ -0,0 +1,167 @@
+"""
+HTTP 우선 스크래핑 엔진.
+
+서버 렌더링 페이지(다음/네이버 뉴스 검색, FnGuide 컨센서스 등)는 브라우저 없이
+공유 aiohttp 세션으로 받아 BeautifulSoup(lxml)으로 파싱한다.
+셀렉터 결과가 비어 있을 때만(JS 렌더링 페이지, 차단 등) Selenium 풀 경로로 대체한다.
+사이트별로 어떤 경로가 응답했는지 집계해 HTTP 적중률을 확인할 수 있다.
+"""
+import asyncio
+import logging
+import os
+import time
+from collections import defaultdict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urljoin
+
+import aiohttp
+import lxml.html
+from bs4 import BeautifulSoup
+
+from utils.selenium_utils import selenium_manager
+
+logger = logging.getLogger("scraper")
+
+HTTP_TIMEOUT = float(os.getenv("SCRAPER_HTTP_TIMEOUT", "10"))
+HTTP_MAX_CONNECTIONS = int(os.getenv("SCRAPER_MAX_CONNECTIONS", "20"))
+HTML_PARSER = "lxml"
+
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "ko-KR,ko;q=0.9,en;q=0.8",
+}
+
+
+def parse_html(content) -> BeautifulSoup:
+    """bytes를 넘기면 meta charset 기준으로 디코딩 (euc-kr 페이지 대응)"""
+    return BeautifulSoup(content, HTML_PARSER)
+
+
+def parse_document(content) -> lxml.html.HtmlElement:
+    """lxml 문서 파싱 (BeautifulSoup보다 빠름, 테이블 한 번 훑는 파서용). bytes면 meta charset 기준 디코딩"""
+    return lxml.html.document_fromstring(content)
+
+
+def extract_links(soup: BeautifulSoup, selector: str, base_url: str, max_items: int) -> List[Dict]:
+    """selector에 걸리는 <a>들을 {title, url, timestamp} 목록으로 (SeleniumManager.scrape_news와 동일 형식)"""
+    items = []
+    for element in soup.select(selector):
+        title = element.get_text(" ", strip=True)
+        href = element.get("href")
+        if title and href:
+            items.append({
+                "title": title,
+                "url": urljoin(base_url, href),
+                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S"),
+            })
+            if len(items) >= max_items:
+                break
+    return items
+
+
+class ScrapeEngine:
+    """공유 HTTP 세션 + 파서, 빈 결과일 때 Selenium 대체"""
+
+    def __init__(self, timeout: float = HTTP_TIMEOUT, max_connections: int = HTTP_MAX_CONNECTIONS):
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"http": 0, "selenium": 0, "empty": 0, "http_errors": 0}
+        )
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._loop is not loop:
+            self._session = aiohttp.ClientSession(
+                headers=DEFAULT_HEADERS,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                connector=aiohttp.TCPConnector(limit=self.max_connections, ttl_dns_cache=300),
+            )
+            self._loop = loop
+        return self._session
+
+    async def fetch(self, url: str) -> bytes:
+        session = await self._get_session()
+        async with session.get(url) as resp:
+            resp.raise_for_status()
+            return await resp.read()
+
+    async def fetch_response(self, url: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, Dict, bytes]:
+        """(상태 코드, 응답 헤더, 본문). 조건부 요청(If-None-Match 등)용 - 304는 예외 없이 반환"""
+        session = await self._get_session()
+        async with session.get(url, headers=headers) as resp:
+            resp.raise_for_status()
+            return resp.status, dict(resp.headers), await resp.read()
+
+    async def _fetch_doc(self, site: str, url: str, parser: Callable[[bytes], Any] = parse_html):
+        try:
+            return parser(await self.fetch(url))
+        except Exception as e:
+            self._stats[site]["http_errors"] += 1
+            logger.warning("⚠️ HTTP 요청 실패 (%s): %s", site, e)
+            return None
+
+    def _record(self, site: str, path: str, url: str):
+        self._stats[site][path] += 1
+        logger.info("📡 %s ← %s (%s)", site, path, url)
+
+    async def scrape_links(self, site: str, url: str, selector: str, max_items: int = 10,
+                           wait_time: int = 3) -> List[Dict]:
+        """링크 목록 스크래핑: HTTP → (비었으면) Selenium"""
+        soup = await self._fetch_doc(site, url)
+        if soup is not None:
+            items = extract_links(soup, selector, url, max_items)
+            if items:
+                self._record(site, "http", url)
+                return items
+
+        items = await selenium_manager.scrape_news(url, selector, max_items=max_items, wait_time=wait_time,
+                                                   profile=site)
+        self._record(site, "selenium" if items else "empty", url)
+        return items
+
+    async def scrape(self, site: str, url: str, html_logic: Callable[[Any], Any],
+                     driver_logic: Callable, wait_time: int = 3,
+                     parser: Callable[[bytes], Any] = parse_html) -> Any:
+        """
+        커스텀 스크래핑: HTTP 응답을 parser(기본 BeautifulSoup)로 읽어 html_logic(doc)으로 파싱하고,
+        결과가 비었으면 Selenium에서 driver_logic(driver) 실행
+        """
+        doc = await self._fetch_doc(site, url, parser)
+        if doc is not None:
+            try:
+                result = html_logic(doc)
+            except Exception as e:
+                logger.warning("⚠️ HTML 파싱 실패 (%s): %s", site, e)
+                result = None
+            if result:
+                self._record(site, "http", url)
+                return result
+
+        result = await selenium_manager.scrape_with_custom_logic(url, driver_logic, wait_time=wait_time,
+                                                                 profile=site)
+        self._record(site, "selenium" if result else "empty", url)
+        return result
+
+    def stats(self) -> Dict[str, Dict]:
+        """사이트별 응답 경로 집계 + HTTP 적중률"""
+        out = {}
+        for site, counts in self._stats.items():
+            served = counts["http"] + counts["selenium"] + counts["empty"]
+            out[site] = {**counts, "http_hit_rate": round(counts["http"] / served, 3) if served else None}
+        return out
+
+    async def close(self):
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+# 인스턴스 (서비스에서 import)
+scrape_engine = ScrapeEngine()
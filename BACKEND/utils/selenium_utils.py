@@ -4,19 +4,83 @@ from __future__ import annotations
 import os
 import stat
 import logging
-from typing import Optional
+import traceback
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import Awaitable, Optional
 
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
 import asyncio
 import time
 from typing import List, Dict, Callable
 
+from utils.circuit_breaker import CircuitOpenError, breakers
+
 logger = logging.getLogger("selenium_utils")
 
+# WebDriver 풀 설정
+POOL_SIZE = int(os.getenv("SELENIUM_POOL_SIZE", "2"))
+MAX_PAGES_PER_DRIVER = int(os.getenv("SELENIUM_MAX_PAGES", "50"))  # K 페이지 후 재생성
+ACQUIRE_TIMEOUT = float(os.getenv("SELENIUM_ACQUIRE_TIMEOUT", "30"))
+PREWARM = os.getenv("SELENIUM_PREWARM", "1") == "1"
+SCRAPE_DEADLINE = float(os.getenv("SELENIUM_SCRAPE_DEADLINE", "40"))  # 대여~추출 전체 제한 시간
+# 0이면 예전 방식 (normal 로드 + 고정 sleep + 리소스 차단 없음) - 지연 시간 비교용
+USE_PROFILES = os.getenv("SELENIUM_PROFILES", "1") == "1"
+
+
+class ScrapeProfile:
+    """
+    대상 사이트별 스크래핑 설정.
+    wait_selector: 이 요소가 나타나면 바로 추출 (없으면 고정 sleep)
+    blocked_urls: CDP Network.setBlockedURLs 패턴 (이미지/폰트/광고/분석 스크립트)
+    """
+
+    def __init__(self, name: str, wait_selector: Optional[str] = None, wait_timeout: float = 10,
+                 blocked_urls: Optional[List[str]] = None):
+        self.name = name
+        self.wait_selector = wait_selector
+        self.wait_timeout = wait_timeout
+        self.blocked_urls = tuple(blocked_urls if blocked_urls is not None else BLOCKED_RESOURCES)
+
+
+BLOCKED_RESOURCES = [
+    # 이미지/미디어
+    "*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.svg", "*.ico", "*.bmp", "*.mp4", "*.webm",
+    # 폰트
+    "*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot",
+    # 광고/분석
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googlesyndication.com*",
+    "*adservice.google.*", "*facebook.net*", "*criteo.*", "*scorecardresearch.com*",
+]
+
+SCRAPE_PROFILES = {
+    profile.name: profile
+    for profile in [
+        ScrapeProfile("default"),
+        ScrapeProfile("daum_news", "#dnsColl, ul.c-list-basic",
+                      blocked_urls=BLOCKED_RESOURCES + ["*display.ad.daum.net*", "*t1.daumcdn.net/adfit*",
+                                                        "*tiara.daum.net*"]),
+        ScrapeProfile("naver_news", "li.bx, a.news_tit",
+                      blocked_urls=BLOCKED_RESOURCES + ["*wcs.naver.net*", "*nlog.naver.com*", "*veta.naver.com*",
+                                                        "*siape.veta.naver.com*"]),
+        ScrapeProfile("fnguide_consensus", "#bodycontent4 > tr"),
+        ScrapeProfile("fnguide_spv", "table.table_common"),
+        # 크롤링 작업(crawl.jobs)은 표 XPath로 직접 대기
+        ScrapeProfile("fnguide_corp"),
+        ScrapeProfile("nice_export"),
+    ]
+}
+
+
+def get_profile(name: Optional[str]) -> ScrapeProfile:
+    return SCRAPE_PROFILES.get(name or "default", SCRAPE_PROFILES["default"])
+
 
 def _ensure_executable(path: str) -> str:
     """경로에 실행 권한을 보장."""
@@ -75,7 +139,6 @@ def build_chrome_options(headless: bool = True) -> Options:
     opts.add_argument("--disable-gpu")  # 리눅스 서버 안정성
     opts.add_argument("--disable-software-rasterizer")
     opts.add_argument("--disable-features=VizDisplayCompositor")
-    opts.add_argument("--remote-debugging-port=9222")  # 렌더러 연결 안정성
     opts.add_argument("--window-size=1920,1080")
     
     # 성능 & 메모리 최적화
@@ -98,7 +161,11 @@ def build_chrome_options(headless: bool = True) -> Options:
     opts.add_argument("--lang=ko-KR")
     opts.add_argument("--no-first-run")
     opts.add_argument("--no-default-browser-check")
-    
+
+    # DOMContentLoaded에서 get() 반환 (이미지/서브리소스 대기 없음, 준비 여부는 프로필 셀렉터로 확인)
+    if USE_PROFILES:
+        opts.page_load_strategy = "eager"
+
     return opts
 
 
@@ -117,7 +184,10 @@ def create_driver(headless: bool = True) -> webdriver.Chrome:
         # WebDriver 생성 및 설정
         driver = webdriver.Chrome(service=service, options=options)
         driver.set_page_load_timeout(30)  # 페이지 로드 타임아웃
-        driver.implicitly_wait(10)  # 요소 찾기 타임아웃
+        # 프로필 사용 시 명시적 대기(WebDriverWait)만 사용 (암묵적 대기와 섞으면 대기 시간이 늘어남)
+        driver.implicitly_wait(0 if USE_PROFILES else 10)
+        if USE_PROFILES:
+            driver.execute_cdp_cmd("Network.enable", {})
         
         logger.info("✅ WebDriver 생성 성공")
         return driver
@@ -128,242 +198,395 @@ def create_driver(headless: bool = True) -> webdriver.Chrome:
         raise
 
 
-# 기존 SeleniumManager 클래스와 호환성을 위한 래퍼
-class SeleniumManager:
-    def __init__(self):
-        self.driver = None
-        logger.info("SeleniumManager 초기화 완료")
-        
-    async def create_driver(self):
-        """WebDriver 생성 (사용자 제공 해결책 사용)"""
+class DriverPoolTimeout(TimeoutError):
+    """풀에서 제한 시간 안에 WebDriver를 빌리지 못함"""
+
+
+class ScrapeDeadlineExceeded(TimeoutError):
+    """스크래핑이 전체 제한 시간(SCRAPE_DEADLINE)을 넘김"""
+
+
+class PooledDriver:
+    """풀에 속한 WebDriver + 사용 횟수"""
+
+    def __init__(self, driver: webdriver.Chrome):
+        self.driver = driver
+        self.pages = 0
+        self.created_at = time.time()
+        self.aborted = False  # 작업 중 취소/타임아웃 → 상태를 알 수 없으므로 폐기
+        self.blocked_urls: Optional[tuple] = None  # 현재 적용된 차단 패턴
+
+    def prepare(self, profile: ScrapeProfile):
+        """프로필의 차단 패턴 적용 (직전과 같으면 생략)"""
+        if self.blocked_urls != profile.blocked_urls:
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(profile.blocked_urls)})
+            self.blocked_urls = profile.blocked_urls
+
+    def is_alive(self) -> bool:
+        """헬스 체크 (브라우저/세션이 살아 있는지)"""
         try:
-            self.driver = create_driver(headless=True)
-            return self.driver
-        except Exception as e:
-            logger.error("❌ WebDriver 생성 실패: %s", str(e))
-            return None
+            return self.driver.execute_script("return 1") == 1
+        except Exception:
+            return False
+
+    def reset(self):
+        """다음 사용자를 위해 빈 페이지로 이동 (실패하면 크래시로 간주)"""
+        self.driver.get("about:blank")
 
-    async def quit_driver(self):
-        """WebDriver 종료"""
+    def quit(self):
         try:
-            if self.driver:
-                self.driver.quit()
-                self.driver = None
-                logger.info("✅ WebDriver 종료 완료")
+            self.driver.quit()
         except Exception as e:
-            logger.error("❌ WebDriver 종료 실패: %s", str(e))
+            logger.warning("⚠️ WebDriver 종료 실패: %s", e)
+
+
+def _quit_orphan(future):
+    if not future.cancelled() and future.exception() is None:
+        PooledDriver(future.result()).quit()
+
+
+class DriverPool:
+    """
+    미리 띄워 둔 headless Chrome WebDriver 풀.
+    - 크기 고정 슬롯(asyncio.Queue). 빈 슬롯(None)은 빌릴 때 드라이버를 새로 만든다
+    - 시작 시 미리 생성(pre-warm), 빌릴 때 헬스 체크
+    - K 페이지 사용 후 또는 크래시(반납 시 about:blank 이동 실패) 시 백그라운드에서 재생성
+    - 빌리기는 제한 시간(acquire_timeout) 안에 슬롯이 나지 않으면 DriverPoolTimeout
+    - 모든 WebDriver 호출은 풀 크기만큼의 전용 스레드(run)에서 실행 (이벤트 루프 블로킹 방지)
+    - 사용 중 취소된 드라이버는 다른 스레드에서 즉시 quit 해 진행 중인 호출을 끊고 재생성
+    """
+
+    def __init__(self, size: int = POOL_SIZE, max_pages: int = MAX_PAGES_PER_DRIVER,
+                 acquire_timeout: float = ACQUIRE_TIMEOUT, headless: bool = True,
+                 factory: Callable[..., webdriver.Chrome] = None):
+        self.size = max(size, 1)
+        self.max_pages = max(max_pages, 1)
+        self.acquire_timeout = acquire_timeout
+        self.headless = headless
+        self._factory = factory or create_driver
+        self._queue: Optional[asyncio.Queue] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._tasks: set = set()
+        self._closed = False
+        self._stats = {"created": 0, "recycled": 0, "failed": 0, "timeouts": 0, "pages": 0, "in_use": 0}
 
-    async def scrape_news(self, url: str, selector: str, max_items: int = 10, wait_time: int = 3):
-        """다음뉴스 크롤링"""
+    async def start(self, prewarm: bool = PREWARM):
+        """슬롯 초기화 (+ 백그라운드 pre-warm). 여러 번 호출해도 한 번만 동작"""
+        if self._queue is not None:
+            return
+        self._closed = False
+        self._executor = ThreadPoolExecutor(max_workers=self.size, thread_name_prefix="webdriver")
+        self._queue = asyncio.Queue(maxsize=self.size)
+        for _ in range(self.size):
+            self._queue.put_nowait(None)
+        if prewarm:
+            self._spawn(self._prewarm())
+            logger.info("🔥 WebDriver 풀 pre-warm 시작 (size=%d)", self.size)
+
+    async def run(self, func: Callable, *args):
+        """WebDriver 전용 스레드에서 동기 함수 실행 (슬롯 수 = 스레드 수)"""
+        if self._executor is None:
+            raise RuntimeError("WebDriver 풀이 시작되지 않았거나 종료됨")
+        return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+
+    def _spawn(self, coro):
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _new_driver(self) -> PooledDriver:
+        if self._executor is None:
+            raise RuntimeError("WebDriver 풀이 시작되지 않았거나 종료됨")
+        future = self._executor.submit(self._factory, headless=self.headless)
         try:
-            # WebDriver 생성
-            driver = await self.create_driver()
-            if not driver:
-                logger.error("WebDriver 생성 실패")
-                return []
-            
+            driver = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            # 이미 생성 중인 스레드는 멈출 수 없으므로 완료되면 바로 종료 (브라우저 누수 방지)
+            future.add_done_callback(_quit_orphan)
+            raise
+        except Exception:
+            self._stats["failed"] += 1
+            raise
+        self._stats["created"] += 1
+        return PooledDriver(driver)
+
+    async def _prewarm(self):
+        slots = [self._queue.get_nowait() for _ in range(self._queue.qsize())]
+
+        async def warm(slot):
+            if slot is None:
+                try:
+                    slot = await self._new_driver()
+                except Exception as e:
+                    logger.warning("⚠️ WebDriver pre-warm 실패 (빌릴 때 재시도): %s", e)
+            self._queue.put_nowait(slot)
+
+        await asyncio.gather(*(warm(slot) for slot in slots))
+
+    async def _replace(self, pooled: PooledDriver):
+        """드라이버 폐기 후 새로 만들어 슬롯에 반환 (실패하면 빈 슬롯)"""
+        # 취소된 드라이버는 전용 스레드가 아직 붙잡고 있을 수 있으므로 기본 스레드풀에서 quit
+        await asyncio.to_thread(pooled.quit)
+        slot = None
+        if not self._closed:
             try:
-                # 페이지 로드
-                driver.get(url)
-                await asyncio.sleep(wait_time)  # 페이지 로딩 대기
-                
-                # 요소 찾기
-                elements = driver.find_elements(By.CSS_SELECTOR, selector)
-                
-                news_data = []
-                for i, element in enumerate(elements[:max_items]):
-                    try:
-                        # 제목과 링크 추출
-                        title = element.text.strip()
-                        href = element.get_attribute('href')
-                        
-                        if title and href:
-                            news_data.append({
-                                "title": title,
-                                "url": href,
-                                "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
-                            })
-                    except Exception as e:
-                        logger.warning("뉴스 항목 파싱 실패: %s", e)
-                        continue
-                
-                logger.info("✅ 뉴스 크롤링 성공: %d개 항목", len(news_data))
-                return news_data
-                
-            finally:
-                await self.quit_driver()
-                
+                slot = await self._new_driver()
+            except Exception as e:
+                logger.warning("⚠️ WebDriver 재생성 실패 (빌릴 때 재시도): %s", e)
+        if self._closed and slot is not None:
+            await asyncio.to_thread(slot.quit)
+            return
+        self._queue.put_nowait(slot)
+
+    async def acquire(self, timeout: Optional[float] = None) -> PooledDriver:
+        await self.start(prewarm=False)
+        timeout = self.acquire_timeout if timeout is None else timeout
+        try:
+            slot = await asyncio.wait_for(self._queue.get(), timeout)
+        except asyncio.TimeoutError:
+            self._stats["timeouts"] += 1
+            raise DriverPoolTimeout(f"WebDriver 대기 시간 초과 ({timeout}s)")
+
+        try:
+            if slot is not None and not await self.run(slot.is_alive):
+                logger.warning("⚠️ 헬스 체크 실패 - WebDriver 재생성")
+                self._stats["recycled"] += 1
+                await self.run(slot.quit)
+                slot = None
+            if slot is None:
+                slot = await self._new_driver()
+        except BaseException:
+            self._queue.put_nowait(None)  # 슬롯은 반드시 반환
+            raise
+        self._stats["in_use"] += 1
+        return slot
+
+    async def release(self, pooled: PooledDriver):
+        self._stats["in_use"] -= 1
+        self._stats["pages"] += 1
+        pooled.pages += 1
+
+        if self._closed:
+            await asyncio.to_thread(pooled.quit)
+            return
+        if pooled.aborted:
+            reason = "작업 취소"
+        elif pooled.pages >= self.max_pages:
+            reason = f"{pooled.pages}페이지 사용"
+        else:
+            try:
+                await self.run(pooled.reset)
+                self._queue.put_nowait(pooled)
+                return
+            except Exception as e:
+                reason = f"크래시 감지: {e}"
+        logger.info("♻️ WebDriver 재생성 (%s)", reason)
+        self._stats["recycled"] += 1
+        self._spawn(self._replace(pooled))
+
+    @asynccontextmanager
+    async def driver(self, timeout: Optional[float] = None):
+        """async with driver_pool.driver() as driver: ..."""
+        async with self.lease(timeout) as pooled:
+            yield pooled.driver
+
+    @asynccontextmanager
+    async def lease(self, timeout: Optional[float] = None):
+        """async with driver_pool.lease() as pooled: ... (PooledDriver 그대로)"""
+        pooled = await self.acquire(timeout)
+        try:
+            yield pooled
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            pooled.aborted = True
+            raise
+        finally:
+            await self.release(pooled)
+
+    async def close(self):
+        """대기 중인 드라이버 종료 (사용 중인 드라이버는 반납 시 종료)"""
+        self._closed = True
+        for task in list(self._tasks):
+            task.cancel()
+        if self._queue is None:
+            return
+        while not self._queue.empty():
+            slot = self._queue.get_nowait()
+            if slot is not None:
+                await asyncio.to_thread(slot.quit)
+        self._queue = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+        logger.info("✅ WebDriver 풀 종료")
+
+    def stats(self) -> Dict:
+        return {
+            "size": self.size,
+            "max_pages": self.max_pages,
+            "available": self._queue.qsize() if self._queue is not None else 0,
+            **self._stats,
+        }
+
+
+# 전역 WebDriver 풀 (앱 startup에서 pre-warm)
+driver_pool = DriverPool()
+
+
+async def with_deadline(coro: Awaitable, deadline: float = SCRAPE_DEADLINE):
+    """스크래핑 전체 제한 시간. 넘기면 작업을 취소(드라이버 폐기)하고 ScrapeDeadlineExceeded"""
+    try:
+        return await asyncio.wait_for(coro, deadline)
+    except asyncio.TimeoutError:
+        raise ScrapeDeadlineExceeded(f"스크래핑 제한 시간 초과 ({deadline}s)")
+
+
+async def cancel_on_disconnect(request, coro: Awaitable, poll_interval: float = 0.5):
+    """
+    클라이언트 연결이 끊기면 작업 취소 (Starlette는 일반 엔드포인트를 자동으로 취소하지 않음).
+    끊긴 경우 응답을 받을 곳이 없으므로 None 반환.
+    """
+    task = asyncio.ensure_future(coro)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=poll_interval)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                logger.info("🔌 클라이언트 연결 종료 - 스크래핑 취소 (%s)", request.url.path)
+                task.cancel()
+                return None
+    finally:
+        if not task.done():
+            task.cancel()
+
+
+# 기존 SeleniumManager 클래스와 호환성을 위한 래퍼
+class SeleniumManager:
+    def __init__(self):
+        # 드라이버는 driver_pool에서 요청마다 대여 (인스턴스가 드라이버를 들고 있지 않음)
+        self._latency: Dict[str, deque] = defaultdict(lambda: deque(maxlen=200))
+        logger.info("SeleniumManager 초기화 완료")
+
+    async def scrape_news(self, url: str, selector: str, max_items: int = 10, wait_time: int = 3,
+                          deadline: float = SCRAPE_DEADLINE, profile: Optional[str] = None):
+        """
+        다음뉴스 크롤링 (풀에서 WebDriver 대여, WebDriver 호출은 전용 스레드에서).
+        profile의 차단 패턴을 적용하고, 항목 셀렉터가 나타나면 바로 추출
+        """
+
+        def extract(driver) -> List[Dict]:
+            news_data = []
+            for element in driver.find_elements(By.CSS_SELECTOR, selector)[:max_items]:
+                try:
+                    # 제목과 링크 추출
+                    title = element.text.strip()
+                    href = element.get_attribute('href')
+
+                    if title and href:
+                        news_data.append({
+                            "title": title,
+                            "url": href,
+                            "timestamp": time.strftime("%Y-%m-%d %H:%M:%S")
+                        })
+                except Exception as e:
+                    logger.warning("뉴스 항목 파싱 실패: %s", e)
+                    continue
+            return news_data
+
+        scrape_profile = get_profile(profile)
+        try:
+            # 풀 대기 초과는 사이트 장애가 아니므로 차단기 실패로 세지 않음
+            with self._breaker(scrape_profile).guard(ignore=(DriverPoolTimeout,)):
+                news_data = await with_deadline(
+                    self._scrape(url, extract, wait_time, scrape_profile, wait_selector=selector), deadline
+                )
+            logger.info("✅ 뉴스 크롤링 성공: %d개 항목", len(news_data))
+            return news_data
+
+        except CircuitOpenError as e:
+            logger.info("⏭️ 뉴스 크롤링 건너뜀: %s", e)
+            return []
         except Exception as e:
             logger.error("❌ 뉴스 크롤링 실패 (%s): %s", url, str(e))
             return []
 
-    async def scrape_with_custom_logic(self, url: str, custom_logic: Callable, wait_time: int = 3):
-        """커스텀 스크래핑 로직 실행"""
+    async def scrape_with_custom_logic(self, url: str, custom_logic: Callable, wait_time: int = 3,
+                                       deadline: float = SCRAPE_DEADLINE, profile: Optional[str] = None):
+        """커스텀 스크래핑 로직 실행 (풀에서 WebDriver 대여, custom_logic은 전용 스레드에서)"""
+        scrape_profile = get_profile(profile)
         try:
-            # WebDriver 생성
-            driver = await self.create_driver()
-            if not driver:
-                logger.error("WebDriver 생성 실패")
-                return []
-            
-            try:
-                # 페이지 로드
-                driver.get(url)
-                await asyncio.sleep(wait_time)  # 페이지 로딩 대기
-                
-                # 커스텀 로직 실행
-                result = custom_logic(driver)
-                return result
-                
-            finally:
-                await self.quit_driver()
-                
+            with self._breaker(scrape_profile).guard(ignore=(DriverPoolTimeout,)):
+                return await with_deadline(self._scrape(url, custom_logic, wait_time, scrape_profile), deadline)
+
+        except CircuitOpenError as e:
+            logger.info("⏭️ 커스텀 스크래핑 건너뜀: %s", e)
+            return []
         except Exception as e:
             logger.error("❌ 커스텀 스크래핑 실패 (%s): %s", url, str(e))
             return []
 
-    def _init_driver(self):
-        """WebDriver 초기화"""
-        try:
-            logger.info("====== WebDriver manager ======")
-            
-            # Linux 환경에서 Chrome 옵션 설정
-            chrome_options = webdriver.ChromeOptions()
-            chrome_options.add_argument('--no-sandbox')
-            chrome_options.add_argument('--disable-dev-shm-usage')
-            chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('--headless')  # Railway에서는 headless 모드 필수
-            chrome_options.add_argument('--remote-debugging-port=9222')
-            chrome_options.add_argument('--disable-web-security')
-            chrome_options.add_argument('--allow-running-insecure-content')
-            chrome_options.add_argument('--disable-extensions')
-            chrome_options.add_argument('--disable-plugins')
-            chrome_options.add_argument('--disable-images')
-            # chrome_options.add_argument('--disable-javascript')  # JavaScript 비활성화로 안정성 향상
-            chrome_options.add_argument('--user-agent=Mozilla/5.0 (Linux; Android 6.0; Nexus 5 Build/MRA58N) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Mobile Safari/537.36')
-            
-            # Railway 환경에서 필요한 추가 설정
-            chrome_options.add_argument('--disable-background-timer-throttling')
-            chrome_options.add_argument('--disable-backgrounding-occluded-windows')
-            chrome_options.add_argument('--disable-renderer-backgrounding')
-            chrome_options.add_argument('--disable-features=TranslateUI')
-            chrome_options.add_argument('--disable-ipc-flooding-protection')
-            
-            # 메모리 사용량 최적화
-            chrome_options.add_argument('--memory-pressure-off')
-            chrome_options.add_argument('--max_old_space_size=4096')
-            
-            # 로그 레벨 설정
-            chrome_options.add_argument('--log-level=3')
-            chrome_options.add_experimental_option('excludeSwitches', ['enable-logging'])
-            
-            # WebDriver Manager를 사용하여 ChromeDriver 자동 관리
-            service = Service(ChromeDriverManager().install())
-            
-            # WebDriver 생성
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            
-            # 페이지 로드 타임아웃 설정
-            self.driver.set_page_load_timeout(30)
-            self.driver.implicitly_wait(10)
-            
-            logger.info("✅ WebDriver 생성 성공")
-            
-        except Exception as e:
-            logger.error(f"❌ WebDriver 생성 실패: {e}")
-            self.driver = None
+    @staticmethod
+    def _breaker(profile: ScrapeProfile):
+        """사이트(프로필)별 회로 차단기 - 연속 시간 초과 시 드라이버를 잡지 않고 바로 빈 결과"""
+        return breakers.get("selenium", profile.name)
 
-    def crawl_company_news(self, search_query: str, max_news: int = 10) -> List[Dict]:
-        """기업별 관련 뉴스 크롤링"""
+    async def _scrape(self, url: str, extract: Callable, wait_time: int, profile: ScrapeProfile,
+                      wait_selector: Optional[str] = None):
+        """
+        대여 → 페이지 로드 → 준비 대기 → 추출. 취소되면 드라이버는 풀에서 폐기됨.
+        준비 대기: 셀렉터가 있으면 요소가 나타날 때까지(최대 profile.wait_timeout), 없으면 고정 wait_time
+        """
+        wait_selector = wait_selector or profile.wait_selector
+        async with driver_pool.lease() as pooled:
+            driver = pooled.driver
+            started = time.perf_counter()
+            if USE_PROFILES:
+                await driver_pool.run(pooled.prepare, profile)
+            await driver_pool.run(driver.get, url)
+            loaded = time.perf_counter()
+            if USE_PROFILES and wait_selector:
+                await driver_pool.run(self._wait_ready, driver, wait_selector, profile.wait_timeout)
+            else:
+                await asyncio.sleep(wait_time)  # 페이지 로딩 대기
+            ready = time.perf_counter()
+            result = await driver_pool.run(extract, driver)
+            self._latency[profile.name].append(
+                (loaded - started, ready - loaded, time.perf_counter() - ready)
+            )
+            return result
+
+    @staticmethod
+    def _wait_ready(driver, selector: str, timeout: float) -> bool:
+        """요소가 나타나면 True. 시간 초과면 False (있는 만큼 추출)"""
         try:
-            if not self.driver:
-                self._init_driver()
-            
-            # 더 안정적인 뉴스 사이트 사용 (네이버 뉴스 대신)
-            search_url = f"https://search.naver.com/search.naver?where=news&query={search_query}&sort=1"  # 최신순 정렬
-            logger.info(f"🔍 뉴스 검색 URL: {search_url}")
-            
-            self.driver.get(search_url)
-            time.sleep(3)  # 페이지 로딩 대기 시간 증가
-            
-            news_items = []
-            
-            # 더 구체적인 CSS 선택자 사용
-            try:
-                news_elements = self.driver.find_elements(By.CSS_SELECTOR, "li.bx")
-                logger.info(f"📰 찾은 뉴스 요소 수: {len(news_elements)}")
-                
-                for i, element in enumerate(news_elements[:max_news]):
-                    try:
-                        # 제목 추출
-                        title_element = element.find_element(By.CSS_SELECTOR, "a.news_tit")
-                        title = title_element.text.strip()
-                        link = title_element.get_attribute("href")
-                        
-                        # 내용 추출
-                        try:
-                            content_element = element.find_element(By.CSS_SELECTOR, "div.dsc_wrap")
-                            content = content_element.text.strip()
-                        except:
-                            content = ""
-                        
-                        # 언론사 추출
-                        try:
-                            press_element = element.find_element(By.CSS_SELECTOR, "a.press")
-                            category = press_element.text.strip()
-                        except:
-                            category = ""
-                        
-                        # 날짜 추출
-                        try:
-                            date_element = element.find_element(By.CSS_SELECTOR, "span.info")
-                            date = date_element.text.strip()
-                        except:
-                            date = ""
-                        
-                        if title and link:  # 제목과 링크가 있는 경우만 추가
-                            news_items.append({
-                                "title": title,
-                                "link": link,
-                                "content": content,
-                                "date": date,
-                                "category": category
-                            })
-                            logger.info(f"✅ 뉴스 항목 {i+1} 추가: {title[:30]}...")
-                        
-                    except Exception as e:
-                        logger.warning(f"⚠️ 뉴스 항목 {i+1} 파싱 실패: {e}")
-                        continue
-                
-                logger.info(f"📊 총 {len(news_items)}개 뉴스 항목 수집 완료")
-                
-            except Exception as e:
-                logger.warning(f"⚠️ 뉴스 요소 검색 실패: {e}")
-                # 폴백: 더미 뉴스 데이터 반환
-                news_items = [
-                    {
-                        "title": f"{search_query} 관련 최신 뉴스",
-                        "link": "https://search.naver.com/search.naver?where=news",
-                        "content": "해당 기업에 대한 최신 뉴스를 확인할 수 있습니다.",
-                        "date": "최근",
-                        "category": "종합"
-                    }
-                ]
-            
-            return news_items
-            
-        except Exception as e:
-            logger.error(f"❌ 기업 뉴스 크롤링 실패: {e}")
-            # 오류 발생 시 더미 데이터 반환
-            return [
-                {
-                    "title": f"{search_query} 관련 뉴스",
-                    "link": "https://search.naver.com/search.naver?where=news",
-                    "content": "뉴스 크롤링 중 일시적인 오류가 발생했습니다.",
-                    "date": "최근",
-                    "category": "종합"
-                }
-            ]
-
-
-selenium_manager = SeleniumManager()
\ No newline at end of file
+            WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, selector))
+            )
+            return True
+        except Exception:
+            logger.warning("⚠️ 준비 대기 시간 초과 (%s, %.0fs)", selector, timeout)
+            return False
+
+    def stats(self) -> Dict[str, Dict]:
+        """프로필(사이트)별 최근 200건 지연 시간 (ms, p50/p95): 로드 / 준비 대기 / 추출 / 합계"""
+        def percentiles(values: List[float]) -> Dict:
+            ordered = sorted(values)
+            pick = lambda q: round(ordered[min(int(q * len(ordered)), len(ordered) - 1)] * 1000, 1)
+            return {"p50": pick(0.5), "p95": pick(0.95)}
+
+        out = {}
+        for name, samples in self._latency.items():
+            if not samples:
+                continue
+            load, ready, extract = zip(*samples)
+            out[name] = {
+                "count": len(samples),
+                "profiles": USE_PROFILES,
+                "load": percentiles(load),
+                "ready_wait": percentiles(ready),
+                "extract": percentiles(extract),
+                "total": percentiles([sum(x) for x in samples]),
+            }
+        return out
+
+
+selenium_manager = SeleniumManager()
@@ -0,0 +1,307 @@
+"""
+데이터셋 바이너리 스냅샷 (멀티 워커 공유용).
+
+스냅샷은 디렉토리 하나로 구성된다.
+- meta.json: 형식 버전, 원본 파일 정보(mtime/size), 배열/문자열/블롭 목록, 부가 메타
+- <name>.npy: 숫자 배열 (np.load(mmap_mode="r")로 읽기 전용 매핑)
+- <name>.codes.npy + <name>.strtab.bin + <name>.offsets.npy: 사전 인코딩된 문자열 컬럼
+  (코드 배열 + UTF-8 문자열 테이블. 요청된 값만 디코딩)
+- <name>.bin: 임의 바이트 블롭 (미리 인코딩한 응답 본문 등)
+
+여러 uvicorn 워커가 같은 스냅샷을 매핑하면 OS 페이지 캐시를 공유하므로
+파싱 비용과 워커별 메모리 사본이 사라진다.
+
+SNAPSHOT_DIR/<name> 은 빌드 디렉토리(.<name>@<빌드 id>)를 가리키는 심볼릭 링크이고,
+새 빌드는 링크만 원자적으로 바꾼다. 빌드 디렉토리는 만들어진 뒤 바뀌지 않으며
+직전 빌드는 남겨 두므로(KEEP_PREVIOUS), 아직 이전 빌드를 서빙 중인 워커도 파일을 잃지 않는다.
+콜드 스타트에 여러 워커가 동시에 load_or_build 하면 잠금 파일로 한 워커만 빌드하고
+나머지는 기다렸다가 그 결과를 매핑한다.
+"""
+import json
+import logging
+import os
+import shutil
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+logger = logging.getLogger("snapshot")
+
+try:
+    import fcntl  # 빌드 잠금 (Windows는 생략)
+except ImportError:  # pragma: no cover
+    fcntl = None
+
+FORMAT_VERSION = 1
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SNAPSHOT_DIR = os.getenv("SNAPSHOT_DIR", os.path.join(BASE_DIR, ".cache", "snapshots"))
+KEEP_PREVIOUS = 1  # 현재 빌드 외에 남겨 둘 이전 빌드 수
+
+
+def source_signature(path: str) -> Dict:
+    st = os.stat(path)
+    return {"path": os.path.basename(path), "mtime": st.st_mtime, "size": st.st_size}
+
+
+class StringColumn:
+    """사전 인코딩 문자열 컬럼 (코드 -1 = 결측). 값은 접근할 때만 디코딩"""
+
+    def __init__(self, codes: np.ndarray, blob: np.ndarray, offsets: np.ndarray):
+        self.codes = codes
+        self._blob = blob
+        self._offsets = offsets
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    @property
+    def table_size(self) -> int:
+        return len(self._offsets) - 1
+
+    def decode(self, code: int) -> Optional[str]:
+        if code < 0:
+            return None
+        start, end = int(self._offsets[code]), int(self._offsets[code + 1])
+        return self._blob[start:end].tobytes().decode("utf-8")
+
+    def table(self) -> List[str]:
+        """문자열 테이블 전체 (고유값 목록)"""
+        return [self.decode(i) for i in range(self.table_size)]
+
+    def __getitem__(self, i: int) -> Optional[str]:
+        return self.decode(int(self.codes[i]))
+
+
+def _encode_strings(values: Sequence) -> Dict[str, np.ndarray]:
+    codes, uniques = pd.factorize(pd.Series(values, dtype=object), use_na_sentinel=True)
+    encoded = [str(u).encode("utf-8") for u in uniques]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    if encoded:
+        offsets[1:] = np.cumsum([len(b) for b in encoded])
+    blob = np.frombuffer(b"".join(encoded), dtype=np.uint8) if encoded else np.zeros(0, np.uint8)
+    return {"codes": codes.astype(np.int32), "blob": blob, "offsets": offsets}
+
+
+def write_snapshot(name: str, source_path: Optional[str] = None,
+                   arrays: Optional[Dict[str, np.ndarray]] = None,
+                   strings: Optional[Dict[str, Sequence]] = None,
+                   blobs: Optional[Dict[str, bytes]] = None,
+                   meta: Optional[Dict] = None,
+                   snapshot_dir: str = SNAPSHOT_DIR) -> str:
+    """
+    스냅샷 빌드 디렉토리 생성 후 <snapshot_dir>/<name> 링크를 원자적으로 교체. 빌드 디렉토리 경로 반환.
+    같은 snapshot_dir 에 여러 프로세스가 쓸 수 있으면 load_or_build(빌드 잠금)를 거칠 것
+    """
+    target = os.path.join(snapshot_dir, name)
+    build_id = f"{time.strftime('%Y%m%dT%H%M%S')}.{os.getpid()}.{uuid.uuid4().hex[:8]}"
+    build = os.path.join(snapshot_dir, f".{name}@{build_id}")
+    tmp = f"{build}.tmp"
+    os.makedirs(tmp)
+    try:
+        for key, arr in (arrays or {}).items():
+            np.save(os.path.join(tmp, f"{key}.npy"), np.ascontiguousarray(arr))
+        for key, values in (strings or {}).items():
+            enc = _encode_strings(values)
+            np.save(os.path.join(tmp, f"{key}.codes.npy"), enc["codes"])
+            np.save(os.path.join(tmp, f"{key}.offsets.npy"), enc["offsets"])
+            enc["blob"].tofile(os.path.join(tmp, f"{key}.strtab.bin"))
+        for key, data in (blobs or {}).items():
+            with open(os.path.join(tmp, f"{key}.bin"), "wb") as f:
+                f.write(data)
+
+        with open(os.path.join(tmp, "meta.json"), "w", encoding="utf-8") as f:
+            json.dump({
+                "format_version": FORMAT_VERSION,
+                "name": name,
+                "created_at": time.time(),
+                "source": source_signature(source_path) if source_path else None,
+                "arrays": list(arrays or {}),
+                "strings": list(strings or {}),
+                "blobs": list(blobs or {}),
+                "meta": meta or {},
+            }, f, ensure_ascii=False)
+
+        os.rename(tmp, build)
+    except Exception:
+        shutil.rmtree(tmp, ignore_errors=True)
+        raise
+    _link(build, target)
+    _prune(snapshot_dir, name, keep=os.path.basename(build))
+    logger.info("✅ 스냅샷 저장: %s → %s", target, os.path.basename(build))
+    return build
+
+
+def _link(build: str, target: str):
+    """target 을 build 를 가리키는 링크로 원자적 교체"""
+    link = f"{build}.link"
+    try:
+        os.symlink(os.path.basename(build), link)
+    except (OSError, NotImplementedError):
+        # 심볼릭 링크를 만들 수 없는 환경(Windows 권한 등): 디렉토리를 직접 교체 (원자적이지 않음)
+        if os.path.lexists(target):
+            stale = f"{target}.stale.{uuid.uuid4().hex[:8]}"
+            os.replace(target, stale)
+            shutil.rmtree(stale, ignore_errors=True)
+        shutil.copytree(build, target)
+        return
+    if os.path.isdir(target) and not os.path.islink(target):
+        # 예전 형식(링크가 아닌 디렉토리)은 빌드 디렉토리로 옮겨 정리 대상에 넣음
+        legacy = f".{os.path.basename(target)}@legacy.{uuid.uuid4().hex[:8]}"
+        os.rename(target, os.path.join(os.path.dirname(build), legacy))
+    os.replace(link, target)
+
+
+def _prune(snapshot_dir: str, name: str, keep: str):
+    """현재 빌드(keep)와 최근 KEEP_PREVIOUS개 외의 빌드 디렉토리 삭제"""
+    prefix = f".{name}@"
+    builds = [
+        entry for entry in os.scandir(snapshot_dir)
+        if entry.name.startswith(prefix) and entry.name != keep and entry.is_dir(follow_symlinks=False)
+        and not entry.name.endswith(".tmp")
+    ]
+    builds.sort(key=lambda entry: entry.stat(follow_symlinks=False).st_mtime, reverse=True)
+    for entry in builds[KEEP_PREVIOUS:]:
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+
+@contextmanager
+def _build_lock(snapshot_dir: str, name: str) -> Iterator[None]:
+    """스냅샷별 배타 잠금 (잠금 파일을 만들 수 없으면 잠그지 않고 진행)"""
+    lock_file = None
+    if fcntl is not None:
+        try:
+            os.makedirs(snapshot_dir, exist_ok=True)
+            lock_file = open(os.path.join(snapshot_dir, f".{name}.lock"), "a")
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+        except OSError as e:
+            logger.warning("스냅샷 빌드 잠금 실패(%s): %s", name, e)
+            if lock_file is not None:
+                lock_file.close()
+                lock_file = None
+    try:
+        yield
+    finally:
+        if lock_file is not None:
+            lock_file.close()  # 닫으면 잠금 해제
+
+
+class Snapshot:
+    """
+    스냅샷 디렉토리를 읽기 전용 메모리 매핑으로 연다.
+    링크는 열 때 한 번만 따라가고 모든 배열을 그 자리에서 매핑하므로, 이후 링크가 바뀌거나
+    빌드 디렉토리가 지워져도 이 객체의 배열은 유효하다 (블롭은 경로로 읽으므로 KEEP_PREVIOUS 로 보존)
+    """
+
+    def __init__(self, path: str, mmap: bool = True):
+        self.path = os.path.realpath(path)
+        self._mmap_mode = "r" if mmap else None
+        with open(os.path.join(self.path, "meta.json"), "r", encoding="utf-8") as f:
+            self.info = json.load(f)
+        self.meta: Dict = self.info.get("meta", {})
+        self._arrays: Dict[str, np.ndarray] = {key: self._load_array(key) for key in self.info.get("arrays", [])}
+        self._strings: Dict[str, StringColumn] = {key: self._load_strings(key) for key in self.info.get("strings", [])}
+
+    def _load_array(self, key: str) -> np.ndarray:
+        return np.load(os.path.join(self.path, f"{key}.npy"), mmap_mode=self._mmap_mode)
+
+    def _load_strings(self, key: str) -> StringColumn:
+        base = os.path.join(self.path, key)
+        blob_path = f"{base}.strtab.bin"
+        if os.path.getsize(blob_path) and self._mmap_mode:
+            blob = np.memmap(blob_path, dtype=np.uint8, mode="r")
+        else:
+            blob = np.fromfile(blob_path, dtype=np.uint8)
+        return StringColumn(
+            np.load(f"{base}.codes.npy", mmap_mode=self._mmap_mode),
+            blob,
+            np.load(f"{base}.offsets.npy", mmap_mode=self._mmap_mode),
+        )
+
+    def array(self, key: str) -> np.ndarray:
+        return self._arrays[key]
+
+    def strings(self, key: str) -> StringColumn:
+        return self._strings[key]
+
+    def column(self, key: str):
+        return self.strings(key) if key in self.info["strings"] else self.array(key)
+
+    def blob_path(self, key: str) -> str:
+        return os.path.join(self.path, f"{key}.bin")
+
+    def rows(self, columns: Iterable[str], start: int, stop: int) -> List[Dict]:
+        """[start, stop) 행을 {컬럼: 값} 목록으로 (NaN/결측은 None)"""
+        cols = [(c, self.column(c)) for c in columns]
+        out = []
+        for i in range(start, stop):
+            record = {}
+            for name, col in cols:
+                if isinstance(col, StringColumn):
+                    record[name] = col[i]
+                else:
+                    v = col[i].item()
+                    record[name] = None if isinstance(v, float) and v != v else v
+            out.append(record)
+        return out
+
+    def to_frame(self, columns: Iterable[str], categorical: bool = True) -> pd.DataFrame:
+        """
+        벡터 연산용 DataFrame. 숫자 컬럼은 복사 없이 매핑된 배열을 쓰고,
+        문자열 컬럼은 Categorical(categorical=False면 object 문자열)로 만든다.
+        """
+        data = {}
+        for name in columns:
+            col = self.column(name)
+            if isinstance(col, StringColumn):
+                values = pd.Categorical.from_codes(np.asarray(col.codes), categories=col.table())
+                data[name] = values if categorical else np.asarray(values, dtype=object)
+            else:
+                data[name] = col
+        return pd.DataFrame(data, copy=False)
+
+
+def open_snapshot(name: str, source_path: Optional[str] = None,
+                  snapshot_dir: str = SNAPSHOT_DIR) -> Optional[Snapshot]:
+    """원본과 일치하는(같은 mtime/size) 스냅샷이 있으면 연다. 없거나 오래됐으면 None"""
+    path = os.path.join(snapshot_dir, name)
+    try:
+        snap = Snapshot(path)
+    except (OSError, ValueError):
+        return None
+    if snap.info.get("format_version") != FORMAT_VERSION:
+        return None
+    if source_path is not None:
+        try:
+            if snap.info.get("source") != source_signature(source_path):
+                return None
+        except OSError:
+            pass  # 원본이 없으면(사전 빌드 배포) 스냅샷만으로 동작
+    return snap
+
+
+def load_or_build(name: str, source_path: str, builder, snapshot_dir: str = SNAPSHOT_DIR) -> Snapshot:
+    """
+    최신 스냅샷이 있으면 매핑하고, 없으면 builder(source_path) → dict(arrays/strings/blobs/meta)로
+    스냅샷을 만든 뒤 매핑한다. 빌드는 잠금 안에서 한 워커만 하고, 기다린 워커는 그 결과를 연다.
+    스냅샷을 쓸 수 없는 환경이면 메모리에서 바로 연다.
+    """
+    snap = open_snapshot(name, source_path, snapshot_dir)
+    if snap is not None:
+        return snap
+    with _build_lock(snapshot_dir, name):
+        snap = open_snapshot(name, source_path, snapshot_dir)  # 기다리는 동안 다른 워커가 빌드했으면 사용
+        if snap is not None:
+            return snap
+        parts = builder(source_path)
+        try:
+            os.makedirs(snapshot_dir, exist_ok=True)
+            return Snapshot(write_snapshot(name, source_path, snapshot_dir=snapshot_dir, **parts))
+        except OSError as e:
+            logger.warning("스냅샷 저장 실패(%s) → 임시 디렉토리 사용: %s", name, e)
+            import tempfile
+            path = write_snapshot(name, source_path, snapshot_dir=tempfile.mkdtemp(), **parts)
+            return Snapshot(path, mmap=False)
@@ -0,0 +1,128 @@
+import gzip
+import hashlib
+import json
+import logging
+import os
+from typing import Dict, Optional
+
+from fastapi import Request
+from fastapi.responses import FileResponse, Response
+
+from utils.artifacts import artifact_store
+from utils.dataset_registry import dataset_registry, load_json
+from utils.snapshot import Snapshot, load_or_build
+
+try:
+    import brotli  # 선택 의존성: 없으면 gzip만 제공
+except ImportError:  # pragma: no cover
+    brotli = None
+
+logger = logging.getLogger("static_response")
+
+DEFAULT_MAX_AGE = 3600
+
+
+def encode_payload(data) -> Dict:
+    """JSON 응답 본문을 한 번 직렬화·압축 (identity/gzip/br) → 스냅샷 구성요소"""
+    body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    blobs = {
+        "identity": body,
+        "gzip": gzip.compress(body, compresslevel=9, mtime=0),
+    }
+    if brotli is not None:
+        blobs["br"] = brotli.compress(body, quality=11)
+    return {"blobs": blobs, "meta": {"etag": '"' + hashlib.sha256(body).hexdigest()[:32] + '"'}}
+
+
+class PrecompressedPayload:
+    """
+    스냅샷 디렉토리에 파일로 저장해 둔 JSON 응답 본문 (identity/gzip/br) + ETag.
+    본문은 워커 메모리에 올리지 않고 파일에서 바로 전송하므로 워커 간 페이지 캐시를 공유한다.
+    """
+
+    def __init__(self, snapshot: Snapshot):
+        self.etag = snapshot.meta["etag"]
+        self.paths: Dict[str, str] = {enc: snapshot.blob_path(enc) for enc in snapshot.info["blobs"]}
+        self.body_path = self.paths["identity"]
+        self.variants = {enc: path for enc, path in self.paths.items() if enc != "identity"}
+
+    def sizes(self) -> Dict[str, int]:
+        return {enc: os.path.getsize(path) for enc, path in self.paths.items()}
+
+
+def _accepted_encodings(accept_encoding: str) -> Dict[str, float]:
+    """Accept-Encoding 헤더를 {인코딩: q} 로 파싱"""
+    accepted = {}
+    for part in (accept_encoding or "").split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[token] = q
+    return accepted
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
+
+
+def precompressed_response(request: Request, payload: PrecompressedPayload,
+                           max_age: int = DEFAULT_MAX_AGE) -> Response:
+    """
+    미리 만들어 둔 본문으로 응답.
+    - If-None-Match 일치 시 304 (본문 없음)
+    - Accept-Encoding에 따라 br > gzip > identity 선택
+    """
+    headers = {
+        "ETag": payload.etag,
+        "Cache-Control": f"public, max-age={max_age}",
+        "Vary": "Accept-Encoding",
+    }
+    if _etag_matches(request.headers.get("if-none-match"), payload.etag):
+        return Response(status_code=304, headers=headers)
+
+    accepted = _accepted_encodings(request.headers.get("accept-encoding", ""))
+    for encoding in ("br", "gzip"):
+        q = accepted.get(encoding, accepted.get("*", 0.0))
+        if q > 0 and encoding in payload.variants:
+            headers["Content-Encoding"] = encoding
+            return FileResponse(payload.variants[encoding], media_type="application/json",
+                                headers=headers)
+    return FileResponse(payload.body_path, media_type="application/json", headers=headers)
+
+
+def _build_payload_snapshot(path: str) -> Dict:
+    return encode_payload(load_json(path))
+
+
+def dataset_payload(name: str) -> PrecompressedPayload:
+    """
+    데이터셋 원본 JSON을 미리 인코딩한 응답 본문 (스냅샷 파일).
+    빌드된 아티팩트가 있으면 그대로 쓰고, 없으면 원본에서 만든다.
+    데이터셋이 다시 적재되면 다시 연다.
+    """
+    def build(_data) -> PrecompressedPayload:
+        key = f"{name}.payload"
+        snapshot = artifact_store.open(key)
+        if snapshot is None:
+            snapshot = load_or_build(key, dataset_registry.path(name), _build_payload_snapshot)
+        return PrecompressedPayload(snapshot)
+
+    return dataset_registry.derive(name, "payload", build)
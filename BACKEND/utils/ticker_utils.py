@@ -0,0 +1,41 @@
+import re
+import unicodedata
+from typing import Optional
+
+_DIGITS = re.compile(r"\d+")
+_SPACES = re.compile(r"\s+")
+
+
+def normalize_ticker(value) -> Optional[str]:
+    """
+    종목코드를 6자리 문자열로 정규화.
+    95570 / "95570" / "095570" / "A095570" / 95570.0 → "095570"
+    숫자를 찾을 수 없으면 None 반환.
+    """
+    if value is None:
+        return None
+    s = str(value).strip().upper()
+    if s.startswith("A"):
+        s = s[1:]
+    if s.endswith(".0"):
+        s = s[:-2]
+    if not s or not _DIGITS.fullmatch(s) or len(s) > 6:
+        return None
+    return s.zfill(6)
+
+
+def to_gicode(value) -> Optional[str]:
+    """FnGuide 등에서 쓰는 A접두 종목코드 (A095570)"""
+    code = normalize_ticker(value)
+    return f"A{code}" if code else None
+
+
+def normalize_company_name(value) -> Optional[str]:
+    """
+    기업명 정규화: 유니코드 NFC, NBSP 등 공백 문자를 한 칸 공백으로, 앞뒤 공백 제거.
+    빈 값이면 None 반환.
+    """
+    if value is None:
+        return None
+    s = _SPACES.sub(" ", unicodedata.normalize("NFC", str(value)).replace("\xa0", " ")).strip()
+    return s or None
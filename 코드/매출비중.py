@@ -1,58 +1,25 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
-import pandas as pd
-import time
+"""
+FnGuide 기업개요(SVD_Corp) 매출비중 표 크롤러 → 코스피_매출비중추이_전체.csv (이 폴더).
 
-# ① 종목코드 데이터 불러오기
-df_codes = pd.read_excel("DART_재무_코스피전체_2024기준 (1).xlsx")
-codes = df_codes[['종목코드', '종목명']].dropna()
+BACKEND 크롤링 프레임워크의 sales_composition 작업을 실행하는 래퍼 (python -m crawl.run run sales_composition).
 
-# ② Selenium 설정
-options = Options()
-options.add_argument('--headless')  # → 크롬 창 안 뜨도록
-options.add_argument('--window-size=1920,1080')
-options.add_argument('--disable-gpu')
-options.add_argument('--no-sandbox')
-options.add_argument('--disable-dev-shm-usage')
+    python 매출비중.py                          # 이어서 수집 (중단된 회차는 남은 기업만)
+    python 매출비중.py --workers 8 --limit 20   # 옵션은 crawl.run run 과 동일
+    python 매출비중.py --fresh                  # 큐/결과 삭제 후 처음부터
+    python 매출비중.py --format parquet csv     # Parquet도 출력 (pyarrow 필요)
 
-service = Service(ChromeDriverManager().install())
-driver = webdriver.Chrome(service=service, options=options)
+기업 목록은 이 폴더의 DART 엑셀이 있으면 그것을, 없으면 BACKEND 종목 유니버스를 사용한다.
+"""
+import os
+import sys
 
-# ③ 결과 저장용 리스트
-results = []
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(os.path.dirname(BASE_DIR), "BACKEND")
+INPUT_XLSX = os.path.join(BASE_DIR, "DART_재무_코스피전체_2024기준 (1).xlsx")
+sys.path.insert(0, BACKEND_DIR)
 
-for i, row in codes.iterrows():
-    code = str(row['종목코드']).zfill(6)
-    name = row['종목명']
-    url = f"https://comp.fnguide.com/SVO2/ASP/SVD_Corp.asp?pGB=1&gicode=A{code}"
+from crawl.run import main  # noqa: E402
 
-    try:
-        driver.get(url)
-        time.sleep(2)
-
-        # 매출비중 테이블 (class 기반 탐색)
-        table = driver.find_element(By.CSS_SELECTOR, 'table.us_table_ty1.table-hb2.h_fix.zigbg_no')
-        html = table.get_attribute('outerHTML')
-        df = pd.read_html(html)[0]
-
-        df.insert(0, '종목코드', f"A{code}")
-        df.insert(1, '종목명', name)
-        results.append(df)
-        print(f"✅ [{i+1}] {name} 크롤링 완료")
-
-    except Exception as e:
-        print(f"❌ [{i+1}] {name} 실패: {e}")
-        continue
-
-driver.quit()
-
-# ④ 병합 후 저장
-if results:
-    final_df = pd.concat(results, ignore_index=True)
-    final_df.to_csv("코스피_매출비중추이_전체.csv", index=False, encoding='utf-8-sig')
-    print("📁 저장 완료: 코스피_매출비중추이_전체.csv")
-else:
-    print("❗ 크롤링된 데이터 없음")
+if __name__ == "__main__":
+    seeds = ["--seeds", INPUT_XLSX] if os.path.exists(INPUT_XLSX) else []
+    sys.exit(main(["run", "sales_composition", "--out", BASE_DIR, "--format", "csv", *seeds, *sys.argv[1:]]))
@@ -1,55 +1,25 @@
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from webdriver_manager.chrome import ChromeDriverManager
-import pandas as pd
-import time
+"""
+NICE BizLine 내수/수출 표 크롤러 → NICE_내수수출_코스피전체.csv (이 폴더).
 
-# 종목코드 리스트 로딩
-df_codes = pd.read_excel(r"C:\Users\bitcamp\OneDrive\Desktop\pythontraning\DART_재무_코스피전체_2024기준 (1).xlsx")
-df_codes = df_codes[['종목코드', '종목명']].dropna()
+BACKEND 크롤링 프레임워크의 domestic_export 작업을 실행하는 래퍼 (python -m crawl.run run domestic_export).
 
-# 셀레니움 설정
-options = Options()
-options.add_argument('--headless')  # 주석 처리하면 창 보임
-options.add_argument('--window-size=1920,1080')
-service = Service(ChromeDriverManager().install())
-driver = webdriver.Chrome(service=service, options=options)
+    python 수출.py                          # 이어서 수집 (중단된 회차는 남은 기업만)
+    python 수출.py --workers 8 --limit 20   # 옵션은 crawl.run run 과 동일
+    python 수출.py --fresh                  # 큐/결과 삭제 후 처음부터
+    python 수출.py --format parquet csv     # Parquet도 출력 (pyarrow 필요)
 
-results = []
+기업 목록은 이 폴더의 DART 엑셀이 있으면 그것을, 없으면 BACKEND 종목 유니버스를 사용한다.
+"""
+import os
+import sys
 
-for i, row in df_codes.iterrows():
-    raw_code = str(int(row['종목코드'])).zfill(6)
-    name = row['종목명']
-    url = f"https://comp.nicebizline.com/co/CO0100M010GE.nice?stockcd={raw_code}&nav=2"
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(os.path.dirname(BASE_DIR), "BACKEND")
+INPUT_XLSX = os.path.join(BASE_DIR, "DART_재무_코스피전체_2024기준 (1).xlsx")
+sys.path.insert(0, BACKEND_DIR)
 
-    try:
-        driver.get(url)
-        time.sleep(3)
+from crawl.run import main  # noqa: E402
 
-        # 페이지 내 모든 테이블에서 "내수/수출" 관련 테이블 찾기
-        tables = pd.read_html(driver.page_source)
-        for df in tables:
-            if any(df.astype(str).apply(lambda x: x.str.contains('내수|수출')).any()):
-                df.insert(0, '종목코드', raw_code)
-                df.insert(1, '종목명', name)
-                results.append(df)
-                print(f"✅ [{i+1}] {name} 크롤링 성공")
-                break
-        else:
-            print(f"⚠️ [{i+1}] {name} 관련 테이블 없음")
-
-    except Exception as e:
-        print(f"❌ [{i+1}] {name} 오류: {e}")
-        continue
-
-driver.quit()
-
-# 결과 저장
-if results:
-    final_df = pd.concat(results, ignore_index=True)
-    final_df.to_csv("NICE_내수수출_코스피전체.csv", index=False, encoding='utf-8-sig')
-    print("📁 저장 완료: NICE_내수수출_코스피전체.csv")
-else:
-    print("❗ 수집된 데이터가 없습니다.")
+if __name__ == "__main__":
+    seeds = ["--seeds", INPUT_XLSX] if os.path.exists(INPUT_XLSX) else []
+    sys.exit(main(["run", "domestic_export", "--out", BASE_DIR, "--format", "csv", *seeds, *sys.argv[1:]]))